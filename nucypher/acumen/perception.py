@@ -17,12 +17,15 @@
 
 import binascii
 import random
+import time
+from contextlib import contextmanager
+from threading import Lock, local
 
 import maya
 
 from bytestring_splitter import BytestringSplitter
-from constant_sorrow.constants import NO_KNOWN_NODES
-from collections import namedtuple
+from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
+from collections import Counter, deque, namedtuple
 from collections import OrderedDict
 from twisted.logger import Logger
 
@@ -73,6 +76,8 @@ class FleetSensor:
         self.states = OrderedDict()
 
     def __setitem__(self, key, value):
+        if key not in self._nodes:
+            self.most_recent_node_change = maya.now()
         self._nodes[key] = value
 
         if self._tracking:
@@ -176,10 +181,14 @@ class FleetSensor:
         random.shuffle(nodes_we_know_about)
         return nodes_we_know_about
 
-    def abridged_states_dict(self):
+    def abridged_states_dict(self, limit: int = None):
+        """All fleet states, oldest first; or, given a `limit`, only that many of the most recent."""
+        checksums = list(self.states)
+        if limit is not None:
+            checksums = checksums[-limit:] if limit else []
         abridged_states = {}
-        for k, v in self.states.items():
-            abridged_states[k] = self.abridged_state_details(v)
+        for k in checksums:
+            abridged_states[k] = self.abridged_state_details(self.states[k])
         return abridged_states
 
     @staticmethod
@@ -190,3 +199,70 @@ class FleetSensor:
                 "color_name": state.metadata[0][0]['color'],
                 "updated": state.updated.rfc2822(),
                 }
+
+
+class LearningStatistics:
+    """
+    Counts and timings for a Learner's learning loop, kept free of any metrics library.
+
+    Totals are cumulative.  Per-round observations are buffered until a metrics
+    collector drains them; if nothing does, only the most recent are kept.  The time spent in each
+    phase is added up over a round, and observed once per round, when the round is recorded:
+
+    * request: waiting for the teacher's answer
+    * parse: splitting the answer into its signature, fleet state and nodes
+    * check_signature: checking the teacher's signature of the answer
+    * remember_nodes: verifying and remembering each node, and recording the new fleet state
+    """
+
+    PHASES = ('request', 'parse', 'check_signature', 'remember_nodes')
+    MAXIMUM_PENDING_OBSERVATIONS = 1000
+
+    def __init__(self):
+        self.rounds = 0
+        self.fleet_states_match = 0
+        self.no_known_nodes = 0
+        self.teacher_failures = Counter()  # By reason
+
+        self._round_durations = deque(maxlen=self.MAXIMUM_PENDING_OBSERVATIONS)
+        self._phase_durations = deque(maxlen=self.MAXIMUM_PENDING_OBSERVATIONS)
+        self._nodes_learned = deque(maxlen=self.MAXIMUM_PENDING_OBSERVATIONS)
+        self._lock = Lock()
+        self._this_round = local()  # Rounds may be learned on more than one thread at once
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = getattr(self._this_round, 'phases', None)
+            if phases is None:
+                phases = self._this_round.phases = Counter()
+            phases[name] += time.perf_counter() - started
+
+    def record_round(self, duration: float, nodes_learned: int, result=None) -> None:
+        phases = getattr(self._this_round, 'phases', None) or Counter()
+        self._this_round.phases = None
+        with self._lock:
+            self._phase_durations.extend(phases.items())
+            self.rounds += 1
+            if result is FLEET_STATES_MATCH:
+                self.fleet_states_match += 1
+            elif result is NO_KNOWN_NODES:
+                self.no_known_nodes += 1
+            self._round_durations.append(duration)
+            self._nodes_learned.append(nodes_learned)
+
+    def record_teacher_failure(self, reason: str) -> None:
+        with self._lock:
+            self.teacher_failures[reason] += 1
+
+    def drain(self):
+        """Returns, and forgets, the round durations, (phase, duration) pairs and nodes learned per round."""
+        with self._lock:
+            drained = list(self._round_durations), list(self._phase_durations), list(self._nodes_learned)
+            self._round_durations.clear()
+            self._phase_durations.clear()
+            self._nodes_learned.clear()
+        return drained
@@ -91,6 +91,7 @@ from nucypher.cli.painting.deployment import paint_contract_deployment, paint_in
 from nucypher.cli.painting.transactions import paint_receipt_summary
 from nucypher.config.constants import DEFAULT_CONFIG_ROOT
 from nucypher.crypto.powers import TransactingPower
+from nucypher.policy.reservoirs import StakerDistributionCache
 from nucypher.types import NuNits, Period
 from nucypher.utilities.logging import Logger
 from typing import Callable
@@ -1635,6 +1636,9 @@ class BlockchainPolicyAuthor(NucypherTokenActor):
         self.rate = rate
         self.duration_periods = duration_periods
 
+        # Shared by all of the policies this author creates
+        self.staker_distributions = StakerDistributionCache(staking_agent=self.staking_agent)
+
     @property
     def default_rate(self):
         _minimum, default, _maximum = self.policy_agent.get_fee_rate_range()
@@ -1683,11 +1687,11 @@ class BlockchainPolicyAuthor(NucypherTokenActor):
         payload = {**blockchain_payload, **policy_end_time}
         return payload
 
-    def get_stakers_reservoir(self, **options) -> StakersReservoir:
+    def get_stakers_reservoir(self, duration: int, without: Iterable[ChecksumAddress] = ()) -> StakersReservoir:
         """
         Get a sampler object containing the currently registered stakers.
         """
-        return self.staking_agent.get_stakers_reservoir(**options)
+        return self.staker_distributions.reservoir(duration=duration, without=without)
 
     def create_policy(self, *args, **kwargs):
         """
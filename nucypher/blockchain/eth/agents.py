@@ -15,7 +15,6 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from bisect import bisect_right
 from itertools import accumulate
 import random
 import math
@@ -32,6 +31,7 @@ from eth_utils.address import to_checksum_address
 from hexbytes.main import HexBytes
 from typing import Dict, Iterable, List, Tuple, Type, Union, Any, Optional, cast
 from web3.contract import Contract, ContractFunction
+from web3.exceptions import TransactionNotFound
 from web3.types import Wei, Timestamp, TxReceipt, TxParams, Nonce
 
 from nucypher.blockchain.eth.aragon import Artifact
@@ -821,8 +821,12 @@ class PolicyManagerAgent(EthereumContractAgent):
                       value: Wei,
                       end_timestamp: Timestamp,
                       node_addresses: List[ChecksumAddress],
-                      owner_address: Optional[ChecksumAddress] = None) -> TxReceipt:
-
+                      owner_address: Optional[ChecksumAddress] = None,
+                      fire_and_forget: bool = False) -> TxReceipt:
+        """
+        With `fire_and_forget`, returns the transaction hash as soon as the transaction is broadcast,
+        rather than its receipt, so that several policies can be published without waiting on each one.
+        """
         owner_address = owner_address or author_address
         payload = {'value': value}
         contract_function: ContractFunction = self.contract.functions.createPolicy(policy_id,
@@ -831,7 +835,8 @@ class PolicyManagerAgent(EthereumContractAgent):
                                                                  node_addresses)
         receipt = self.blockchain.send_transaction(contract_function=contract_function,
                                                    payload=payload,
-                                                   sender_address=author_address)  # TODO: Gas management - #842
+                                                   sender_address=author_address,
+                                                   fire_and_forget=fire_and_forget)  # TODO: Gas management - #842
         return receipt
 
     @contract_api(CONTRACT_CALL)
@@ -844,6 +849,25 @@ class PolicyManagerAgent(EthereumContractAgent):
         # TODO: Won't it be great when this is impossible?  #1274
         _receipt = self.blockchain.client.wait_for_receipt(txhash, timeout=timeout)
         transaction = self.blockchain.client.w3.eth.getTransaction(txhash)
+        return self.__decode_arrangement_addresses(transaction)
+
+    def fetch_arrangement_addresses_from_mined_policy_txid(self, txhash: Union[str, bytes]) -> Optional[Iterable]:
+        """
+        Like fetch_arrangement_addresses_from_policy_txid, but without waiting: returns None if the transaction
+        is still pending, and no addresses if it failed.  Raises TransactionNotFound for an unknown transaction.
+        """
+        transaction = self.blockchain.client.w3.eth.getTransaction(txhash)
+        try:
+            receipt = self.blockchain.client.w3.eth.getTransactionReceipt(txhash)
+        except TransactionNotFound:
+            return None
+        if receipt is None:
+            return None
+        if not receipt['status']:
+            return []
+        return self.__decode_arrangement_addresses(transaction)
+
+    def __decode_arrangement_addresses(self, transaction) -> Iterable:
         try:
             _signature, parameters = self.contract.decode_function_input(
                 self.blockchain.client.parse_transaction_data(transaction))
@@ -1724,14 +1748,27 @@ class ContractAgency:
 class WeightedSampler:
     """
     Samples random elements with probabilities proportional to given weights.
+
+    The weights are kept in a Fenwick (binary indexed) tree, so that finding the element at a position
+    in the cumulative weights, and setting an element's weight to 0, each take O(log n).
     """
 
     def __init__(self, weighted_elements: Dict[Any, int]):
-        elements, weights = zip(*weighted_elements.items())
-        self.totals = list(accumulate(weights))
+        elements, weights = tuple(weighted_elements.keys()), tuple(weighted_elements.values())
         self.elements = elements
+        self.weights = weights
+        self.total = sum(weights)
+        self._positions = {element: position for position, element in enumerate(elements)}
+
+        # tree[i] is the sum of the weights of elements (i - (i & -i), i], counting from 1.
+        totals = [0, *accumulate(weights)]
+        self._tree = [totals[i] - totals[i - (i & -i)] for i in range(len(totals))]
+        self._top_step = 1 << (len(weights).bit_length() - 1)
 
-    def sample_no_replacement(self, rng, quantity: int) -> list:
+    def __contains__(self, element) -> bool:
+        return element in self._positions
+
+    def sample_no_replacement(self, rng, quantity: int, exclude: Iterable = ()) -> list:
         """
         Samples ``quantity`` of elements from the internal array.
         The probablity of an element to appear is proportional
@@ -1739,49 +1776,80 @@ class WeightedSampler:
 
         The elements will not repeat; every time an element is sampled its weight is set to 0.
         (does not mutate the object and only applies to the current invocation of the method).
+        The weights of the elements in ``exclude`` are set to 0 before sampling, in the same way.
         """
 
+        excluded = {self._positions[element] for element in exclude if element in self._positions}
+
         if quantity == 0:
             return []
 
-        if quantity > len(self):
+        if quantity > len(self) - len(excluded):
             raise ValueError("Cannot sample more than the total amount of elements without replacement")
 
-        totals = self.totals.copy()
+        tree = self._tree
+        size = len(self.weights)
+        removed = dict()  # tree index -> weight taken from it in this invocation only
+        total = self.total
         samples = []
 
-        for i in range(quantity):
-            position = rng.randint(0, totals[-1] - 1)
-            idx = bisect_right(totals, position)
-            samples.append(self.elements[idx])
+        def set_weight_to_zero(idx):
+            nonlocal total
+            weight = self.weights[idx]
+            total -= weight
+            i = idx + 1
+            while i <= size:
+                removed[i] = removed.get(i, 0) + weight
+                i += i & -i
+
+        for idx in excluded:
+            set_weight_to_zero(idx)
+
+        for _ in range(quantity):
+            position = rng.randint(0, total - 1)
+
+            # Find the first element whose cumulative weight is greater than `position`.
+            idx, step = 0, self._top_step
+            while step:
+                candidate = idx + step
+                if candidate <= size:
+                    weight = tree[candidate] - removed.get(candidate, 0)
+                    if weight <= position:
+                        idx = candidate
+                        position -= weight
+                step >>= 1
 
-            # Adjust the totals so that they correspond
-            # to the weight of the element `idx` being set to 0.
-            prev_total = totals[idx - 1] if idx > 0 else 0
-            weight = totals[idx] - prev_total
-            for j in range(idx, len(totals)):
-                totals[j] -= weight
+            samples.append(self.elements[idx])
+            set_weight_to_zero(idx)
 
         return samples
 
     def __len__(self):
-        return len(self.totals)
+        return len(self.weights)
 
 
 class StakersReservoir:
 
-    def __init__(self, stakers_map: Dict[ChecksumAddress, int]):
-        self._sampler = WeightedSampler(stakers_map)
+    def __init__(self,
+                 stakers_map: Dict[ChecksumAddress, int] = None,
+                 sampler: WeightedSampler = None,
+                 without: Iterable[ChecksumAddress] = ()):
+        """
+        Pass either the stakers, or a sampler of them to share with other reservoirs;
+        the stakers in `without` are never drawn.
+        """
+        self._sampler = sampler or WeightedSampler(stakers_map)
+        self._without = frozenset(address for address in without if address in self._sampler)
         self._rng = random.SystemRandom()
 
     def __len__(self):
-        return len(self._sampler)
+        return len(self._sampler) - len(self._without)
 
     def draw(self, quantity):
         if quantity > len(self):
             raise StakingEscrowAgent.NotEnoughStakers(f'Cannot sample {quantity} out of {len(self)} total stakers')
 
-        return self._sampler.sample_no_replacement(self._rng, quantity)
+        return self._sampler.sample_no_replacement(self._rng, quantity, exclude=self._without)
 
     def draw_at_most(self, quantity):
         return self.draw(min(quantity, len(self)))
@@ -16,11 +16,13 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import contextlib
 from contextlib import suppress
+from threading import Lock
 from typing import ClassVar, Dict, List, Optional, Set, Union
 
 from cryptography.exceptions import InvalidSignature
 from eth_keys import KeyAPI as EthKeyAPI
 from eth_utils import to_canonical_address, to_checksum_address
+from lru import LRU
 
 from constant_sorrow import default_constant_splitter
 from constant_sorrow.constants import (DO_NOT_SIGN, NO_BLOCKCHAIN_CONNECTION, NO_CONTROL_PROTOCOL,
@@ -45,6 +47,54 @@ from umbral.keys import UmbralPublicKey
 from umbral.signing import Signature
 
 
+class StrangerCache:
+    """
+    A bounded, least-recently-used cache of stranger Characters, keyed by their class and public key bytes,
+    so that nodes needn't build a new stand-in every time the same Alice or Bob comes calling.
+    """
+
+    DEFAULT_SIZE = 5000
+
+    def __init__(self, size: int = DEFAULT_SIZE):
+        self._strangers = LRU(size)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._strangers)
+
+    @property
+    def size(self) -> int:
+        return self._strangers.get_size()
+
+    def get_or_create(self, character_class, verifying_key=None, encrypting_key=None) -> 'Character':
+        key = (character_class,
+               bytes(verifying_key) if verifying_key else None,
+               bytes(encrypting_key) if encrypting_key else None)
+        with self._lock:
+            stranger = self._strangers.get(key)
+            if stranger is not None:
+                self.hits += 1
+                return stranger
+            self.misses += 1
+
+        stranger = character_class.from_public_keys(verifying_key=verifying_key, encrypting_key=encrypting_key)
+        with self._lock:
+            self._strangers[key] = stranger
+        return stranger
+
+    def add_counts(self, hits: int, misses: int) -> None:
+        """Adds the hits and misses of another process's cache, like a REST process's, to these."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strangers.clear()
+
+
 class Character(Learner):
     """
     A base-class for any character in our cryptography protocol narrative.
@@ -54,6 +104,7 @@ class Character(Learner):
     _default_crypto_powerups = None
     _stamp = None
     _crashed = False
+    stranger_cache = StrangerCache()
 
     from nucypher.network.protocols import SuspiciousActivity  # Ship this exception with every Character.
 
@@ -334,6 +385,17 @@ class Character(Learner):
 
         return cls(is_me=False, crypto_power=crypto_power, *args, **kwargs)
 
+    @classmethod
+    def stranger_from_public_keys(cls,
+                                  verifying_key: Union[bytes, UmbralPublicKey] = None,
+                                  encrypting_key: Union[bytes, UmbralPublicKey] = None
+                                  ) -> 'Character':
+        """
+        Like from_public_keys, but reuses a stand-in from Character.stranger_cache if this Character
+        has been seen recently.  Cached stand-ins are shared between callers, so don't modify them.
+        """
+        return cls.stranger_cache.get_or_create(cls, verifying_key=verifying_key, encrypting_key=encrypting_key)
+
     def _set_known_node_class(self, known_node_class, federated_only):
         if not known_node_class:
             # Once in a while, in tests or demos, we init a plain Character who doesn't already know about its node class.
@@ -131,6 +131,38 @@ class AliceInterface(CharacterPublicInterface):
 
         return response_data
 
+    @attach_schema(alice.BulkGrantPolicy)
+    def bulk_grant(self,
+                   grants: list,
+                   m: int,
+                   n: int,
+                   expiration: maya.MayaDT,
+                   value: int = None,
+                   rate: int = None,
+                   ) -> dict:
+
+        from nucypher.characters.lawful import Bob
+        bobs_and_labels = [(Bob.from_public_keys(encrypting_key=grant['bob_encrypting_key'],
+                                                 verifying_key=grant['bob_verifying_key']),
+                            grant['label'])
+                           for grant in grants]
+
+        new_policies = self.character.bulk_grant(grants=bobs_and_labels,
+                                                 m=m,
+                                                 n=n,
+                                                 value=value,
+                                                 rate=rate,
+                                                 expiration=expiration,
+                                                 discover_on_this_thread=True)
+
+        response_data = {'grants': [{'label': policy.label,
+                                     'treasure_map': policy.treasure_map,
+                                     'policy_encrypting_key': policy.public_key}
+                                    for policy in new_policies],
+                         'alice_verifying_key': self.character.stamp}
+
+        return response_data
+
     @attach_schema(alice.Revoke)
     def revoke(self, label: bytes, bob_verifying_key: bytes) -> dict:
 
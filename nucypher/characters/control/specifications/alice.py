@@ -25,19 +25,8 @@ from nucypher.characters.control.specifications.exceptions import (
 from nucypher.cli import options, types
 
 
-class PolicyBaseSchema(BaseSchema):
+class PolicyTermsSchema(BaseSchema):
 
-    bob_encrypting_key = fields.Key(
-        required=True, load_only=True,
-        click=click.option(
-            '--bob-encrypting-key',
-            help="Bob's encrypting key as a hexadecimal string",
-            type=click.STRING, required=True,))
-    bob_verifying_key = fields.Key(
-        required=True, load_only=True,
-        click=click.option(
-            '--bob-verifying-key', help="Bob's verifying key as a hexadecimal string",
-            type=click.STRING, required=True))
     m = fields.M(
         required=True, load_only=True,
         click=options.option_m)
@@ -62,9 +51,6 @@ class PolicyBaseSchema(BaseSchema):
         click=options.option_rate
     )
 
-    # output
-    policy_encrypting_key = fields.Key(dump_only=True)
-
     @validates_schema
     def check_valid_n_and_m(self, data, **kwargs):
         # ensure that n is greater than or equal to m
@@ -82,6 +68,24 @@ class PolicyBaseSchema(BaseSchema):
             # raise InvalidArgumentCombo("Either rate or value must be greater than zero.")
 
 
+class PolicyBaseSchema(PolicyTermsSchema):
+
+    bob_encrypting_key = fields.Key(
+        required=True, load_only=True,
+        click=click.option(
+            '--bob-encrypting-key',
+            help="Bob's encrypting key as a hexadecimal string",
+            type=click.STRING, required=True,))
+    bob_verifying_key = fields.Key(
+        required=True, load_only=True,
+        click=click.option(
+            '--bob-verifying-key', help="Bob's verifying key as a hexadecimal string",
+            type=click.STRING, required=True))
+
+    # output
+    policy_encrypting_key = fields.Key(dump_only=True)
+
+
 class CreatePolicy(PolicyBaseSchema):
 
     label = fields.Label(
@@ -100,6 +104,36 @@ class GrantPolicy(PolicyBaseSchema):
     alice_verifying_key = fields.Key(dump_only=True)
 
 
+class BulkGrantee(BaseSchema):
+
+    bob_encrypting_key = fields.Key(required=True, load_only=True)
+    bob_verifying_key = fields.Key(required=True, load_only=True)
+    label = fields.Label(required=True)
+
+    # output fields
+    treasure_map = fields.TreasureMap(dump_only=True)
+    policy_encrypting_key = fields.Key(dump_only=True)
+
+
+class BulkGrantPolicy(PolicyTermsSchema):
+
+    grants = fields.List(
+        fields.Nested(BulkGrantee), required=True,
+        click=click.option(
+            '--grants', 'grants_file',
+            help="JSON file listing the Bobs to grant to, and the label of each policy, as "
+                 "[{\"bob_encrypting_key\": ..., \"bob_verifying_key\": ..., \"label\": ...}, ...]",
+            type=click.File('r'), required=True))
+
+    # output fields
+    alice_verifying_key = fields.Key(dump_only=True)
+
+    @validates_schema
+    def check_grants(self, data, **kwargs):
+        if not data.get('grants'):
+            raise InvalidArgumentCombo("Grant at least one policy.")
+
+
 class DerivePolicyEncryptionKey(BaseSchema):
 
     label = fields.Label(
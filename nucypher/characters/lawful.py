@@ -20,12 +20,13 @@ import random
 import time
 from base64 import b64decode, b64encode
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from json.decoder import JSONDecodeError
 from queue import Queue
 from random import shuffle
-from typing import Dict, Iterable, List, Set, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple, Union
 
 import maya
 from cryptography.hazmat.backends import default_backend
@@ -66,23 +67,33 @@ from nucypher.cli.processes import UrsulaCommandProtocol
 from nucypher.config.storages import ForgetfulNodeStorage, NodeStorage
 from nucypher.crypto.api import encrypt_and_sign, keccak_digest
 from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH, PUBLIC_KEY_LENGTH
+from nucypher.crypto.kfrags import KFragPool
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import DecryptingPower, DelegatingPower, PowerUpError, SigningPower, TransactingPower
+from nucypher.crypto.reencryption import ReencryptionPool
 from nucypher.crypto.signing import InvalidSignature
 from nucypher.datastore.datastore import DatastoreTransactionError, RecordNotFound
 from nucypher.datastore.keypairs import HostingKeypair
-from nucypher.datastore.models import PolicyArrangement
+from nucypher.datastore.models import PolicyArrangement, PolicyOwner
+from nucypher.datastore.treasure_maps import TreasureMapStore
 from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.admission import AdmissionController
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nodes import NodeSprout, Teacher
+from nucypher.network.processes import RESTProcessPool
 from nucypher.network.protocols import InterfaceInfo, parse_node_uri
+from nucypher.network.reachability import ReachabilityChecker
+from nucypher.network.statistics import RESTStatistics
+from nucypher.network.status import StatusPage
 from nucypher.network.server import ProxyRESTServer, TLSHostingPower, make_rest_app
-from nucypher.network.trackers import AvailabilityTracker
+from nucypher.network.trackers import AvailabilityTracker, PolicyPaymentTracker
+from nucypher.policy.owners import PolicyOwnerCache
 from nucypher.utilities.logging import Logger
 from umbral import pre
+from umbral.cfrags import CapsuleFrag
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
-from umbral.pre import UmbralCorrectnessError
+from umbral.pre import Capsule, UmbralCorrectnessError
 from umbral.signing import Signature
 
 
@@ -91,6 +102,8 @@ class Alice(Character, BlockchainPolicyAuthor):
     _interface_class = AliceInterface
     _default_crypto_powerups = [SigningPower, DecryptingPower, DelegatingPower]
 
+    BULK_GRANT_CONCURRENCY = 8  # policies whose arrangements are made, or kfrags sent, at once
+
     def __init__(self,
 
                  # Mode
@@ -111,6 +124,9 @@ class Alice(Character, BlockchainPolicyAuthor):
                  rate: int = None,
                  duration_periods: int = None,
 
+                 # KFrag Generation
+                 kfrag_workers: int = 0,
+
                  # Middleware
                  timeout: int = 10,  # seconds  # TODO: configure  NRN
                  network_middleware: RestMiddleware = None,
@@ -155,6 +171,7 @@ class Alice(Character, BlockchainPolicyAuthor):
                                             rate=rate,
                                             duration_periods=duration_periods,
                                             checksum_address=checksum_address)
+            self.staker_distributions.start()
 
         if is_me and controller:
             self.make_cli_controller()
@@ -165,6 +182,18 @@ class Alice(Character, BlockchainPolicyAuthor):
         self.active_policies = dict()
         self.revocation_kits = dict()
 
+        # KFrag generation (inline, unless a number of worker threads is configured to generate some ahead of time)
+        self.kfrag_pool = None
+        if is_me and kfrag_workers:
+            self.kfrag_pool = KFragPool(generate=self._generate_kfrags, workers=kfrag_workers)
+
+    def disenchant(self):
+        super().disenchant()
+        if self.kfrag_pool:
+            self.kfrag_pool.shutdown(wait=False)
+        with contextlib.suppress(AttributeError):
+            self.staker_distributions.stop()
+
     def add_active_policy(self, active_policy):
         """
         Adds a Policy object that is active on the NuCypher network to Alice's
@@ -190,15 +219,37 @@ class Alice(Character, BlockchainPolicyAuthor):
         :param bob: Bob instance which will be able to decrypt messages re-encrypted with these kfrags.
         :param m: Minimum number of kfrags needed to activate a Capsule.
         :param n: Total number of kfrags to generate
+
+        Kfrags generated ahead of time, by pregenerate_kfrags, are taken if there are any.
         """
 
         bob_encrypting_key = bob.public_keys(DecryptingPower)
+        m, n = m or self.m, n or self.n
+        if self.kfrag_pool:
+            pregenerated = self.kfrag_pool.take(label=label, bob_encrypting_key=bob_encrypting_key, m=m, n=n)
+            if pregenerated:
+                return pregenerated
+        return self._generate_kfrags(label, bob_encrypting_key, m, n)
+
+    def pregenerate_kfrags(self, bob: 'Bob', label: bytes, m: int = None, n: int = None) -> Future:
+        """
+        Starts generating the kfrags of a grant to come, in the background, so that granting it needn't wait
+        for them.  Needs kfrag workers; may raise KFragPool.Busy.
+        """
+        if not self.kfrag_pool:
+            raise RuntimeError(f"{self} has no kfrag workers to generate kfrags ahead of time.")
+        return self.kfrag_pool.pregenerate(label=label,
+                                           bob_encrypting_key=bob.public_keys(DecryptingPower),
+                                           m=m or self.m,
+                                           n=n or self.n)
+
+    def _generate_kfrags(self, label: bytes, bob_encrypting_key: UmbralPublicKey, m: int, n: int) -> Tuple:
         delegating_power = self._crypto_power.power_ups(DelegatingPower)
         return delegating_power.generate_kfrags(bob_pubkey_enc=bob_encrypting_key,
                                                 signer=self.stamp,
                                                 label=label,
-                                                m=m or self.m,
-                                                n=n or self.n)
+                                                m=m,
+                                                n=n)
 
     def create_policy(self, bob: "Bob", label: bytes, **policy_params):
         """
@@ -296,16 +347,9 @@ class Alice(Character, BlockchainPolicyAuthor):
         #
 
         # If we're federated only, we need to block to make sure we have enough nodes.
-        if self.federated_only and len(self.known_nodes) < policy.n:
-            good_to_go = self.block_until_number_of_known_nodes_is(number_of_nodes_to_know=policy.n,
-                                                                   learn_on_this_thread=discover_on_this_thread,
-                                                                   timeout=timeout)
-            if not good_to_go:
-                raise ValueError(
-                    "To make a Policy in federated mode, you need to know about "
-                    "all the Ursulas you need (in this case, {}); there's no other way to "
-                    "know which nodes to use.  Either pass them here or when you make the Policy, "
-                    "or run the learning loop on a network with enough Ursulas.".format(policy.n))
+        self.__block_until_enough_nodes_are_known(n=policy.n,
+                                                  discover_on_this_thread=discover_on_this_thread,
+                                                  timeout=timeout)
 
         self.log.debug(f"Making arrangements for {policy} ... ")
         policy.make_arrangements(network_middleware=self.network_middleware,
@@ -322,6 +366,91 @@ class Alice(Character, BlockchainPolicyAuthor):
             policy.publishing_mutex.block_until_success_is_reasonably_likely()
         return policy  # Now with TreasureMap affixed!
 
+    def bulk_grant(self,
+                   grants: Sequence[Tuple["Bob", bytes]],
+                   handpicked_ursulas: set = None,
+                   discover_on_this_thread: bool = True,
+                   timeout: int = None,
+                   publish_treasure_map: bool = True,
+                   block_until_success_is_reasonably_likely: bool = True,
+                   **policy_params) -> List:
+        """
+        Grants a policy to each Bob, under each label, of `grants`, all with the same policy parameters;
+        like calling grant for each, but cheaper:
+
+        * The Ursulas are sampled once, for all of the policies; each policy only samples others to replace
+          those that reject its arrangement.
+        * Arrangements are proposed, and kfrags sent, for several policies at once.
+        * On chain, each policy is broadcast without waiting for the one before it to be mined.
+
+        Returns the policies, in the order of `grants`.
+        """
+        if not grants:
+            raise ValueError("Pass at least one Bob and label to grant to.")
+        timeout = timeout or self.timeout
+
+        if handpicked_ursulas:
+            for handpicked_ursula in handpicked_ursulas:
+                self.remember_node(node=handpicked_ursula)
+
+        if self.kfrag_pool:
+            for bob, label in grants:
+                with contextlib.suppress(KFragPool.Busy):  # Those turned away are generated as they're granted.
+                    self.pregenerate_kfrags(bob=bob, label=label, m=policy_params.get('m'), n=policy_params.get('n'))
+        policies = [self.create_policy(bob=bob, label=label, **policy_params) for bob, label in grants]
+        self.log.debug(f"Successfully created {len(policies)} policies ... ")
+
+        self.__block_until_enough_nodes_are_known(n=policies[0].n,
+                                                  discover_on_this_thread=discover_on_this_thread,
+                                                  timeout=timeout)
+        ursulas = policies[0].sample(handpicked_ursulas=handpicked_ursulas,
+                                     discover_on_this_thread=discover_on_this_thread)
+
+        def make_arrangements(policy):
+            policy.make_arrangements(network_middleware=self.network_middleware,
+                                     handpicked_ursulas=ursulas,
+                                     discover_on_this_thread=discover_on_this_thread)
+
+        def enact(policy):
+            if self.federated_only:
+                policy.enact(network_middleware=self.network_middleware,
+                             publish_treasure_map=publish_treasure_map)
+            else:
+                policy.enact(network_middleware=self.network_middleware,
+                             publish_to_blockchain=False,  # Already published, below.
+                             publish_treasure_map=publish_treasure_map)
+
+        with ThreadPoolExecutor(max_workers=min(self.BULK_GRANT_CONCURRENCY, len(policies))) as executor:
+            self.log.debug(f"Making arrangements for {len(policies)} policies ... ")
+            list(executor.map(make_arrangements, policies))
+
+            if not self.federated_only:
+                # Broadcast every policy's transaction, then wait for them all to be mined.
+                for policy in policies:
+                    policy.publish_to_blockchain(fire_and_forget=True)
+                for policy in policies:
+                    policy.confirm_publication()
+
+            self.log.debug(f"Enacting {len(policies)} policies ... ")
+            list(executor.map(enact, policies))
+
+        if publish_treasure_map and block_until_success_is_reasonably_likely:
+            for policy in policies:
+                policy.publishing_mutex.block_until_success_is_reasonably_likely()
+        return policies
+
+    def __block_until_enough_nodes_are_known(self, n: int, discover_on_this_thread: bool, timeout: int) -> None:
+        if self.federated_only and len(self.known_nodes) < n:
+            good_to_go = self.block_until_number_of_known_nodes_is(number_of_nodes_to_know=n,
+                                                                   learn_on_this_thread=discover_on_this_thread,
+                                                                   timeout=timeout)
+            if not good_to_go:
+                raise ValueError(
+                    "To make a Policy in federated mode, you need to know about "
+                    "all the Ursulas you need (in this case, {}); there's no other way to "
+                    "know which nodes to use.  Either pass them here or when you make the Policy, "
+                    "or run the learning loop on a network with enough Ursulas.".format(n))
+
     def get_policy_encrypting_key_from_label(self, label: bytes) -> UmbralPublicKey:
         alice_delegating_power = self._crypto_power.power_ups(DelegatingPower)
         policy_pubkey = alice_delegating_power.get_pubkey_from_label(label)
@@ -436,6 +565,14 @@ class Alice(Character, BlockchainPolicyAuthor):
             response = controller(method_name='grant', control_request=request)
             return response
 
+        @alice_flask_control.route("/bulk_grant", methods=['PUT'])
+        def bulk_grant() -> Response:
+            """
+            Character control endpoint for granting many policies at once.
+            """
+            response = controller(method_name='bulk_grant', control_request=request)
+            return response
+
         @alice_flask_control.route("/revoke", methods=['DELETE'])
         def revoke():
             """
@@ -693,7 +830,8 @@ class Bob(Character):
             raise TypeError("This WorkOrder is already complete; "
                             "if you want Ursula to perform additional service, make a new WorkOrder.")
 
-        cfrags_and_signatures = self.network_middleware.reencrypt(work_order)
+        # Each cfrag is checked as it arrives, while Ursula is still making the rest.
+        cfrags_and_signatures = self.network_middleware.reencrypt_stream(work_order)
         cfrags = work_order.complete(cfrags_and_signatures)
         self._completed_work_orders.save_work_order(work_order, as_replete=retain_cfrags)
 
@@ -988,6 +1126,14 @@ class Ursula(Teacher, Character, Worker):
                  timestamp=None,
                  availability_check: bool = False,
                  prune_datastore: bool = True,
+                 reencryption_workers: int = 0,
+                 reencryption_queue_size: int = None,
+                 treasure_map_cache_size: int = None,
+                 policy_owner_warmup_blocks: int = 0,
+                 max_concurrent_requests: int = None,
+                 client_request_rate: float = None,
+                 rest_processes: int = 1,
+                 status_page_max_age: int = None,
 
                  # Blockchain
                  decentralized_identity_evidence: bytes = constants.NOT_SIGNED,
@@ -1037,9 +1183,6 @@ class Ursula(Teacher, Character, Worker):
                            **character_kwargs)
 
         if is_me:
-            # In-Memory TreasureMap tracking
-            self._stored_treasure_maps = dict()  # TODO: Something more persistent (See PR #2132)
-
             # Learner
             self._start_learning_now = start_learning_now
 
@@ -1050,7 +1193,30 @@ class Ursula(Teacher, Character, Worker):
             # Arrangement Pruning
             self.__pruning_task = None
             self._prune_datastore = prune_datastore
-            self._arrangement_pruning_task = LoopingCall(f=self.__prune_arrangements)
+            self._arrangement_pruning_task = LoopingCall(f=self.__prune_datastore)
+
+            # REST Admission Control
+            self.admission_controller = AdmissionController(max_concurrent_requests=max_concurrent_requests,
+                                                            client_request_rate=client_request_rate)
+
+            # REST Request Statistics
+            self.rest_statistics = RESTStatistics()
+
+            # Answers to pings, kept for a while
+            self.reachability = ReachabilityChecker(ursula=self)
+
+            # Status Page (rendered from a snapshot of the fleet)
+            self.status_page = StatusPage(max_age=status_page_max_age)
+
+            # REST Serving (in this process, unless it is to be shared among a number of forked processes)
+            self._rest_processes = rest_processes
+            self.rest_process_pool = None
+
+            # Re-encryption (inline, unless a number of worker processes is configured)
+            self.reencryption_pool = None
+            if reencryption_workers:
+                self.reencryption_pool = ReencryptionPool(workers=reencryption_workers,
+                                                          queue_size=reencryption_queue_size)
 
         #
         # Ursula the Decentralized Worker (Self)
@@ -1089,6 +1255,13 @@ class Ursula(Teacher, Character, Worker):
                 self.stop(halt_reactor=False)
                 raise
 
+            # Policy owners, for accepting treasure maps without a contract read each time.
+            self.policy_owners = PolicyOwnerCache(policy_agent=self.policy_agent)
+            self._policy_owner_warmup_blocks = policy_owner_warmup_blocks
+
+            # Payments for kfrags that arrive before their policy transaction is mined
+            self.payment_tracker = PolicyPaymentTracker(ursula=self)
+
         if not crypto_power or (TLSHostingPower not in crypto_power):
 
             #
@@ -1107,6 +1280,15 @@ class Ursula(Teacher, Character, Worker):
                     serving_domains=domains,
                 )
 
+                # TreasureMaps are kept in the datastore, with the most recently used ones in memory.
+                if federated_only:
+                    from nucypher.policy.collections import TreasureMap as _MapClass
+                else:
+                    from nucypher.policy.collections import SignedTreasureMap as _MapClass
+                self.treasure_maps = TreasureMapStore(datastore=datastore,
+                                                      map_class=_MapClass,
+                                                      cache_size=treasure_map_cache_size)
+
                 # TLSHostingPower (Ephemeral Powers and Private Keys)
                 tls_hosting_keypair = HostingKeypair(curve=tls_curve, host=rest_host,
                                                      checksum_address=self.checksum_address)
@@ -1165,9 +1347,13 @@ class Ursula(Teacher, Character, Worker):
             message = "Initialized Stranger {} | {}".format(self.__class__.__name__, self)
             self.log.debug(message)
 
-    def __prune_arrangements(self) -> None:
-        """Deletes all expired arrangements and kfrags in the datastore."""
+    def __prune_datastore(self) -> None:
         now = maya.MayaDT.from_datetime(datetime.fromtimestamp(self._arrangement_pruning_task.clock.seconds()))
+        self.__prune_arrangements(now=now)
+        self.__prune_treasure_maps(now=now)
+
+    def __prune_arrangements(self, now: maya.MayaDT) -> None:
+        """Deletes all expired arrangements and kfrags in the datastore."""
         try:
             with self.datastore.query_by(PolicyArrangement,
                                          filter_field='expiration',
@@ -1184,6 +1370,34 @@ class Ursula(Teacher, Character, Worker):
             if result > 0:
                 self.log.debug(f"Pruned {result} policy arrangements.")
 
+        try:
+            with self.datastore.query_by(PolicyOwner,
+                                         filter_field='latest_expiration',
+                                         filter_func=lambda expiration: expiration <= now,
+                                         writeable=True) as expired_owners:
+                for policy_owner in expired_owners:
+                    policy_owner.delete()
+        except RecordNotFound:
+            pass
+        except DatastoreTransactionError:
+            self.log.warn(f"Failed to prune policy owners; DB session rolled back.")
+
+    def __prune_treasure_maps(self, now: maya.MayaDT) -> None:
+        """Deletes all treasure maps for expired policies from the datastore."""
+        try:
+            result = self.treasure_maps.prune(now=now)
+        except DatastoreTransactionError:
+            self.log.warn(f"Failed to prune treasure maps; DB session rolled back.")
+        else:
+            if result > 0:
+                self.log.debug(f"Pruned {result} treasure maps.")
+
+    def __warm_policy_owners(self) -> None:
+        latest_block = self.policy_agent.blockchain.client.block_number
+        from_block = max(latest_block - self._policy_owner_warmup_blocks, 0)
+        warmed = self.policy_owners.warm(from_block=from_block, to_block=latest_block)
+        self.log.info(f"Cached the owners of {warmed} policies created in the last {latest_block - from_block} blocks.")
+
     def run(self,
             emitter: StdoutEmitter = None,
             hendrix: bool = True,
@@ -1198,6 +1412,11 @@ class Ursula(Teacher, Character, Worker):
 
         """Schedule and start select ursula services, then optionally start the reactor."""
 
+        if hendrix and self._rest_processes > 1:
+            # Fork the REST processes before any other service starts, so that none of them is copied.
+            self.rest_process_pool = RESTProcessPool(ursula=self, processes=self._rest_processes)
+            self.rest_process_pool.start()
+
         #
         # Async loops ordered by schedule priority
         #
@@ -1216,11 +1435,22 @@ class Ursula(Teacher, Character, Worker):
         #     if emitter:
         #         emitter.message(f"✓ Node Discovery ({','.join(self.learning_domains)})", color='green')
 
+        if not self.federated_only and self._policy_owner_warmup_blocks:
+            d = threads.deferToThread(self.__warm_policy_owners)
+            d.addErrback(lambda failure: self.log.warn(f"Failed to warm policy owner cache: {failure.getErrorMessage()}"))
+            if emitter:
+                emitter.message(f"✓ Policy Owner Cache", color='green')
+
         if self._availability_check and availability:
             self._availability_tracker.start(now=False)  # wait...
             if emitter:
                 emitter.message(f"✓ Availability Checks", color='green')
 
+        if not self.federated_only:
+            self.payment_tracker.start(now=True)
+            if emitter:
+                emitter.message(f"✓ Policy Payment Tracking", color='green')
+
         if worker and not self.federated_only:
             self.work_tracker.start(act_now=True)  # requirement_func=self._availability_tracker.status)  # TODO: #2277
             if emitter:
@@ -1241,7 +1471,18 @@ class Ursula(Teacher, Character, Worker):
         if interactive and emitter:
             stdio.StandardIO(UrsulaCommandProtocol(ursula=self, emitter=emitter))
 
-        if hendrix:
+        if hendrix and self.rest_process_pool:
+
+            if emitter:
+                emitter.message(f"Starting Ursula on {self.rest_interface} "
+                                f"({self._rest_processes} REST processes)", color='green', bold=True)
+
+            if start_reactor:
+                if emitter:
+                    emitter.message("Working ~ Keep Ursula Online!", color='blue', bold=True)
+                reactor.run()  # <--- Blocking Call (Reactor)
+
+        elif hendrix:
 
             if emitter:
                 emitter.message(f"Starting Ursula on {self.rest_interface}", color='green', bold=True)
@@ -1279,8 +1520,15 @@ class Ursula(Teacher, Character, Worker):
             self.stop_learning_loop()
             if not self.federated_only:
                 self.work_tracker.stop()
+                self.payment_tracker.stop()
             if self._arrangement_pruning_task.running:
                 self._arrangement_pruning_task.stop()
+        with contextlib.suppress(AttributeError):
+            if self.reencryption_pool:
+                self.reencryption_pool.shutdown()
+        with contextlib.suppress(AttributeError):
+            if self.rest_process_pool:
+                self.rest_process_pool.stop()
         if halt_reactor:
             reactor.stop()
 
@@ -1313,9 +1561,15 @@ class Ursula(Teacher, Character, Worker):
 
     def get_deployer(self):
         port = self.rest_interface.port
-        deployer = self._crypto_power.power_ups(TLSHostingPower).get_deployer(rest_app=self.rest_app, port=port)
+        hosting_power = self._crypto_power.power_ups(TLSHostingPower)
+        deployer = hosting_power.get_deployer(rest_app=self.rest_app,
+                                              port=port,
+                                              threads=self.admission_controller.server_threads)
         return deployer
 
+    def get_ssl_context(self):
+        return self._crypto_power.power_ups(TLSHostingPower).keypair.get_ssl_context()
+
     def rest_server_certificate(self):
         return self._crypto_power.power_ups(TLSHostingPower).keypair.certificate
 
@@ -1626,29 +1880,47 @@ class Ursula(Teacher, Character, Worker):
     # Re-Encryption
     #
 
-    def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey):
-
-        # Prepare a bytestring for concatenating re-encrypted
-        # capsule data for each work order task.
-        cfrag_byte_stream = bytes()
+    def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey) -> bytes:
+        # Returns all the re-encrypted bytes at once
+        return bytes().join(self._reencrypt_stream(kfrag=kfrag,
+                                                   work_order=work_order,
+                                                   alice_verifying_key=alice_verifying_key))
+
+    def _reencrypt_stream(self,
+                          kfrag: KFrag,
+                          work_order: 'WorkOrder',
+                          alice_verifying_key: UmbralPublicKey
+                          ) -> Iterator[bytes]:
+        """
+        Yields each cfrag, length-prefixed and followed by Ursula's signature, as soon as it's made.
+        If the re-encryption pool is full, ReencryptionPool.Busy is raised here; if it times out, while iterating.
+        """
+        capsules, reencryption_metadata = list(), list()
         for capsule, task in work_order.tasks.items():
             # Ursula signs on top of Bob's signature of each task.
             # Now both are committed to the same task.  See #259.
-            reencryption_metadata = bytes(self.stamp(bytes(task.signature)))
+            reencryption_metadata.append(bytes(self.stamp(bytes(task.signature))))
 
             # Ursula sets Alice's verifying key for capsule correctness verification.
             capsule.set_correctness_keys(verifying=alice_verifying_key)
+            capsules.append(capsule)
+
+        # Then re-encrypts the fragments.
+        if self.reencryption_pool:
+            cfrags = self.reencryption_pool.reencrypt_iter(kfrag, capsules, reencryption_metadata)
+        else:
+            cfrags = (pre.reencrypt(kfrag, capsule, metadata=metadata)  # <--- pyUmbral
+                      for capsule, metadata in zip(capsules, reencryption_metadata))
 
-            # Then re-encrypts the fragment.
-            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)  # <--- pyUmbral
+        return self.__sign_cfrags(capsules, cfrags)
+
+    def __sign_cfrags(self, capsules: List[Capsule], cfrags: Iterable[CapsuleFrag]) -> Iterator[bytes]:
+        for capsule, cfrag in zip(capsules, cfrags):
             self.log.info(f"Re-encrypted capsule {capsule} -> made {cfrag}.")
 
             # Next, Ursula signs to commit to her results.
             reencryption_signature = self.stamp(bytes(cfrag))
-            cfrag_byte_stream += VariableLengthBytestring(cfrag) + reencryption_signature
-
-        # ... and finally returns all the re-encrypted bytes
-        return cfrag_byte_stream
+            yield VariableLengthBytestring(cfrag) + reencryption_signature
 
 
 class Enrico(Character):
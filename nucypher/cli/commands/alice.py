@@ -16,7 +16,10 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import click
+import json
 import os
+from json.decoder import JSONDecodeError
+
 from constant_sorrow.constants import NO_BLOCKCHAIN_CONNECTION, NO_PASSWORD
 
 from nucypher.blockchain.eth.signers.software import ClefSigner
@@ -470,6 +473,56 @@ def grant(general_config,
     return ALICE.controller.grant(request=grant_request)
 
 
+@alice.command('bulk-grant')
+@AliceInterface.connect_cli('bulk_grant')
+@option_config_file
+@group_general_config
+@group_character_options
+def bulk_grant(general_config,
+               grants_file,
+               value,
+               rate,
+               expiration,
+               m, n,
+               character_options,
+               config_file):
+    """Create and enact an access policy for each of many Bobs, all with the same terms."""
+
+    # Setup
+    emitter = setup_emitter(general_config)
+    ALICE = character_options.create_character(emitter, config_file, general_config.json_ipc)
+
+    # Input validation
+    if ALICE.federated_only:
+        if any((value, rate)):
+            raise click.BadOptionUsage(option_name="--value, --rate",
+                                       message="Can't use --value or --rate with a federated Alice.")
+    elif bool(value) and bool(rate):
+        raise click.BadOptionUsage(option_name="--rate", message="Can't use --value if using --rate")
+    elif not (bool(value) or bool(rate)):
+        rate = ALICE.default_rate  # TODO #1709
+        click.confirm(f"Confirm default rate {rate}?", abort=True)
+
+    try:
+        grants = json.load(grants_file)
+    except JSONDecodeError:
+        raise click.BadOptionUsage(option_name="--grants", message="Can't read the grants; they must be JSON.")
+
+    # Request
+    bulk_grant_request = {
+        'grants': grants,
+        'm': m,
+        'n': n,
+        'expiration': expiration,
+    }
+    if not ALICE.federated_only:
+        if value:
+            bulk_grant_request['value'] = value
+        elif rate:
+            bulk_grant_request['rate'] = rate
+    return ALICE.controller.bulk_grant(request=bulk_grant_request)
+
+
 @alice.command()
 @AliceInterface.connect_cli('revoke')
 @group_character_options
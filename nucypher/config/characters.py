@@ -45,6 +45,9 @@ class UrsulaConfiguration(CharacterConfiguration):
     __DEFAULT_TLS_CURVE = ec.SECP384R1
     DEFAULT_DB_NAME = '{}.db'.format(NAME)
     DEFAULT_AVAILABILITY_CHECKS = False
+    DEFAULT_REENCRYPTION_WORKERS = 0  # Re-encrypt in the serving process
+    DEFAULT_POLICY_OWNER_WARMUP_BLOCKS = 0  # Look up policy owners as treasure maps arrive
+    DEFAULT_REST_PROCESSES = 1  # Serve REST requests from the process that learns and works
     LOCAL_SIGNERS_ALLOWED = True
 
     def __init__(self,
@@ -56,6 +59,13 @@ class UrsulaConfiguration(CharacterConfiguration):
                  tls_curve: EllipticCurve = None,
                  certificate: Certificate = None,
                  availability_check: bool = None,
+                 reencryption_workers: int = None,
+                 reencryption_queue_size: int = None,
+                 policy_owner_warmup_blocks: int = None,
+                 max_concurrent_requests: int = None,
+                 client_request_rate: float = None,
+                 rest_processes: int = None,
+                 status_page_max_age: int = None,
                  *args, **kwargs) -> None:
 
         if not rest_port:
@@ -70,6 +80,13 @@ class UrsulaConfiguration(CharacterConfiguration):
         self.db_filepath = db_filepath or UNINITIALIZED_CONFIGURATION
         self.worker_address = worker_address
         self.availability_check = availability_check if availability_check is not None else self.DEFAULT_AVAILABILITY_CHECKS
+        self.reencryption_workers = reencryption_workers or self.DEFAULT_REENCRYPTION_WORKERS
+        self.reencryption_queue_size = reencryption_queue_size
+        self.policy_owner_warmup_blocks = policy_owner_warmup_blocks or self.DEFAULT_POLICY_OWNER_WARMUP_BLOCKS
+        self.max_concurrent_requests = max_concurrent_requests
+        self.client_request_rate = client_request_rate
+        self.rest_processes = rest_processes or self.DEFAULT_REST_PROCESSES
+        self.status_page_max_age = status_page_max_age
         super().__init__(dev_mode=dev_mode, *args, **kwargs)
 
     def generate_runtime_filepaths(self, config_root: str) -> dict:
@@ -89,6 +106,13 @@ class UrsulaConfiguration(CharacterConfiguration):
             rest_port=self.rest_port,
             db_filepath=self.db_filepath,
             availability_check=self.availability_check,
+            reencryption_workers=self.reencryption_workers,
+            reencryption_queue_size=self.reencryption_queue_size,
+            policy_owner_warmup_blocks=self.policy_owner_warmup_blocks,
+            max_concurrent_requests=self.max_concurrent_requests,
+            client_request_rate=self.client_request_rate,
+            rest_processes=self.rest_processes,
+            status_page_max_age=self.status_page_max_age,
         )
         return {**super().static_payload(), **payload}
 
@@ -151,24 +175,27 @@ class AliceConfiguration(CharacterConfiguration):
     # TODO: Best (Sane) Defaults
     DEFAULT_M = 2
     DEFAULT_N = 3
+    DEFAULT_KFRAG_WORKERS = 0  # Generate kfrags as policies are granted
 
     def __init__(self,
                  m: int = None,
                  n: int = None,
                  rate: int = None,
                  duration_periods: int = None,
+                 kfrag_workers: int = None,
                  *args, **kwargs):
 
         super().__init__(*args, **kwargs)
         self.m = m or self.DEFAULT_M
         self.n = n or self.DEFAULT_N
+        self.kfrag_workers = kfrag_workers or self.DEFAULT_KFRAG_WORKERS
 
         # if not self.federated_only:  # TODO: why not?
         self.rate = rate
         self.duration_periods = duration_periods
 
     def static_payload(self) -> dict:
-        payload = dict(m=self.m, n=self.n)
+        payload = dict(m=self.m, n=self.n, kfrag_workers=self.kfrag_workers)
         if not self.federated_only:
             if self.rate:
                 payload['rate'] = self.rate
@@ -0,0 +1,118 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from umbral.keys import UmbralPublicKey
+from umbral.kfrags import KFrag
+
+GeneratedKFrags = Tuple[UmbralPublicKey, List[KFrag]]  # The policy's public key, and its kfrags
+
+
+class KFragPool:
+    """
+    Generates the kfrags of grants that are known to be coming, ahead of time, in a pool of worker threads;
+    so that granting one takes kfrags that are ready rather than waiting for the elliptic curve math.
+
+    Kfrags are generated for a label, Bob's encrypting key, m and n, and are only ever handed out once;
+    granting the same policy again gets new kfrags.  Threads, unlike the processes of the ReencryptionPool,
+    keep Alice's private keys in this process.
+
+    At most `max_pending` sets of kfrags may be waiting to be taken at once; any more are turned away
+    with `KFragPool.Busy`.
+    """
+
+    DEFAULT_WORKERS = 1
+    DEFAULT_MAX_PENDING = 100
+
+    class Busy(RuntimeError):
+        """Raised when the pool can't generate another set of kfrags ahead of time right now."""
+
+    def __init__(self,
+                 generate: Callable[[bytes, UmbralPublicKey, int, int], GeneratedKFrags],
+                 workers: int = None,
+                 max_pending: int = None):
+        """
+        :param generate: Generates the kfrags for a label, Bob's encrypting key, m and n.
+        """
+        self._generate = generate
+        self.workers = workers or self.DEFAULT_WORKERS
+        self.max_pending = max_pending or self.DEFAULT_MAX_PENDING
+        self.__executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='kfrag-generation')
+        self.__lock = Lock()
+        self.__pending = dict()  # type: Dict[tuple, Future]
+        self.__shutting_down = False
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(label: bytes, bob_encrypting_key: UmbralPublicKey, m: int, n: int) -> tuple:
+        return bytes(label), bytes(bob_encrypting_key), m, n
+
+    def pregenerate(self, label: bytes, bob_encrypting_key: UmbralPublicKey, m: int, n: int) -> Future:
+        """
+        Starts generating kfrags for a grant, unless they're already pending; returns a future for them.
+        May raise Busy.
+        """
+        key = self._key(label, bob_encrypting_key, m, n)
+        with self.__lock:
+            if self.__shutting_down:
+                raise self.Busy("Shutting down.")
+            future = self.__pending.get(key)
+            if future is None:
+                if len(self.__pending) >= self.max_pending:
+                    raise self.Busy(f"Already holding {self.max_pending} sets of kfrags.")
+                future = self.__executor.submit(self._generate, label, bob_encrypting_key, m, n)
+                self.__pending[key] = future
+        return future
+
+    def take(self, label: bytes, bob_encrypting_key: UmbralPublicKey, m: int, n: int) -> Optional[GeneratedKFrags]:
+        """
+        Returns the kfrags generated ahead of time for a grant, waiting for them if they're still being generated;
+        or None if there are none (or generating them failed), in which case they're for the caller to generate.
+        """
+        key = self._key(label, bob_encrypting_key, m, n)
+        with self.__lock:
+            future = self.__pending.pop(key, None)
+            if future is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            return future.result()
+        except Exception:
+            return None  # Left for the caller to generate, and to raise whatever goes wrong.
+
+    @property
+    def pending(self) -> int:
+        """The number of sets of kfrags generated, or being generated, that haven't been taken."""
+        with self.__lock:
+            return len(self.__pending)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops generating kfrags; if `wait`, lets those being generated finish first."""
+        with self.__lock:
+            if self.__shutting_down:
+                return
+            self.__shutting_down = True
+            pending, self.__pending = self.__pending, dict()
+        for future in pending.values():
+            future.cancel()
+        self.__executor.shutdown(wait=wait)
@@ -0,0 +1,153 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing
+import time
+from threading import BoundedSemaphore, Lock
+from typing import Iterator, List, Optional, Sequence
+
+from umbral import pre
+from umbral.cfrags import CapsuleFrag
+from umbral.config import default_params
+from umbral.keys import UmbralPublicKey
+from umbral.kfrags import KFrag
+from umbral.pre import Capsule
+
+
+def _reencrypt_capsule(kfrag_bytes: bytes,
+                       capsule_bytes: bytes,
+                       correctness_keys: dict,
+                       metadata: bytes) -> bytes:
+    """Runs in a worker process, so everything goes in and out as bytes."""
+    kfrag = KFrag.from_bytes(kfrag_bytes)
+    capsule = Capsule.from_bytes(capsule_bytes, params=default_params())
+    capsule.set_correctness_keys(**{name: UmbralPublicKey.from_bytes(key) for name, key in correctness_keys.items()})
+    cfrag = pre.reencrypt(kfrag, capsule, metadata=metadata)
+    return bytes(cfrag)
+
+
+class ReencryptionPool:
+    """
+    Re-encrypts the capsules of a work order in parallel, in a pool of worker processes,
+    so that the elliptic curve math is neither held up by nor holding the GIL of the
+    process serving requests.
+
+    At most `queue_size` work orders may be in the pool at once; any more are turned away
+    with `ReencryptionPool.Busy` rather than queued, so that callers can shed load.
+    A work order that isn't done within `timeout` seconds (say, because a worker died)
+    gives up its slot and raises Busy too, rather than holding on forever.
+    """
+
+    DEFAULT_QUEUE_SIZE_PER_WORKER = 4
+    DEFAULT_TIMEOUT = 60  # seconds per work order
+
+    class Busy(RuntimeError):
+        """Raised when the pool can't take another work order right now."""
+
+    def __init__(self, workers: int = None, queue_size: int = None, timeout: float = DEFAULT_TIMEOUT):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.queue_size = queue_size or self.workers * self.DEFAULT_QUEUE_SIZE_PER_WORKER
+        self.timeout = timeout
+        self.__slots = BoundedSemaphore(self.queue_size)
+        self.__shutdown_lock = Lock()
+        self.__shutting_down = False
+
+        # Don't fork a process that may have a reactor and thread pools running.
+        context = multiprocessing.get_context('spawn')
+        self.__pool = context.Pool(processes=self.workers)
+
+    def reencrypt(self,
+                  kfrag: KFrag,
+                  capsules: Sequence[Capsule],
+                  metadata: Sequence[Optional[bytes]]
+                  ) -> List[CapsuleFrag]:
+        """
+        Re-encrypts each capsule with `kfrag` and the matching entry of `metadata`, blocking until all are done.
+        Capsules must already have their correctness keys set.
+        """
+        return list(self.reencrypt_iter(kfrag, capsules, metadata))
+
+    def reencrypt_iter(self,
+                       kfrag: KFrag,
+                       capsules: Sequence[Capsule],
+                       metadata: Sequence[Optional[bytes]]
+                       ) -> Iterator[CapsuleFrag]:
+        """
+        Like reencrypt, but returns as soon as the capsules are handed to the workers.  The returned iterator
+        yields the cfrags in order, each as soon as it is ready.  Busy is raised right away if the pool is full,
+        or while iterating if the work order isn't done within the timeout.
+        """
+        if self.__shutting_down or not self.__slots.acquire(blocking=False):
+            raise self.Busy(f"Already re-encrypting {self.queue_size} work orders.")
+        try:
+            kfrag_bytes = bytes(kfrag)
+            arguments = list()
+            for capsule, capsule_metadata in zip(capsules, metadata):
+                correctness_keys = {name: bytes(key) for name, key in capsule.get_correctness_keys().items() if key}
+                arguments.append((kfrag_bytes, bytes(capsule), correctness_keys, capsule_metadata))
+        except BaseException:
+            self.__slots.release()
+            raise
+        if not arguments:
+            self.__slots.release()
+            return iter(())
+
+        # The work order keeps its slot until the workers are done with it, whether or not anyone is still iterating,
+        # or until it times out, whichever comes first.
+        remaining = len(arguments)
+        remaining_lock = Lock()
+        holding_slot = True
+
+        def release_slot():
+            nonlocal holding_slot
+            with remaining_lock:
+                if holding_slot:
+                    holding_slot = False
+                    self.__slots.release()
+
+        def task_done(_result):
+            nonlocal remaining
+            with remaining_lock:
+                remaining -= 1
+                done = not remaining
+            if done:
+                release_slot()
+
+        results = [self.__pool.apply_async(_reencrypt_capsule, args, callback=task_done, error_callback=task_done)
+                   for args in arguments]
+        return self.__collect(results, deadline=time.monotonic() + self.timeout, on_timeout=release_slot)
+
+    def __collect(self, results, deadline: float, on_timeout) -> Iterator[CapsuleFrag]:
+        for result in results:
+            try:
+                cfrag_bytes = result.get(timeout=max(0, deadline - time.monotonic()))
+            except multiprocessing.TimeoutError:
+                on_timeout()
+                raise self.Busy(f"Work order not re-encrypted within {self.timeout} seconds.")
+            yield CapsuleFrag.from_bytes(cfrag_bytes)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops taking work orders; if `wait`, lets the ones in progress finish first."""
+        with self.__shutdown_lock:
+            if self.__shutting_down:
+                return
+            self.__shutting_down = True
+        if wait:
+            self.__pool.close()
+            self.__pool.join()
+        else:
+            self.__pool.terminate()
@@ -16,13 +16,54 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Iterable, Tuple
+
 from bytestring_splitter import BytestringSplitter
+from umbral.keys import UmbralPublicKey
 from umbral.signing import Signature, Signer
 
 from nucypher.crypto.api import keccak_digest
 
 signature_splitter = BytestringSplitter(Signature)
 
+# Fewer signatures than this are verified in the calling thread; handing them off isn't worth it.
+PARALLEL_VERIFICATION_THRESHOLD = 8
+
+_verification_executor = None
+_verification_executor_lock = Lock()
+
+
+def _get_verification_executor() -> ThreadPoolExecutor:
+    global _verification_executor
+    with _verification_executor_lock:
+        if _verification_executor is None:
+            _verification_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                        thread_name_prefix='signature-verification')
+        return _verification_executor
+
+
+def verify_signatures(signatures_and_messages: Iterable[Tuple[Signature, bytes]],
+                      verifying_key: UmbralPublicKey) -> bool:
+    """
+    Verifies many signatures made with the same key, returning True only if all of them are valid,
+    exactly as if Signature.verify had been called on each in turn.
+
+    Large batches are verified in parallel in a shared thread pool;
+    OpenSSL releases the GIL while it verifies, so this scales with cores.
+    """
+    signatures_and_messages = list(signatures_and_messages)
+
+    def verify(signature_and_message: Tuple[Signature, bytes]) -> bool:
+        signature, message = signature_and_message
+        return signature.verify(message, verifying_key)
+
+    if len(signatures_and_messages) < PARALLEL_VERIFICATION_THRESHOLD:
+        return all(map(verify, signatures_and_messages))
+    return all(_get_verification_executor().map(verify, signatures_and_messages))
+
 
 class SignatureStamp(object):
     """
@@ -27,3 +27,8 @@ from nucypher.crypto.constants import CAPSULE_LENGTH, PUBLIC_KEY_LENGTH
 key_splitter = BytestringSplitter((UmbralPublicKey, PUBLIC_KEY_LENGTH))
 capsule_splitter = BytestringSplitter((Capsule, CAPSULE_LENGTH, {"params": default_params()}))
 cfrag_splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring))
+
+# Batched re-encryption: requests are (arrangement ID, work order payload) pairs, and
+# responses are (HTTP status, cfrags and signatures or an error message) pairs, in the same order.
+work_order_batch_splitter = BytestringSplitter(VariableLengthBytestring, VariableLengthBytestring)
+reencryption_batch_result_splitter = BytestringSplitter((int, 2, {'byteorder': 'big'}), VariableLengthBytestring)
@@ -16,13 +16,17 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import base64
 import os
+import ssl
+import tempfile
 import sha3
 from OpenSSL.SSL import TLSv1_2_METHOD
 from OpenSSL.crypto import X509
 from constant_sorrow import constants
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from hendrix.deploy.tls import HendrixDeployTLS
 from hendrix.facilities.services import ExistingKeyTLSContextFactory
+from twisted.python.threadpool import ThreadPool
 from typing import Union
 from umbral import pre
 from umbral.keys import UmbralPrivateKey, UmbralPublicKey
@@ -190,8 +194,12 @@ class HostingKeypair(Keypair):
         self.certificate = certificate
         self.certificate_filepath = certificate_filepath
 
-    def get_deployer(self, rest_app, port):
+    def get_deployer(self, rest_app, port, threads: int = None):
+        threadpool = None
+        if threads:
+            threadpool = ThreadPool(minthreads=min(5, threads), maxthreads=threads, name="Hendrix Web Service")
         return HendrixDeployTLS("start",
+                                threadpool=threadpool,
                                 key=self._privkey,
                                 cert=X509.from_cryptography(self.certificate),
                                 context_factory=ExistingKeyTLSContextFactory,
@@ -203,3 +211,21 @@ class HostingKeypair(Keypair):
                                     "max_upload_bytes": MAX_UPLOAD_CONTENT_LENGTH,
                                     'resources': get_static_resources(),
                                 })
+
+    def get_ssl_context(self) -> ssl.SSLContext:
+        """A server-side context for the standard library's TLS, with the same key, certificate and curve."""
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.options |= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1  # TLS 1.2 or later; minimum_version needs Python 3.7
+        context.set_ecdh_curve(self.curve.name)
+        # The ssl module only loads keys from files; these live in a private directory just long enough to be read.
+        with tempfile.TemporaryDirectory() as directory:
+            certificate_filepath = os.path.join(directory, 'certificate.pem')
+            with open(certificate_filepath, 'wb') as certificate_file:
+                certificate_file.write(self.certificate.public_bytes(serialization.Encoding.PEM))
+            key_filepath = os.path.join(directory, 'key.pem')
+            with open(os.open(key_filepath, os.O_CREAT | os.O_WRONLY, 0o600), 'wb') as key_file:
+                key_file.write(self._privkey.private_bytes(encoding=serialization.Encoding.PEM,
+                                                           format=serialization.PrivateFormat.PKCS8,
+                                                           encryption_algorithm=serialization.NoEncryption()))
+            context.load_cert_chain(certfile=certificate_filepath, keyfile=key_filepath)
+        return context
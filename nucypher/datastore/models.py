@@ -33,6 +33,14 @@ class PolicyArrangement(DatastoreRecord):
     _alice_verifying_key = RecordField(UmbralPublicKey,
                 encode=bytes,
                 decode=UmbralPublicKey.from_bytes)
+    _payment_transaction = RecordField(bytes)  # Only while the payment is unconfirmed
+
+
+class PolicyOwner(DatastoreRecord):
+    # Keyed by Alice's verifying key, as hex; kept by federated nodes, where policies aren't on chain.
+    _latest_expiration = RecordField(MayaDT,  # Of the arrangements she has enacted with this node
+                encode=lambda maya_date: maya_date.iso8601().encode(),
+                decode=lambda maya_bytes: MayaDT.from_iso8601(maya_bytes.decode()))
 
 
 class Workorder(DatastoreRecord):
@@ -43,3 +51,10 @@ class Workorder(DatastoreRecord):
     _bob_signature = RecordField(Signature,
                 encode=bytes,
                 decode=Signature.from_bytes)
+
+
+class TreasureMap(DatastoreRecord):
+    _treasure_map = RecordField(bytes)
+    _expiration = RecordField(MayaDT,
+                encode=lambda maya_date: maya_date.iso8601().encode(),
+                decode=lambda maya_bytes: MayaDT.from_iso8601(maya_bytes.decode()))
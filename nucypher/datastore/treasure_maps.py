@@ -0,0 +1,111 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Iterator, Optional, Tuple, Type
+
+import maya
+from lru import LRU
+from maya import MayaDT
+
+from nucypher.datastore.datastore import Datastore, RecordNotFound
+from nucypher.datastore.models import TreasureMap as TreasureMapRecord
+
+
+class TreasureMapStore:
+    """
+    The treasure maps an Ursula has been given, keyed by map ID.
+
+    Maps are persisted in the datastore so that they survive a restart, with a bounded
+    LRU of recently used maps in front of it so that memory use doesn't grow with the number of
+    policies.  A map is no longer served once its policy has expired, and is deleted by `prune`.
+    """
+
+    DEFAULT_CACHE_SIZE = 1000
+
+    def __init__(self, datastore: Datastore, map_class: Type, cache_size: int = None):
+        self.__datastore = datastore
+        self.map_class = map_class
+        self.cache_size = cache_size or self.DEFAULT_CACHE_SIZE
+        self.__cache = LRU(self.cache_size)
+
+    def store(self, map_id: bytes, treasure_map, expiration: MayaDT) -> None:
+        with self.__datastore.describe(TreasureMapRecord, map_id.hex(), writeable=True) as record:
+            record.treasure_map = bytes(treasure_map)
+            record.expiration = expiration
+        self.__cache[map_id] = (treasure_map, expiration)
+
+    def __load(self, map_id: bytes) -> Tuple[object, MayaDT]:
+        try:
+            return self.__cache[map_id]
+        except KeyError:
+            pass
+        try:
+            with self.__datastore.describe(TreasureMapRecord, map_id.hex()) as record:
+                map_bytes, expiration = record.treasure_map, record.expiration
+        except RecordNotFound:
+            raise KeyError(map_id)
+        # Maps are only stored once their signature checks out.
+        treasure_map = self.map_class.from_bytes(map_bytes, verify=False)
+        self.__cache[map_id] = (treasure_map, expiration)
+        return treasure_map, expiration
+
+    def __getitem__(self, map_id: bytes):
+        treasure_map, expiration = self.__load(map_id)
+        if expiration <= maya.now():
+            raise KeyError(map_id)
+        return treasure_map
+
+    def get(self, map_id: bytes, default=None):
+        try:
+            return self[map_id]
+        except KeyError:
+            return default
+
+    def __contains__(self, map_id: bytes) -> bool:
+        return self.get(map_id) is not None
+
+    def values(self) -> Iterator:
+        """All the maps in the datastore, expired or not."""
+        try:
+            with self.__datastore.query_by(TreasureMapRecord, filter_field='treasure_map') as records:
+                maps = [record.treasure_map for record in records]
+        except RecordNotFound:
+            return
+        for map_bytes in maps:
+            yield self.map_class.from_bytes(map_bytes, verify=False)
+
+    @property
+    def cached(self) -> int:
+        return len(self.__cache)
+
+    def prune(self, now: Optional[MayaDT] = None) -> int:
+        """Deletes the maps whose policies have expired by `now`, returning how many there were."""
+        now = now or maya.now()
+        try:
+            with self.__datastore.query_by(TreasureMapRecord,
+                                           filter_field='expiration',
+                                           filter_func=lambda expiration: expiration <= now,
+                                           writeable=True) as expired_maps:
+                for record in expired_maps:
+                    record.delete()
+                pruned = len(expired_maps)
+        except RecordNotFound:
+            return 0
+        for map_id, (_treasure_map, expiration) in self.__cache.items():
+            if expiration <= now:
+                del self.__cache[map_id]
+        return pruned
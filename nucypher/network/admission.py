@@ -0,0 +1,216 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import time
+from collections import Counter
+from threading import Lock
+from typing import Callable, Mapping, Optional, Tuple
+
+from lru import LRU
+
+
+class TokenBucket:
+    """Allows `rate` events per second on average, in bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Takes a token if there is one and returns 0; otherwise returns the seconds until there will be."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionTicket:
+    """Holds a request's place among those in flight until it is released; releasing it twice is harmless."""
+
+    def __init__(self, controller: 'AdmissionController', priority_class: str, route: Optional[str] = None):
+        self.controller = controller
+        self.priority_class = priority_class
+        self.route = route
+        self.__released = False
+
+    def release(self) -> None:
+        if not self.__released:
+            self.__released = True
+            self.controller._release(self.priority_class, self.route)
+
+
+class AdmissionController:
+    """
+    Decides whether Ursula's REST server should take on a request right now.
+
+    Routes are grouped into priority classes.  A class is only admitted while the number of requests in
+    flight, across all classes, is below its share of `max_concurrent_requests`; so as the server fills up,
+    status requests are turned away first, then learning, and re-encryption (and the rest of the policy
+    routes, which are what earn the staker money) last.  Routes that are cheap to flood, like /ping, are
+    also held to a share of their own, however idle the server is otherwise.  Each client may also be held
+    to a token-bucket rate in each class.  Requests that aren't admitted should be answered at once,
+    with a Retry-After.
+
+    Requests can only be turned away once a server thread has picked them up, so the server needs more
+    threads than `max_concurrent_requests` (see `server_threads`); otherwise a flood queues up for the
+    threads, ahead of re-encryptions, without ever being refused.
+    """
+
+    REENCRYPTION = 'reencryption'
+    LEARNING = 'learning'
+    STATUS = 'status'
+
+    # The share of max_concurrent_requests each class may fill, highest priority first.
+    PRIORITY_SHARES = {REENCRYPTION: 1.0, LEARNING: 0.75, STATUS: 0.5}
+
+    # Flask endpoint -> priority class; anything else is a status request.
+    ROUTE_CLASSES = {
+        'reencrypt_via_rest': REENCRYPTION,
+        'reencrypt_batch_via_rest': REENCRYPTION,
+        'consider_arrangement': REENCRYPTION,
+        'set_policy': REENCRYPTION,
+        'revoke_arrangement': REENCRYPTION,
+        'provide_treasure_map': REENCRYPTION,
+        'receive_treasure_map': REENCRYPTION,
+        'public_information': LEARNING,
+        'all_known_nodes': LEARNING,
+        'node_metadata_exchange': LEARNING,
+    }
+
+    # Flask endpoint -> the share of max_concurrent_requests it may fill on its own.
+    ROUTE_SHARES = {
+        'ping': 0.125,
+    }
+
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 64
+    REJECTION_THREADS = 8  # Server threads beyond max_concurrent_requests, to turn requests away with
+    DEFAULT_RETRY_AFTER = 1  # seconds
+    MAX_TRACKED_CLIENTS = 10000
+
+    SATURATED = 'saturated'
+    ROUTE_SATURATED = 'route_saturated'
+    RATE_LIMITED = 'rate_limited'
+
+    class Rejected(RuntimeError):
+        """Raised when a request isn't admitted.  Carries the HTTP status and Retry-After to answer with."""
+
+        def __init__(self, reason: str, status: int, retry_after: int, *args):
+            self.reason = reason
+            self.status = status
+            self.retry_after = retry_after
+            super().__init__(reason, *args)
+
+    def __init__(self,
+                 max_concurrent_requests: int = None,
+                 client_request_rate: float = None,
+                 client_request_burst: float = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        :param max_concurrent_requests: Requests in flight at once, across all routes.
+        :param client_request_rate: Requests per second allowed from each client in each class, on average;
+                                    clients aren't rate limited if this is not given.
+        :param client_request_burst: Requests a client may make at once before it is held to the rate;
+                                     defaults to twice the rate.
+        """
+        self.max_concurrent_requests = max_concurrent_requests or self.DEFAULT_MAX_CONCURRENT_REQUESTS
+        self.client_request_rate = client_request_rate
+        self.client_request_burst = client_request_burst or (2 * client_request_rate if client_request_rate else None)
+        self._clock = clock
+
+        self._limits = {priority_class: max(1, int(share * self.max_concurrent_requests))
+                        for priority_class, share in self.PRIORITY_SHARES.items()}
+        self._route_limits = {route: max(1, int(share * self.max_concurrent_requests))
+                              for route, share in self.ROUTE_SHARES.items()}
+        self._lock = Lock()
+        self._buckets = LRU(self.MAX_TRACKED_CLIENTS)
+        self.in_flight = Counter()
+        self.in_flight_by_route = Counter()  # Only for the routes with limits of their own
+        self.in_flight_elsewhere = Counter()  # Being handled by other processes serving the node, as last reported
+        self.admitted = Counter()
+        self.rejected = Counter()  # (priority class, reason) -> count
+
+    @property
+    def server_threads(self) -> int:
+        """How many threads the server needs, so that requests beyond those admitted are turned away, not queued."""
+        return self.max_concurrent_requests + self.REJECTION_THREADS
+
+    def divided(self, parts: int) -> 'AdmissionController':
+        """
+        A controller for one of `parts` servers that share this one's load, like the processes serving a node:
+        its limits are this one's divided among them, so that together they admit no more than it would.
+        """
+        rate = self.client_request_rate / parts if self.client_request_rate else None
+        burst = max(1, self.client_request_burst / parts) if self.client_request_burst else None
+        return type(self)(max_concurrent_requests=max(1, self.max_concurrent_requests // parts),
+                          client_request_rate=rate,
+                          client_request_burst=burst,
+                          clock=self._clock)
+
+    def classify(self, endpoint: Optional[str]) -> str:
+        return self.ROUTE_CLASSES.get(endpoint, self.STATUS)
+
+    def admit(self, endpoint: Optional[str], client: Optional[str] = None) -> AdmissionTicket:
+        """Admits a request for the Flask `endpoint` from `client`, or raises AdmissionController.Rejected."""
+        priority_class = self.classify(endpoint)
+        now = self._clock()
+        with self._lock:
+            if self.client_request_rate and client is not None:
+                bucket = self._buckets.get((client, priority_class))
+                if bucket is None:
+                    bucket = TokenBucket(rate=self.client_request_rate, burst=self.client_request_burst, now=now)
+                    self._buckets[(client, priority_class)] = bucket
+                wait = bucket.take(now)
+                if wait:
+                    self.rejected[(priority_class, self.RATE_LIMITED)] += 1
+                    raise self.Rejected(self.RATE_LIMITED, status=429, retry_after=math.ceil(wait))
+
+            if sum(self.in_flight.values()) >= self._limits[priority_class]:
+                self.rejected[(priority_class, self.SATURATED)] += 1
+                raise self.Rejected(self.SATURATED, status=503, retry_after=self.DEFAULT_RETRY_AFTER)
+
+            route = endpoint if endpoint in self._route_limits else None
+            if route and self.in_flight_by_route[route] >= self._route_limits[route]:
+                self.rejected[(priority_class, self.ROUTE_SATURATED)] += 1
+                raise self.Rejected(self.ROUTE_SATURATED, status=503, retry_after=self.DEFAULT_RETRY_AFTER)
+
+            self.in_flight[priority_class] += 1
+            if route:
+                self.in_flight_by_route[route] += 1
+            self.admitted[priority_class] += 1
+        return AdmissionTicket(controller=self, priority_class=priority_class, route=route)
+
+    def counts(self) -> Tuple[Counter, Counter, Counter]:
+        """Copies of the admitted, rejected and in-flight counts, all taken at once."""
+        with self._lock:
+            return Counter(self.admitted), Counter(self.rejected), Counter(self.in_flight)
+
+    def add_counts(self, admitted: Mapping[str, int], rejected: Mapping[tuple, int]) -> None:
+        """Adds requests admitted and rejected elsewhere, like in a REST process, to these counts."""
+        with self._lock:
+            self.admitted.update(admitted)
+            self.rejected.update(rejected)
+
+    def _release(self, priority_class: str, route: Optional[str] = None) -> None:
+        with self._lock:
+            self.in_flight[priority_class] -= 1
+            if route:
+                self.in_flight_by_route[route] -= 1
@@ -0,0 +1,142 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+import time
+from collections import Counter
+from threading import Lock
+from typing import Callable, Dict
+
+from nucypher.network.exceptions import NodeCircuitOpen
+from nucypher.utilities.logging import Logger
+
+
+class _Circuit:
+
+    __slots__ = ('state', 'failures', 'trips', 'retry_at', 'probing')
+
+    def __init__(self):
+        self.state = NodeCircuitBreaker.CLOSED
+        self.failures = 0      # Consecutive failures
+        self.trips = 0         # Consecutive openings, for backoff
+        self.retry_at = 0.0
+        self.probing = False
+
+
+class NodeCircuitBreaker:
+    """
+    Tracks consecutive connection failures per node so that callers can fail fast
+    instead of waiting out a connect timeout for a node which is known to be down.
+
+    A circuit opens after FAILURE_THRESHOLD consecutive failures.  While open, requests
+    to the node raise NodeCircuitOpen immediately.  Once the (jittered, exponentially
+    backed-off) retry time has passed, the circuit is half-open: a single probe request
+    is let through, which either closes the circuit or opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+    STATES = (CLOSED, OPEN, HALF_OPEN)
+
+    FAILURE_THRESHOLD = 5   # Consecutive failures
+    RESET_TIMEOUT = 30      # Seconds
+    MAXIMUM_RESET_TIMEOUT = 60 * 10
+    JITTER = 0.25           # Fraction of the reset timeout
+
+    def __init__(self,
+                 failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT,
+                 jitter: float = JITTER,
+                 clock: Callable[[], float] = time.monotonic):
+        self.log = Logger(self.__class__.__name__)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.jitter = jitter
+        self._clock = clock
+        self._circuits = dict()
+        self._lock = Lock()
+
+        # Cumulative counts, for metrics
+        self.total_trips = 0
+        self.total_rejections = 0
+
+    def _retry_delay(self, trips: int) -> float:
+        delay = min(self.reset_timeout * 2 ** (trips - 1), self.MAXIMUM_RESET_TIMEOUT)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def before_request(self, node_address: str) -> None:
+        """Raises NodeCircuitOpen if a request to this node should not be attempted now."""
+        with self._lock:
+            circuit = self._circuits.get(node_address)
+            if circuit is None or circuit.state == self.CLOSED:
+                return
+            if circuit.state == self.OPEN and self._clock() >= circuit.retry_at:
+                circuit.state = self.HALF_OPEN
+                circuit.probing = False
+            if circuit.state == self.HALF_OPEN and not circuit.probing:
+                circuit.probing = True  # This request is the probe.
+                return
+            self.total_rejections += 1
+            retry_in = max(circuit.retry_at - self._clock(), 0)
+        raise NodeCircuitOpen(f"Circuit to {node_address} is {circuit.state}; retrying in {retry_in:.1f} seconds.")
+
+    def record_success(self, node_address: str) -> None:
+        with self._lock:
+            circuit = self._circuits.pop(node_address, None)
+        if circuit is not None and circuit.state != self.CLOSED:
+            self.log.info(f"Circuit to {node_address} closed.")
+
+    def record_failure(self, node_address: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(node_address, _Circuit())
+            circuit.failures += 1
+            circuit.probing = False
+            if circuit.state == self.HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state != self.OPEN:
+                    circuit.trips += 1
+                    self.total_trips += 1
+                circuit.state = self.OPEN
+                circuit.retry_at = self._clock() + self._retry_delay(circuit.trips)
+                self.log.debug(f"Circuit to {node_address} opened after {circuit.failures} failures.")
+
+    def release(self, node_address: str) -> None:
+        """
+        For a request which ended in neither success nor a connection failure (say, an unexpected error
+        on this side): if it was the half-open probe, the next request may probe instead.
+        """
+        with self._lock:
+            circuit = self._circuits.get(node_address)
+            if circuit is not None:
+                circuit.probing = False
+
+    def state(self, node_address: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(node_address)
+            if circuit is None:
+                return self.CLOSED
+            if circuit.state == self.OPEN and self._clock() >= circuit.retry_at:
+                return self.HALF_OPEN
+            return circuit.state
+
+    def states(self) -> Dict[str, str]:
+        """The state of every node which is not known to be healthy."""
+        return {node_address: self.state(node_address) for node_address in list(self._circuits)}
+
+    def count_by_state(self) -> Dict[str, int]:
+        counts = Counter(self.states().values())
+        return {state: counts.get(state, 0) for state in (self.OPEN, self.HALF_OPEN)}
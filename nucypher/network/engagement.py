@@ -0,0 +1,264 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Deque, Dict, Hashable, NamedTuple, Optional
+
+
+class EngagementTimeout(TimeoutError):
+    """Raised (through its future) for an engagement that couldn't be started before its deadline."""
+
+
+class EngagementObservation(NamedTuple):
+    outcome: str  # One of EngagementExecutor.OUTCOMES
+    queued_seconds: float  # From submission until the engagement started (or was given up)
+    engaged_seconds: float  # From its start until it finished; 0 if it never started
+
+
+class _Engagement:
+
+    __slots__ = ('call', 'node_id', 'group', 'deadline', 'submitted', 'future')
+
+    def __init__(self, call: Callable[[], Any], node_id: str, group: Hashable, deadline: float, submitted: float):
+        self.call = call
+        self.node_id = node_id
+        self.group = group
+        self.deadline = deadline
+        self.submitted = submitted
+        self.future = Future()
+
+
+class EngagementExecutor:
+    """
+    Threads shared by everything in the process that engages nodes over the network, like enacting policies
+    and publishing treasure maps, so that engaging many nodes for many policies at once doesn't take a thread
+    per node per policy.
+
+    * At most `threads` engagements run at once, in all; threads are started as they're needed,
+      and stop after they've been idle for a while.
+    * Engagements are submitted in groups (say, one per policy), and groups take turns, so that a policy
+      with many nodes to engage doesn't hold up the others until it's done.
+    * At most `per_node` engagements run at once with the same node; the others wait their turn,
+      so that a node isn't flooded by one process granting many policies.
+    * An engagement that hasn't started by its deadline is never started; its future fails with
+      EngagementTimeout instead.  A group's engagements that haven't started can be cancelled together.
+
+    Each finished engagement is counted, by outcome, in `outcomes`, and passed to the `observer` if there is one.
+    """
+
+    DEFAULT_THREADS = 64
+    DEFAULT_PER_NODE = 4
+    IDLE_TIMEOUT = 60  # seconds before an idle thread stops
+
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    TIMED_OUT = 'timed_out'
+    CANCELLED = 'cancelled'
+    OUTCOMES = (SUCCEEDED, FAILED, TIMED_OUT, CANCELLED)
+
+    def __init__(self,
+                 threads: int = None,
+                 per_node: int = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.threads = threads or self.DEFAULT_THREADS
+        self.per_node = per_node or self.DEFAULT_PER_NODE
+        self._clock = clock
+
+        self.__condition = Condition(Lock())
+        self.__ready = OrderedDict()  # type: Dict[Hashable, Deque[_Engagement]]  # In the order groups take turns
+        self.__waiting = dict()  # type: Dict[str, Deque[_Engagement]]  # For their node to have a turn
+        self.__per_node = Counter()  # node_id -> engagements ready or running
+        self.__queued = 0
+        self.__ready_count = 0
+        self.__running = 0
+        self.__workers = 0
+        self.__idle_workers = 0
+
+        self.outcomes = Counter()
+        self.observer = None  # type: Optional[Callable[[EngagementObservation], None]]
+
+    def submit(self,
+               call: Callable[[], Any],
+               node_id: str,
+               group: Hashable = None,
+               timeout: float = None
+               ) -> Future:
+        """
+        Calls `call`, an engagement with the node `node_id`, in one of the shared threads, taking turns with other
+        groups than `group`.  If `timeout` is given, the engagement must start within that many seconds.
+        Returns a future for what `call` returns or raises.
+        """
+        now = self._clock()
+        deadline = now + timeout if timeout is not None else None
+        engagement = _Engagement(call=call, node_id=node_id, group=group, deadline=deadline, submitted=now)
+        with self.__condition:
+            self.__queued += 1
+            if self.__per_node[node_id] < self.per_node:
+                self.__per_node[node_id] += 1
+                self.__make_ready(engagement)
+            else:
+                self.__waiting.setdefault(node_id, deque()).append(engagement)
+        return engagement.future
+
+    def cancel(self, group: Hashable) -> int:
+        """Cancels the engagements of `group` that haven't started; returns how many there were."""
+        with self.__condition:
+            cancelled = list()
+            for node_id, waiting in list(self.__waiting.items()):
+                kept = deque(e for e in waiting if e.group != group)
+                cancelled.extend(e for e in waiting if e.group == group)
+                if kept:
+                    self.__waiting[node_id] = kept
+                else:
+                    del self.__waiting[node_id]
+            ready = self.__ready.pop(group, ())
+            self.__ready_count -= len(ready)
+            for engagement in ready:
+                self.__pass_turn(engagement.node_id)
+            cancelled.extend(ready)
+            self.__queued -= len(cancelled)
+
+        now = self._clock()
+        for engagement in cancelled:
+            self.__finished(self.CANCELLED, queued_seconds=now - engagement.submitted)
+            engagement.future.cancel()
+        return len(cancelled)
+
+    @property
+    def queued(self) -> int:
+        """The number of engagements waiting for a thread, or for their node to have a turn."""
+        with self.__condition:
+            return self.__queued
+
+    @property
+    def running(self) -> int:
+        with self.__condition:
+            return self.__running
+
+    @property
+    def workers(self) -> int:
+        with self.__condition:
+            return self.__workers
+
+    def __make_ready(self, engagement: _Engagement) -> None:
+        try:
+            self.__ready[engagement.group].append(engagement)
+        except KeyError:
+            self.__ready[engagement.group] = deque((engagement,))
+        self.__ready_count += 1
+        self.__wake_a_worker()
+
+    def __next_ready(self) -> _Engagement:
+        group, ready = next(iter(self.__ready.items()))
+        engagement = ready.popleft()
+        self.__ready_count -= 1
+        if ready:
+            self.__ready.move_to_end(group)  # The next group's turn
+        else:
+            del self.__ready[group]
+        return engagement
+
+    def __wake_a_worker(self) -> None:
+        # Only workers count themselves in and out of idleness: a worker whose wait times out just as it's notified
+        # can't tell that it was, but it looks for something to do either way.  A thread is started whenever there's
+        # more ready than there are idle workers to take it.
+        if self.__idle_workers:
+            self.__condition.notify()
+        if self.__ready_count > self.__idle_workers and self.__workers < self.threads:
+            self.__workers += 1
+            Thread(target=self.__work, name=f'node-engagement-{self.__workers}', daemon=True).start()
+
+    def __work(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__ready:
+                    self.__idle_workers += 1
+                    woken = self.__condition.wait(timeout=self.IDLE_TIMEOUT)
+                    self.__idle_workers -= 1
+                    if not woken and not self.__ready:
+                        self.__workers -= 1
+                        return
+                engagement = self.__next_ready()
+                self.__queued -= 1
+                self.__running += 1
+            try:
+                self.__engage(engagement)
+            finally:
+                with self.__condition:
+                    self.__running -= 1
+                    self.__pass_turn(engagement.node_id)
+
+    def __engage(self, engagement: _Engagement) -> None:
+        # Each engagement is counted before its future is resolved, so that whoever waits on it sees it counted.
+        started = self._clock()
+        queued_seconds = started - engagement.submitted
+        if engagement.future.cancelled():
+            self.__finished(self.CANCELLED, queued_seconds=queued_seconds)  # Cancelled while it waited
+            return
+        if engagement.deadline is not None and started > engagement.deadline:
+            self.__finished(self.TIMED_OUT, queued_seconds=queued_seconds)
+            if engagement.future.set_running_or_notify_cancel():
+                engagement.future.set_exception(EngagementTimeout(f"Engagement with {engagement.node_id} "
+                                                                  f"didn't start before its deadline."))
+            return
+        if not engagement.future.set_running_or_notify_cancel():
+            self.__finished(self.CANCELLED, queued_seconds=queued_seconds)
+            return
+        try:
+            result = engagement.call()
+        except BaseException as e:
+            self.__finished(self.FAILED, queued_seconds=queued_seconds, engaged_seconds=self._clock() - started)
+            engagement.future.set_exception(e)
+        else:
+            self.__finished(self.SUCCEEDED, queued_seconds=queued_seconds, engaged_seconds=self._clock() - started)
+            engagement.future.set_result(result)
+
+    def __pass_turn(self, node_id: str) -> None:
+        waiting = self.__waiting.get(node_id)
+        if waiting:
+            self.__make_ready(waiting.popleft())  # The node's turn passes on; its count stays the same.
+            if not waiting:
+                del self.__waiting[node_id]
+        else:
+            self.__per_node[node_id] -= 1
+            if not self.__per_node[node_id]:
+                del self.__per_node[node_id]
+
+    def __finished(self, outcome: str, queued_seconds: float, engaged_seconds: float = 0) -> None:
+        with self.__condition:
+            self.outcomes[outcome] += 1
+        observer = self.observer
+        if observer:
+            observer(EngagementObservation(outcome=outcome,
+                                           queued_seconds=queued_seconds,
+                                           engaged_seconds=engaged_seconds))
+
+
+_engagement_executor = None
+_engagement_executor_lock = Lock()
+
+
+def get_engagement_executor() -> EngagementExecutor:
+    """The EngagementExecutor shared by the whole process."""
+    global _engagement_executor
+    with _engagement_executor_lock:
+        if _engagement_executor is None:
+            _engagement_executor = EngagementExecutor()
+        return _engagement_executor
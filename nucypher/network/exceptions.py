@@ -23,3 +23,10 @@ NodeSeemsToBeDown = (requests.exceptions.ConnectionError,
                      requests.exceptions.ConnectTimeout,
                      socket.gaierror,
                      ConnectionRefusedError)
+
+
+class NodeCircuitOpen(requests.exceptions.ConnectionError):
+    """
+    Raised without contacting a node whose circuit breaker is open.  It is a ConnectionError,
+    so it is handled wherever NodeSeemsToBeDown is.
+    """
@@ -20,25 +20,140 @@ import requests
 import socket
 import ssl
 import time
-from bytestring_splitter import VariableLengthBytestring
+from io import BytesIO
+from threading import Lock
+from urllib.parse import urlencode
+
+from bytestring_splitter import VARIABLE_HEADER_LENGTH, BytestringSplittingError, VariableLengthBytestring
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED, EXEMPT_FROM_VERIFICATION
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
-
-from nucypher.crypto.signing import signature_splitter
-from nucypher.crypto.splitters import cfrag_splitter
+from requests.adapters import HTTPAdapter
+from twisted.internet import defer, error, threads
+from twisted.internet.ssl import Certificate, optionsForClientTLS
+from twisted.web.client import (
+    Agent,
+    FileBodyProducer,
+    HTTPConnectionPool,
+    RequestTransmissionFailed,
+    ResponseFailed,
+    readBody
+)
+from twisted.web.iweb import IPolicyForHTTPS
+from zope.interface import implementer
+
+from nucypher.crypto.signing import Signature, signature_splitter
+from nucypher.crypto.splitters import cfrag_splitter, reencryption_batch_result_splitter
+from nucypher.network.circuit_breaker import NodeCircuitBreaker
+from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.utilities.logging import Logger
 
 EXEMPT_FROM_VERIFICATION.bool_value(False)
 
 
+class _ResumingSSLContext(ssl.SSLContext):
+    """
+    An SSLContext that offers the TLS session of its most recent connection
+    when wrapping a new socket, so that reconnections to the same node can
+    skip the full handshake.  Contexts are never shared between nodes.
+    """
+
+    _last_socket = None
+    _tls_session = None
+
+    def remember_session(self):
+        # Under TLS 1.3 the session ticket arrives after the handshake, so this is called once a response is read.
+        if self._last_socket is not None:
+            self._tls_session = self._last_socket.session or self._tls_session
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        self.remember_session()
+        if self._tls_session is not None and not kwargs.get('session'):
+            kwargs['session'] = self._tls_session
+        try:
+            tls_socket = super().wrap_socket(sock, *args, **kwargs)
+        except ssl.SSLError:
+            self._tls_session = None  # Don't offer a session that the node refused.
+            raise
+        self._last_socket = tls_socket
+        return tls_socket
+
+
+class _NodeAdapter(HTTPAdapter):
+    """
+    Keep-alive connection pool for a single node.
+    """
+
+    def __init__(self, ssl_context, *args, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def send(self, *args, **kwargs):
+        response = super().send(*args, **kwargs)
+        self._ssl_context.remember_session()
+        return response
+
+
 class NucypherMiddlewareClient:
     library = requests
     timeout = 1.2
 
+    pool_size = 10      # Connections per node
+    idle_timeout = 60   # Seconds
 
-    def __init__(self, registry=None, *args, **kwargs):
+    def __init__(self,
+                 registry=None,
+                 pool_size: int = None,
+                 idle_timeout: int = None,
+                 circuit_breaker: NodeCircuitBreaker = None,
+                 *args, **kwargs):
         self.registry = registry
+        self.circuit_breaker = circuit_breaker or NodeCircuitBreaker()
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+
+        # Sessions are keyed by both host and certificate so that a connection
+        # verified against one pinned certificate is never reused for another.
+        self._sessions = dict()
+        self._sessions_lock = Lock()
+
+    def _new_session(self) -> requests.Session:
+        ssl_context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context.check_hostname = False  # urllib3 matches the hostname itself.
+        adapter = _NodeAdapter(ssl_context=ssl_context, pool_connections=1, pool_maxsize=self.pool_size)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        return session
+
+    def get_session(self, host: str, certificate_filepath: str) -> requests.Session:
+        """
+        Returns the pooled session for this host and certificate, discarding
+        any sessions which have been idle for longer than idle_timeout.
+        """
+        now = time.monotonic()
+        with self._sessions_lock:
+            for key, (session, last_used) in list(self._sessions.items()):
+                if now - last_used > self.idle_timeout:
+                    del self._sessions[key]
+                    session.close()
+            try:
+                session, _last_used = self._sessions[(host, certificate_filepath)]
+            except KeyError:
+                session = self._new_session()
+            self._sessions[(host, certificate_filepath)] = (session, now)
+        return session
+
+    def close(self):
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, dict()
+        for session, _last_used in sessions.values():
+            session.close()
 
     @staticmethod
     def response_cleaner(response):
@@ -115,10 +230,21 @@ class NucypherMiddlewareClient:
             else:
                 certificate_filepath = node_certificate_filepath
 
+            if http_client is self.library and self.pool_size and isinstance(certificate_filepath, str):
+                http_client = self.get_session(host=host, certificate_filepath=certificate_filepath)
             method = getattr(http_client, method_name)
 
             url = f"https://{host}/{path}"
-            response = self.invoke_method(method, url, verify=certificate_filepath, *args, **kwargs)
+            self.circuit_breaker.before_request(host)
+            try:
+                response = self.invoke_method(method, url, verify=certificate_filepath, *args, **kwargs)
+            except NodeSeemsToBeDown:
+                self.circuit_breaker.record_failure(host)
+                raise
+            except BaseException:
+                self.circuit_breaker.release(host)
+                raise
+            self.circuit_breaker.record_success(host)
             cleaned_response = self.response_cleaner(response)
             if cleaned_response.status_code >= 300:
                 if cleaned_response.status_code == 400:
@@ -213,6 +339,66 @@ class RestMiddleware:
         cfrags_and_signatures = splitter.repeat(ursula_rest_response.content)
         return cfrags_and_signatures
 
+    def reencrypt_stream(self, work_order):
+        """
+        Like reencrypt, but yields each cfrag and its signature as soon as it arrives,
+        rather than waiting for Ursula to finish the whole work order.
+        """
+        ursula_rest_response = self.send_work_order_payload_to_ursula(work_order, stream=True)
+        yield from self._parse_cfrag_stream(self._iter_content(ursula_rest_response))
+
+    STREAM_CHUNK_SIZE = 8192
+
+    @classmethod
+    def _iter_content(cls, response):
+        try:
+            iter_content = response.iter_content
+        except AttributeError:
+            # Not a streamed response; it's all there already.
+            return iter((response.content,))
+        return iter_content(chunk_size=cls.STREAM_CHUNK_SIZE)
+
+    @staticmethod
+    def _parse_cfrag_stream(chunks):
+        """Parses length-prefixed cfrags and their signatures out of chunks of bytes, as soon as each is complete."""
+        splitter = cfrag_splitter + signature_splitter
+        signature_length = Signature.expected_bytes_length()
+        buffer = bytes()
+        for chunk in chunks:
+            buffer += chunk
+            offset = 0
+            while len(buffer) - offset >= VARIABLE_HEADER_LENGTH:
+                cfrag_length = int.from_bytes(buffer[offset:offset + VARIABLE_HEADER_LENGTH], byteorder='big')
+                end = offset + VARIABLE_HEADER_LENGTH + cfrag_length + signature_length
+                if len(buffer) < end:
+                    break
+                cfrag, signature = splitter(buffer[offset:end])
+                yield cfrag, signature
+                offset = end
+            buffer = buffer[offset:]
+        if buffer:
+            raise BytestringSplittingError(f"Ursula's response ended partway through a cfrag ({len(buffer)} bytes left).")
+
+    def reencrypt_batch(self, work_orders):
+        """
+        Sends several work orders, possibly for different arrangements, to one Ursula in a single request.
+        Returns a (status code, result) pair for each work order, in order, where the result is the
+        list of cfrags and signatures if the status is 200, or Ursula's error message otherwise.
+        """
+        ursula_rest_response = self.send_work_orders_payload_to_ursula(work_orders)
+        return self._parse_reencryption_batch(ursula_rest_response.content)
+
+    @staticmethod
+    def _parse_reencryption_batch(content):
+        splitter = cfrag_splitter + signature_splitter
+        results = list()
+        for status, result in reencryption_batch_result_splitter.repeat(content):
+            result = bytes(result)
+            if status == 200:
+                result = splitter.repeat(result) if result else list()
+            results.append((status, result))
+        return results
+
     def revoke_arrangement(self, ursula, revocation):
         # TODO: Implement revocation confirmations
         response = self.client.delete(
@@ -238,14 +424,31 @@ class RestMiddleware:
                                     timeout=2)
         return response
 
-    def send_work_order_payload_to_ursula(self, work_order):
+    def send_work_order_payload_to_ursula(self, work_order, stream: bool = False):
         payload = work_order.payload()
         id_as_hex = work_order.arrangement_id.hex()
+        kwargs = dict(stream=True) if stream else dict()
         response = self.client.post(
             node_or_sprout=work_order.ursula,
             path=f"kFrag/{id_as_hex}/reencrypt",
             data=payload,
-            timeout=2
+            timeout=2,
+            **kwargs
+        )
+        return response
+
+    def send_work_orders_payload_to_ursula(self, work_orders):
+        ursulas = {work_order.ursula.checksum_address for work_order in work_orders}
+        if len(ursulas) != 1:
+            raise ValueError(f"A batch of work orders must all be for the same Ursula; got {len(ursulas)}.")
+        payload = bytes().join(bytes(VariableLengthBytestring(work_order.arrangement_id)) +
+                               bytes(VariableLengthBytestring(work_order.payload()))
+                               for work_order in work_orders)
+        response = self.client.post(
+            node_or_sprout=work_orders[0].ursula,
+            path="reencrypt",
+            data=payload,
+            timeout=2 * len(work_orders)
         )
         return response
 
@@ -286,3 +489,214 @@ class RestMiddleware:
                                        params=params)
 
         return response
+
+
+@implementer(IPolicyForHTTPS)
+class _PinnedCertificatePolicy:
+    """
+    Trusts exactly one certificate: the one pinned for the node being contacted.
+    """
+
+    def __init__(self, certificate_filepath: str):
+        with open(certificate_filepath, 'rb') as certificate_file:
+            self._trust_root = Certificate.loadPEM(certificate_file.read())
+
+    def creatorForNetloc(self, hostname, port):
+        return optionsForClientTLS(hostname=hostname.decode('ascii'), trustRoot=self._trust_root)
+
+
+class AsyncResponse:
+    """
+    The parts of a requests.Response which the middleware relies upon, for fully-read Twisted responses.
+    """
+
+    def __init__(self, status_code: int, content: bytes, headers):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+
+class AsyncNucypherMiddlewareClient(NucypherMiddlewareClient):
+    """
+    A non-blocking twin of NucypherMiddlewareClient.  The HTTP verbs take the same arguments
+    but return Deferreds which fire with an AsyncResponse, or fail with the same exceptions
+    as the blocking client (including the requests exceptions which make up NodeSeemsToBeDown).
+
+    As with the blocking client, each node gets its own connection pool which trusts only
+    the node's pinned certificate.  Nodes which have not yet been verified are verified in
+    a worker thread, since verification may involve on-chain calls.
+    """
+
+    def __init__(self, registry=None, reactor=None, *args, **kwargs):
+        super().__init__(registry, *args, **kwargs)
+        if reactor is None:
+            from twisted.internet import reactor
+        self._reactor = reactor
+        self._agents = dict()
+        self._blocking_client = NucypherMiddlewareClient(registry,
+                                                         pool_size=self.pool_size,
+                                                         idle_timeout=self.idle_timeout,
+                                                         circuit_breaker=self.circuit_breaker)
+
+    def _new_agent(self, certificate_filepath: str):
+        pool = HTTPConnectionPool(self._reactor, persistent=bool(self.pool_size))
+        pool.maxPersistentPerHost = self.pool_size
+        pool.cachedConnectionTimeout = self.idle_timeout
+        agent = Agent(self._reactor, contextFactory=_PinnedCertificatePolicy(certificate_filepath), pool=pool)
+        return agent, pool
+
+    def get_agent(self, host: str, certificate_filepath: str) -> Agent:
+        # Like the blocking client's sessions, agents (and their pools) are keyed by host and certificate.
+        try:
+            agent, _pool = self._agents[(host, certificate_filepath)]
+        except KeyError:
+            agent, pool = self._agents[(host, certificate_filepath)] = self._new_agent(certificate_filepath)
+        return agent
+
+    def close(self) -> defer.Deferred:
+        agents, self._agents = self._agents, dict()
+        closing = [pool.closeCachedConnections() for _agent, pool in agents.values()]
+        return defer.DeferredList(closing)
+
+    def verify_and_parse_node_or_host_and_port(self, node_or_sprout, host, port):
+        if node_or_sprout and node_or_sprout is not EXEMPT_FROM_VERIFICATION:
+            node = node_or_sprout.mature()
+            if not node.verified_node:
+                d = threads.deferToThread(node.verify_node,
+                                          network_middleware_client=self._blocking_client,
+                                          registry=self.registry)
+                d.addCallback(lambda _: self.parse_node_or_host_and_port(node, host, port))
+                return d
+        return defer.succeed(self.parse_node_or_host_and_port(node_or_sprout, host, port))
+
+    def invoke_method(self, method, url, *args, **kwargs):
+        self.clean_params(kwargs)
+        timeout = kwargs.pop("timeout", None) or self.timeout
+        d = method(url, *args, **kwargs)
+        if timeout:
+            d.addTimeout(timeout, self._reactor)
+        d.addErrback(self._translate_failure)
+        return d
+
+    @staticmethod
+    def _translate_failure(failure):
+        if failure.check(error.ConnectingCancelledError):
+            # The timeout went off before there was a connection to read from.
+            raise requests.exceptions.ConnectTimeout(str(failure.value))
+        timed_out = failure.check(defer.TimeoutError)
+        if failure.check(ResponseFailed, RequestTransmissionFailed):
+            # Agent wraps the cancellation caused by the timeout.
+            timed_out = all(reason.check(defer.CancelledError) for reason in failure.value.reasons)
+        if timed_out:
+            raise requests.exceptions.ReadTimeout(str(failure.value))
+        if failure.check(error.ConnectError, ResponseFailed, RequestTransmissionFailed):
+            raise requests.exceptions.ConnectionError(str(failure.value))
+        return failure
+
+    @defer.inlineCallbacks
+    def node_information(self, host, port, certificate_filepath=None):
+        response = yield self.get(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                                  host=host, port=port,
+                                  path="public_information",
+                                  timeout=2,
+                                  certificate_filepath=certificate_filepath)
+        return response.content
+
+    def __getattr__(self, method_name):
+        # Quick sanity check.
+        if method_name not in ("post", "get", "put", "patch", "delete"):
+            raise TypeError(f"This client is for HTTP only - you need to use a real HTTP verb, not '{method_name}'.")
+
+        @defer.inlineCallbacks
+        def method_wrapper(path,
+                           node_or_sprout=None,
+                           host=None,
+                           port=None,
+                           certificate_filepath=None,
+                           data: bytes = None,
+                           params: dict = None,
+                           timeout: float = None):
+            host, node_certificate_filepath, _http_client = yield self.verify_and_parse_node_or_host_and_port(node_or_sprout, host, port)
+
+            if certificate_filepath:
+                filepaths_are_different = node_certificate_filepath != certificate_filepath
+                node_has_a_cert = node_certificate_filepath is not CERTIFICATE_NOT_SAVED
+                if node_has_a_cert and filepaths_are_different:
+                    raise ValueError("Don't try to pass a node with a certificate_filepath while also passing a"
+                                     " different certificate_filepath.  What do you even expect?")
+            else:
+                certificate_filepath = node_certificate_filepath
+
+            if not isinstance(certificate_filepath, str):
+                raise ValueError(f"The asynchronous client needs a pinned certificate to contact {host}.")
+
+            agent = self.get_agent(host=host, certificate_filepath=certificate_filepath)
+
+            url = f"https://{host}/{path}"
+            if params:
+                url = f"{url}?{urlencode(params)}"
+            body = FileBodyProducer(BytesIO(data)) if data is not None else None
+
+            def request(url):
+                d = agent.request(method_name.upper().encode(), url.encode(), bodyProducer=body)
+                d.addCallback(lambda raw_response: readBody(raw_response).addCallback(
+                    lambda content: AsyncResponse(status_code=raw_response.code,
+                                                  content=content,
+                                                  headers=raw_response.headers)))
+                return d
+
+            self.circuit_breaker.before_request(host)
+            try:
+                response = yield self.invoke_method(request, url, timeout=timeout)
+            except NodeSeemsToBeDown:
+                self.circuit_breaker.record_failure(host)
+                raise
+            except BaseException:
+                self.circuit_breaker.release(host)
+                raise
+            self.circuit_breaker.record_success(host)
+            cleaned_response = self.response_cleaner(response)
+            if cleaned_response.status_code >= 300:
+                if cleaned_response.status_code == 400:
+                    raise RestMiddleware.BadRequest(reason=cleaned_response.content)
+                elif cleaned_response.status_code == 404:
+                    m = f"While trying to {method_name} {path}, server 404'd.  Response: {cleaned_response.content}"
+                    raise RestMiddleware.NotFound(m)
+                else:
+                    m = f"Unexpected response while trying to {method_name} {path}: {cleaned_response.status_code} {cleaned_response.content}"
+                    raise RestMiddleware.UnexpectedResponse(m, status=cleaned_response.status_code)
+            return cleaned_response
+
+        return method_wrapper
+
+
+class AsyncRestMiddleware(RestMiddleware):
+    """
+    RestMiddleware whose operations return Deferreds instead of blocking,
+    so that many nodes can be contacted concurrently from the reactor thread.
+    """
+
+    _client_class = AsyncNucypherMiddlewareClient
+
+    def get_certificate(self, *args, **kwargs):
+        return threads.deferToThread(super().get_certificate, *args, **kwargs)
+
+    def reencrypt(self, work_order):
+        d = self.send_work_order_payload_to_ursula(work_order)
+        splitter = cfrag_splitter + signature_splitter
+        d.addCallback(lambda ursula_rest_response: splitter.repeat(ursula_rest_response.content))
+        return d
+
+    def reencrypt_stream(self, work_order):
+        """
+        Like reencrypt: the asynchronous client reads the whole response before firing,
+        so this fires with every cfrag and its signature at once.
+        """
+        d = self.send_work_order_payload_to_ursula(work_order)
+        d.addCallback(lambda ursula_rest_response: list(self._parse_cfrag_stream((ursula_rest_response.content,))))
+        return d
+
+    def reencrypt_batch(self, work_orders):
+        d = self.send_work_orders_payload_to_ursula(work_orders)
+        d.addCallback(lambda ursula_rest_response: self._parse_reencryption_batch(ursula_rest_response.content))
+        return d
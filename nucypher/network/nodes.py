@@ -41,7 +41,7 @@ from constant_sorrow.constants import (CERTIFICATE_NOT_SAVED, FLEET_STATES_MATCH
                                        NO_KNOWN_NODES, NO_STORAGE_AVAILIBLE, UNKNOWN_FLEET_STATE, UNKNOWN_VERSION,
                                        RELAX)
 from nucypher.acumen.nicknames import nickname_from_seed
-from nucypher.acumen.perception import FleetSensor, icon_from_checksum
+from nucypher.acumen.perception import FleetSensor, LearningStatistics, icon_from_checksum
 from nucypher.blockchain.economics import EconomicsFactory
 from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
 from nucypher.blockchain.eth.constants import NULL_ADDRESS
@@ -272,6 +272,7 @@ class Learner:
 
         self._learning_round = 0  # type: int
         self._rounds_without_new_nodes = 0  # type: int
+        self.learning_statistics = LearningStatistics()
         self._seed_nodes = seed_nodes or []
         self.unresponsive_seed_nodes = set()
 
@@ -750,6 +751,18 @@ class Learner:
 
         TODO: A lot of other code can be simplified if this is converted to async def.  That's a project, though.
         """
+        started = time.perf_counter()
+        number_of_known_nodes = len(self.known_nodes)
+        result = None
+        try:
+            result = self._learn_from_teacher_node(eager=eager, canceller=canceller)
+            return result
+        finally:
+            self.learning_statistics.record_round(duration=time.perf_counter() - started,
+                                                  nodes_learned=len(self.known_nodes) - number_of_known_nodes,
+                                                  result=result)
+
+    def _learn_from_teacher_node(self, eager=False, canceller=None):
         remembered = []
 
         if not self.done_seeding:
@@ -780,10 +793,11 @@ class Learner:
             return RELAX
 
         try:
-            response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
-                                                                  nodes_i_need=self._node_ids_to_learn_about_immediately,
-                                                                  announce_nodes=announce_nodes,
-                                                                  fleet_checksum=self.known_nodes.checksum)
+            with self.learning_statistics.phase('request'):
+                response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
+                                                                      nodes_i_need=self._node_ids_to_learn_about_immediately,
+                                                                      announce_nodes=announce_nodes,
+                                                                      fleet_checksum=self.known_nodes.checksum)
         except RuntimeError as e:
             if canceller and canceller.stop_now:
                 # Race condition that seems limited to tests.
@@ -793,12 +807,14 @@ class Learner:
                 raise
         except NodeSeemsToBeDown as e:
             unresponsive_nodes.add(current_teacher)
+            self.learning_statistics.record_teacher_failure('unreachable')
             self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
             return
         except current_teacher.InvalidNode as e:
             # Ugh.  The teacher is invalid.  Rough.
             # TODO: Bucket separately and report.
             unresponsive_nodes.add(current_teacher)
+            self.learning_statistics.record_teacher_failure('invalid')
             self.log.info("Teacher is invalid: {}:{}.".format(current_teacher, e))
             return
 
@@ -815,6 +831,7 @@ class Learner:
             # It's possible that our fleet states match, and we'll check for that later.
 
         elif response.status_code != 200:
+            self.learning_statistics.record_teacher_failure('bad_response')
             self.log.info("Bad response from teacher {}: {} - {}".format(current_teacher, response, response.content))
             return
 
@@ -829,21 +846,26 @@ class Learner:
         # Deserialize
         #
         try:
-            signature, node_payload = signature_splitter(response.content, return_remainder=True)
+            with self.learning_statistics.phase('parse'):
+                signature, node_payload = signature_splitter(response.content, return_remainder=True)
         except BytestringSplittingError:
+            self.learning_statistics.record_teacher_failure('unsigned')
             self.log.warn("No signature prepended to Teacher {} payload: {}".format(current_teacher, response.content))
             return
 
         try:
-            self.verify_from(current_teacher, node_payload, signature=signature)
+            with self.learning_statistics.phase('check_signature'):
+                self.verify_from(current_teacher, node_payload, signature=signature)
         except Learner.InvalidSignature:  # TODO: Ensure wev've got the right InvalidSignature exception here
+            self.learning_statistics.record_teacher_failure('bad_signature')
             self.suspicious_activities_witnessed['vladimirs'].append(
                 ('Node payload improperly signed', node_payload, signature))
             self.log.warn(
                 f"Invalid signature ({signature}) received from teacher {current_teacher} for payload {node_payload}")
 
         # End edge case handling.
-        payload = FleetSensor.snapshot_splitter(node_payload, return_remainder=True)
+        with self.learning_statistics.phase('parse'):
+            payload = FleetSensor.snapshot_splitter(node_payload, return_remainder=True)
         fleet_state_checksum_bytes, fleet_state_updated_bytes, node_payload = payload
 
         current_teacher.last_seen = maya.now()
@@ -861,8 +883,30 @@ class Learner:
         # so it has been removed.  When we create a new Ursula bytestring version, let's put the check
         # somewhere more performant, like mature() or verify_node().
 
-        sprouts = self.node_class.batch_from_bytes(node_payload)
+        with self.learning_statistics.phase('parse'):
+            sprouts = self.node_class.batch_from_bytes(node_payload)
+
+        with self.learning_statistics.phase('remember_nodes'):
+            self._remember_sprouts(sprouts, current_teacher, remembered, eager=eager)
+
+        # Is cycling happening in the right order?
+        current_teacher.update_snapshot(checksum=checksum,
+                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                        number_of_known_nodes=len(sprouts))
+
+        ###################
+
+        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        current_teacher,
+                                                        len(sprouts),
+                                                        len(remembered)))
+        if remembered:
+            with self.learning_statistics.phase('remember_nodes'):
+                self.known_nodes.record_fleet_state()
+        return sprouts
 
+    def _remember_sprouts(self, sprouts, current_teacher, remembered: list, eager: bool = False) -> None:
         for sprout in sprouts:
             fail_fast = True  # TODO  NRN
             try:
@@ -908,28 +952,13 @@ class Learner:
                           f"Propagated by: {current_teacher}"
                 self.log.warn(message)
 
-        # Is cycling happening in the right order?
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(sprouts))
-
-        ###################
-
-        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        self.log.info(learning_round_log_message.format(self._learning_round,
-                                                        current_teacher,
-                                                        len(sprouts),
-                                                        len(remembered)))
-        if remembered:
-            self.known_nodes.record_fleet_state()
-        return sprouts
-
 
 class Teacher:
     TEACHER_VERSION = LEARNING_LOOP_VERSION
     _interface_info_splitter = (int, 4, {'byteorder': 'big'})
     log = Logger("teacher")
     synchronous_query_timeout = 20  # How long to wait during REST endpoints for blockchain queries to resolve
+    PAGINATED_FLEET_STATES = 5  # Fleet states to report alongside a page of known nodes
     __DEFAULT_MIN_SEED_STAKE = 0
 
     def __init__(self,
@@ -1336,10 +1365,12 @@ class Teacher:
             address_first6=self.checksum_address[2:8]
         )
 
-    def known_nodes_details(self) -> dict:
+    def known_nodes_details(self, checksum_addresses: Iterable[str] = None) -> dict:
+        if checksum_addresses is None:
+            checksum_addresses = list(self.known_nodes.addresses())
         abridged_nodes = {}
-        for checksum_address, node in self.known_nodes._nodes.items():
-            abridged_nodes[checksum_address] = self.node_details(node=node)
+        for checksum_address in checksum_addresses:
+            abridged_nodes[checksum_address] = self.node_details(node=self.known_nodes[checksum_address])
         return abridged_nodes
 
     @staticmethod
@@ -1370,11 +1401,21 @@ class Teacher:
                    'version': nucypher.__version__}
         return payload
 
-    def abridged_node_details(self) -> dict:
-        """Self-Reporting"""
+    def abridged_node_details(self, page: int = None, per_page: int = None) -> dict:
+        """
+        Self-Reporting.  Given a `page` (counting from 1), reports only that page of
+        known nodes, by checksum address, and only the most recent fleet states.
+        """
         payload = self.node_details(node=self)
-        states = self.known_nodes.abridged_states_dict()
-        known = self.known_nodes_details()
+        if page is None:
+            states = self.known_nodes.abridged_states_dict()
+            known = self.known_nodes_details()
+        else:
+            states = self.known_nodes.abridged_states_dict(limit=self.PAGINATED_FLEET_STATES)
+            checksum_addresses = sorted(self.known_nodes.addresses())
+            start = (page - 1) * per_page
+            known = self.known_nodes_details(checksum_addresses=checksum_addresses[start:start + per_page])
+            payload.update({'page': page, 'per_page': per_page, 'total_known_nodes': len(checksum_addresses)})
         payload.update({'states': states, 'known_nodes': known})
         if not self.federated_only:
             payload.update({
@@ -0,0 +1,307 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import signal
+import socket
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from threading import Lock, Thread
+from typing import Dict, List, Tuple
+
+from bytestring_splitter import VariableLengthBytestring
+from twisted.internet.task import LoopingCall
+from werkzeug.serving import BaseWSGIServer
+
+from nucypher.acumen.perception import FleetSensor
+from nucypher.datastore.treasure_maps import TreasureMapStore
+from nucypher.network.server import make_rest_app
+from nucypher.network.statistics import RESTObservation
+from nucypher.utilities.logging import Logger
+
+
+class _CoordinatorPaymentTracker:
+    """Stands in for the PolicyPaymentTracker in a REST process, handing payments to the coordinator to track."""
+
+    def __init__(self, send):
+        self.__send = send
+
+    def track(self, transaction: bytes, arrangement_id: str) -> None:
+        self.__send(('track', bytes(transaction), arrangement_id))
+
+
+class _PooledWSGIServer(BaseWSGIServer):
+    """Serves each request in one of a fixed number of threads, rather than a thread of its own."""
+
+    multithread = True
+
+    def __init__(self, *args, threads: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='rest-request')
+
+    def process_request(self, request, client_address) -> None:
+        self.__pool.submit(self.__process_request, request, client_address)
+
+    def __process_request(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+class RESTProcessPool:
+    """
+    Serves Ursula's REST app from a number of processes that share one listening socket.
+
+    The processes are forked from Ursula before her reactor starts, so each begins with a copy of her keys,
+    known nodes and configuration, and opens the LMDB datastore afresh (LMDB is safe for use by many processes).
+    They serve requests and do nothing else, each admitting its share of the requests Ursula's admission controller
+    would (see AdmissionController.divided), with as many threads as that share needs.  Learning, and Ursula's on-chain duties, stay with Ursula in the
+    coordinating process: she sends the REST processes her known nodes whenever they change, and they send her
+    the nodes that learners tell them about and the policy payments that need tracking.  So that her metrics
+    cover the requests they serve, they also send her each request as it is answered, and their admission and
+    stranger cache counts every COUNTS_INTERVAL.
+    """
+
+    SYNC_INTERVAL = 5  # seconds between checks for changes to the coordinator's known nodes
+    COUNTS_INTERVAL = 1  # seconds between each REST process's reports of its counts
+    LISTEN_BACKLOG = 128
+
+    def __init__(self, ursula, processes: int):
+        if processes < 1:
+            raise ValueError(f"Need at least one REST process, not {processes}.")
+        self.log = Logger(self.__class__.__name__)
+        self.ursula = ursula
+        self.processes = processes
+        self.pids = list()  # type: List[int]
+        self.__channels = list()  # type: List[Connection]
+        self.__socket = None
+        self.__synced_checksum = None
+        self.__in_flight = dict()  # type: Dict[int, Counter]
+        self.__in_flight_lock = Lock()
+        self._sync_task = LoopingCall(self.sync_known_nodes)
+
+    @property
+    def running(self) -> bool:
+        return bool(self.pids)
+
+    def start(self) -> None:
+        """Opens the listening socket and forks the REST processes.  Call this before the reactor runs."""
+        if self.running:
+            return
+        host, port = self.ursula.rest_interface.host, self.ursula.rest_interface.port
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
+        self.__socket = socket.socket(family, socket.SOCK_STREAM)
+        self.__socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__socket.bind((host, port))
+        self.__socket.listen(self.LISTEN_BACKLOG)
+
+        self.__synced_checksum = self.ursula.known_nodes.checksum
+        for _ in range(self.processes):
+            coordinator_end, process_end = Pipe()
+            pid = os.fork()
+            if pid == 0:
+                for channel in (coordinator_end, *self.__channels):
+                    channel.close()  # So that each process notices when the coordinator, and only it, is gone.
+                self.__serve(channel=process_end)  # Never returns
+            process_end.close()
+            self.pids.append(pid)
+            self.__channels.append(coordinator_end)
+            Thread(target=self.__listen, args=(pid, coordinator_end), daemon=True).start()
+
+        self._sync_task.start(interval=self.SYNC_INTERVAL, now=False)
+        self.log.info(f"Serving {self.ursula.rest_interface} from {self.processes} processes ({self.pids}).")
+
+    def stop(self) -> None:
+        """Terminates the REST processes and waits for them to exit."""
+        if self._sync_task.running:
+            self._sync_task.stop()
+        pids, self.pids = self.pids, list()
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                continue
+        for channel in self.__channels:
+            channel.close()
+        self.__channels = list()
+        if self.__socket:
+            self.__socket.close()
+            self.__socket = None
+
+    #
+    # Coordinator
+    #
+
+    def sync_known_nodes(self) -> None:
+        """Sends the coordinator's known nodes to every REST process, if they have changed since last time."""
+        checksum = self.ursula.known_nodes.checksum
+        if checksum == self.__synced_checksum:
+            return
+        payload = self.ursula.bytestring_of_known_nodes()
+        for channel in self.__channels:
+            try:
+                channel.send(('nodes', payload))
+            except OSError:
+                continue  # The process is gone; its listener has logged it.
+        self.__synced_checksum = checksum
+
+    def __listen(self, pid: int, channel: Connection) -> None:
+        while True:
+            try:
+                message = channel.recv()
+            except (EOFError, OSError):
+                if pid in self.pids:
+                    self.log.warn(f"REST process {pid} has exited.")
+                self.__note_in_flight(pid, Counter())
+                return
+            try:
+                self.__handle(pid, message)
+            except Exception as e:
+                self.log.warn(f"Failed to handle {message[0]} from REST process {pid}: {e}")
+
+    def __handle(self, pid: int, message: Tuple) -> None:
+        kind, *contents = message
+        if kind == 'observe':
+            self.ursula.rest_statistics.record(RESTObservation(*contents))
+        elif kind == 'counts':
+            admitted, rejected, in_flight, stranger_hits, stranger_misses = contents
+            self.ursula.admission_controller.add_counts(admitted=admitted, rejected=rejected)
+            self.__note_in_flight(pid, Counter(in_flight))
+            self.ursula.stranger_cache.add_counts(hits=stranger_hits, misses=stranger_misses)
+        elif kind == 'learn':
+            nodes_bytes, = contents
+            for node in self.ursula.batch_from_bytes(nodes_bytes):
+                self.ursula.remember_node(node)
+        elif kind == 'track':
+            transaction, arrangement_id = contents
+            self.ursula.payment_tracker.track(transaction=transaction, arrangement_id=arrangement_id)
+        else:
+            raise ValueError(f"Unknown message {kind}")
+
+    def __note_in_flight(self, pid: int, in_flight: Counter) -> None:
+        with self.__in_flight_lock:
+            self.__in_flight[pid] = in_flight
+            self.ursula.admission_controller.in_flight_elsewhere = sum(self.__in_flight.values(), Counter())
+
+    #
+    # REST Process
+    #
+
+    def __serve(self, channel: Connection) -> None:
+        """Runs in each forked REST process, in place of everything Ursula would otherwise do; never returns."""
+        status = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)  # The coordinator decides when to stop.
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+            ursula = self.ursula
+            send_lock = Lock()
+
+            def send(message: Tuple) -> None:
+                with send_lock:
+                    channel.send(message)
+
+            def remember_node(node, *args, **kwargs):
+                send(('learn', bytes(VariableLengthBytestring(bytes(node)))))
+                return node
+
+            def observe(observation: RESTObservation) -> None:
+                try:
+                    send(('observe', *observation))
+                except OSError:
+                    pass  # The coordinator is gone, and this process will soon follow.
+
+            # What the coordinator opened, it keeps.  Hold on to it here, untouched, rather than close it.
+            _inherited = (ursula.rest_server.datastore, ursula.reencryption_pool)
+
+            rest_app, datastore = make_rest_app(db_filepath=ursula.datastore.db_path,
+                                                this_node=ursula,
+                                                serving_domains=ursula.serving_domains)
+            ursula.rest_server.rest_app = rest_app
+            ursula.rest_server.datastore = datastore
+            ursula.treasure_maps = TreasureMapStore(datastore=datastore,
+                                                    map_class=ursula.treasure_maps.map_class,
+                                                    cache_size=ursula.treasure_maps.cache_size)
+            ursula.reencryption_pool = None  # Each REST process re-encrypts inline; they are the parallelism.
+            ursula.admission_controller = ursula.admission_controller.divided(self.processes)
+            ursula.remember_node = remember_node
+            ursula.rest_statistics.observer = observe
+            if not ursula.federated_only:
+                ursula.payment_tracker = _CoordinatorPaymentTracker(send=send)
+
+            Thread(target=self.__follow_coordinator, args=(channel,), daemon=True).start()
+            Thread(target=self.__report_counts, args=(send,), daemon=True).start()
+
+            ssl_context = ursula.get_ssl_context()
+            server = _PooledWSGIServer(ursula.rest_interface.host,
+                                       ursula.rest_interface.port,
+                                       rest_app,
+                                       ssl_context=ssl_context,
+                                       fd=self.__socket.fileno(),
+                                       threads=ursula.admission_controller.server_threads)
+            server.serve_forever()
+        except BaseException as e:
+            self.log.critical(f"REST process {os.getpid()} failed: {e}")
+            status = 1
+        finally:
+            os._exit(status)
+
+    def __report_counts(self, send) -> None:
+        """Sends the coordinator this process's admission and stranger cache counts, since they were last sent."""
+        admission_controller, stranger_cache = self.ursula.admission_controller, self.ursula.stranger_cache
+        last_admitted, last_rejected, _in_flight = admission_controller.counts()
+        last_hits, last_misses = stranger_cache.hits, stranger_cache.misses
+        while True:
+            time.sleep(self.COUNTS_INTERVAL)
+            admitted, rejected, in_flight = admission_controller.counts()
+            hits, misses = stranger_cache.hits, stranger_cache.misses
+            try:
+                send(('counts',
+                      dict(admitted - last_admitted),
+                      dict(rejected - last_rejected),
+                      dict(in_flight),
+                      hits - last_hits,
+                      misses - last_misses))
+            except OSError:
+                return  # The coordinator is gone, and this process will soon follow.
+            last_admitted, last_rejected, last_hits, last_misses = admitted, rejected, hits, misses
+
+    def __follow_coordinator(self, channel: Connection) -> None:
+        ursula = self.ursula
+        while True:
+            try:
+                kind, payload = channel.recv()
+            except (EOFError, OSError):
+                os._exit(0)  # The coordinator is gone, so this process goes too.
+            if kind != 'nodes':
+                continue
+            _checksum, _updated, nodes_bytes = FleetSensor.snapshot_splitter(payload, return_remainder=True)
+            for node in ursula.batch_from_bytes(nodes_bytes):
+                if node.checksum_address != ursula.checksum_address:
+                    ursula.known_nodes[node.checksum_address] = node
+            ursula.known_nodes.record_fleet_state()
@@ -0,0 +1,149 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, NamedTuple
+
+from lru import LRU
+
+from nucypher.crypto.api import keccak_digest
+from nucypher.network.admission import TokenBucket
+from nucypher.network.exceptions import NodeSeemsToBeDown
+
+
+class _Verdict(NamedTuple):
+    verdict: str
+    expires: float
+
+
+class ReachabilityChecker:
+    """
+    Answers pings: can this node reach the pinging node, at the address it gives, and does it find the same
+    node there that pinged?  Finding out takes two connections back to the pinging node (the "sandwich"), so:
+
+    * Verdicts are kept for a short while, keyed by the pinging node's checksum address, host and port,
+      and the node it claims to be; so a node that pings again soon is answered without a connection.
+    * Pings that arrive while the same check is in progress wait for it rather than make their own.
+    * Each host may only be checked so often.  Hosts, not checksum addresses, are what is limited,
+      since it's the host that is connected to, and addresses cost nothing to make up.
+    """
+
+    REACHABLE = 'reachable'
+    UNREACHABLE = 'unreachable'
+    MISMATCHED = 'mismatched'
+
+    REACHABLE_TTL = 60  # seconds
+    UNREACHABLE_TTL = 10  # seconds; shorter, so that a node that has fixed itself isn't kept waiting
+    DEFAULT_CHECK_RATE = 0.2  # checks per second per host, on average...
+    DEFAULT_CHECK_BURST = 3  # ... in bursts of up to this many
+    MAX_CACHED = 10000
+
+    class RateLimited(RuntimeError):
+        """Raised when a host has been checked too often; carries the seconds until it may be checked again."""
+
+        def __init__(self, retry_after: int, *args):
+            self.retry_after = retry_after
+            super().__init__(f"Checked too often; retry after {retry_after} seconds.", *args)
+
+    def __init__(self,
+                 ursula=None,
+                 check: Callable[[str, int], bytes] = None,
+                 check_rate: float = None,
+                 check_burst: float = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        :param check: Fetches the bytes of the node at a host and port, raising NodeSeemsToBeDown if it can't;
+                      by default, `ursula` fetches and stores its certificate, then its node information.
+        """
+        if not (ursula or check):
+            raise ValueError("Pass the Ursula that checks, or a check to make.")
+        self.ursula = ursula
+        self._check = check or self.__sandwich
+        self.check_rate = check_rate or self.DEFAULT_CHECK_RATE
+        self.check_burst = check_burst or self.DEFAULT_CHECK_BURST
+        self._clock = clock
+
+        self.__lock = Lock()
+        self.__verdicts = LRU(self.MAX_CACHED)
+        self.__buckets = LRU(self.MAX_CACHED)
+        self.__in_flight = dict()
+
+        self.hits = 0
+        self.checks = 0
+        self.shared = 0
+        self.rate_limited = 0
+
+    def verdict(self, checksum_address: str, host: str, port: int, node_bytes: bytes) -> str:
+        """Whether the node at `host` and `port` is reachable and is `node_bytes`; may raise RateLimited."""
+        key = (checksum_address, host, port, keccak_digest(node_bytes))
+        with self.__lock:
+            now = self._clock()
+            cached = self.__verdicts.get(key)
+            if cached and cached.expires > now:
+                self.hits += 1
+                return cached.verdict
+
+            in_flight = self.__in_flight.get(key)
+            if in_flight:
+                self.shared += 1
+            else:
+                bucket = self.__buckets.get(host)
+                if bucket is None:
+                    bucket = TokenBucket(rate=self.check_rate, burst=self.check_burst, now=now)
+                    self.__buckets[host] = bucket
+                wait = bucket.take(now)
+                if wait:
+                    self.rate_limited += 1
+                    raise self.RateLimited(retry_after=math.ceil(wait))
+                self.checks += 1
+                self.__in_flight[key] = Future()
+
+        if in_flight:
+            return in_flight.result()
+        return self.__check(key=key, host=host, port=port, node_bytes=node_bytes)
+
+    def __check(self, key: tuple, host: str, port: int, node_bytes: bytes) -> str:
+        future = self.__in_flight[key]
+        try:
+            try:
+                served_bytes = self._check(host, port)
+            except NodeSeemsToBeDown:
+                verdict, ttl = self.UNREACHABLE, self.UNREACHABLE_TTL
+            else:
+                # Compare the results of the outer POST with the inner GET... yum
+                verdict = self.REACHABLE if served_bytes == node_bytes else self.MISMATCHED
+                ttl = self.REACHABLE_TTL
+        except BaseException as e:
+            with self.__lock:
+                del self.__in_flight[key]
+            future.set_exception(e)
+            raise
+        with self.__lock:
+            self.__verdicts[key] = _Verdict(verdict=verdict, expires=self._clock() + ttl)
+            del self.__in_flight[key]
+        future.set_result(verdict)
+        return verdict
+
+    def __sandwich(self, host: str, port: int) -> bytes:
+        # Fetch and store initiator's teacher certificate.
+        middleware = self.ursula.network_middleware
+        certificate = middleware.get_certificate(host=host, port=port)
+        certificate_filepath = self.ursula.node_storage.store_node_certificate(certificate=certificate)
+        return middleware.client.node_information(host=host, port=port, certificate_filepath=certificate_filepath)
@@ -19,35 +19,45 @@ import binascii
 import os
 import uuid
 import weakref
-from bytestring_splitter import BytestringSplitter
+import maya
+from bytestring_splitter import BytestringSplitter, BytestringSplittingError, VariableLengthBytestring
 from constant_sorrow import constants
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_BLOCKCHAIN_CONNECTION, NO_KNOWN_NODES
-from flask import Flask, Response, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from hendrix.experience import crosstown_traffic
 from jinja2 import Template, TemplateError
-from typing import Tuple, Set
+from typing import Iterable, Iterator, Set, Tuple, Union
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
-from web3.exceptions import TimeExhausted
+from web3.exceptions import TransactionNotFound
 
 import nucypher
 from nucypher.config.constants import MAX_UPLOAD_CONTENT_LENGTH
 from nucypher.config.storages import ForgetfulNodeStorage
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import KeyPairBasedPower, PowerUpError
+from nucypher.crypto.reencryption import ReencryptionPool
 from nucypher.crypto.signing import InvalidSignature
+from nucypher.crypto.splitters import work_order_batch_splitter
 from nucypher.crypto.utils import canonical_address_from_umbral_key
 from nucypher.datastore.datastore import Datastore, RecordNotFound, DatastoreTransactionError
 from nucypher.datastore.keypairs import HostingKeypair
-from nucypher.datastore.models import PolicyArrangement, Workorder
+from nucypher.datastore.models import PolicyArrangement, PolicyOwner, Workorder
 from nucypher.network import LEARNING_LOOP_VERSION
-from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.admission import AdmissionController
 from nucypher.network.protocols import InterfaceInfo
+from nucypher.network.reachability import ReachabilityChecker
+from nucypher.network.statistics import ROUTE_ENVIRON_KEY, RESTStatisticsMiddleware
+from nucypher.network.status import StatusPage
+from nucypher.policy.owners import PolicyOwnerCache
 from nucypher.utilities.logging import Logger
 
 HERE = BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 TEMPLATES_DIR = os.path.join(HERE, "templates")
 
+REENCRYPTION_RETRY_AFTER = 1  # seconds
+FEDERATED_TREASURE_MAP_LIFETIME_DAYS = 30
+
 with open(os.path.join(TEMPLATES_DIR, "basic_status.j2"), "r") as f:
     _status_template_content = f.read()
 status_template = Template(_status_template_content)
@@ -103,6 +113,13 @@ def make_rest_app(
     return rest_app, datastore
 
 
+def _release_when_sent(body: Iterable[bytes], ticket) -> Iterator[bytes]:
+    try:
+        yield from body
+    finally:
+        ticket.release()
+
+
 def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], log: Logger) -> Tuple[Flask, Datastore]:
 
     forgetful_node_storage = ForgetfulNodeStorage(federated_only=this_node.federated_only)
@@ -114,6 +131,45 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
     rest_app = Flask("ursula-service")
     rest_app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_CONTENT_LENGTH
 
+    # Per-route request statistics, measured from the arrival of each request until its response is sent.
+    rest_app.wsgi_app = RESTStatisticsMiddleware(rest_app.wsgi_app, statistics=lambda: this_node.rest_statistics)
+
+    @rest_app.before_request
+    def note_route():
+        if request.url_rule:
+            request.environ[ROUTE_ENVIRON_KEY] = request.url_rule.rule
+
+    @rest_app.before_request
+    def admit_request():
+        admission_controller = this_node.admission_controller
+        try:
+            g.admission_ticket = admission_controller.admit(endpoint=request.endpoint, client=request.remote_addr)
+        except AdmissionController.Rejected as rejection:
+            # Turn the request away before it takes up any more of the server's time.
+            return Response(f"Not taking {admission_controller.classify(request.endpoint)} requests right now "
+                            f"({rejection.reason}).",
+                            status=rejection.status,
+                            headers={'Retry-After': str(rejection.retry_after)})
+
+    @rest_app.after_request
+    def hold_admission_until_sent(response):
+        ticket = g.pop('admission_ticket', None)
+        if ticket is None:
+            return response
+        if response.is_streamed:
+            # Streamed responses do their work as they are sent, so they stay admitted until then.
+            response.response = _release_when_sent(response.response, ticket)
+            response.call_on_close(ticket.release)
+        else:
+            ticket.release()
+        return response
+
+    @rest_app.teardown_request
+    def release_admission(_exception):
+        ticket = g.pop('admission_ticket', None)
+        if ticket is not None:
+            ticket.release()
+
     @rest_app.route("/public_information")
     def public_information():
         """
@@ -132,7 +188,7 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
         """
 
         try:
-            requesting_ursula = Ursula.from_bytes(request.data, registry=this_node.registry)
+            requesting_ursula = Ursula.from_bytes(request.data)
             requesting_ursula.mature()
         except ValueError:  # (ValueError)
             return Response({'error': 'Invalid Ursula'}, status=400)
@@ -145,22 +201,21 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
             return Response({'error': 'Suspicious origin address'}, status=400)
 
         #
-        # Make a Sandwich
+        # Make a Sandwich (or reuse one made a moment ago)
         #
 
         try:
-            # Fetch and store initiator's teacher certificate.
-            certificate = this_node.network_middleware.get_certificate(host=initiator_address, port=initiator_port)
-            certificate_filepath = this_node.node_storage.store_node_certificate(certificate=certificate)
-            requesting_ursula_bytes = this_node.network_middleware.client.node_information(host=initiator_address,
-                                                                                           port=initiator_port,
-                                                                                           certificate_filepath=certificate_filepath)
-        except NodeSeemsToBeDown:
-            return Response({'error': 'Unreachable node'}, status=400)  # ... toasted
-
-        # Compare the results of the outer POST with the inner GET... yum
-        if requesting_ursula_bytes == request.data:
+            verdict = this_node.reachability.verdict(checksum_address=requesting_ursula.checksum_address,
+                                                     host=initiator_address,
+                                                     port=initiator_port,
+                                                     node_bytes=request.data)
+        except ReachabilityChecker.RateLimited as e:
+            return Response({'error': 'Pinged too often'}, status=429, headers={'Retry-After': str(e.retry_after)})
+
+        if verdict == ReachabilityChecker.REACHABLE:
             return Response(status=200)
+        elif verdict == ReachabilityChecker.UNREACHABLE:
+            return Response({'error': 'Unreachable node'}, status=400)  # ... toasted
         else:
             return Response({'error': 'Suspicious node'}, status=400)
 
@@ -206,6 +261,17 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
             new_policy_arrangement.expiration = arrangement.expiration
             new_policy_arrangement.alice_verifying_key = arrangement.alice.stamp.as_umbral_pubkey()
 
+        if this_node.federated_only:
+            # Noted now, so that her treasure maps can be kept as long as her arrangements without searching them all.
+            alice_id = bytes(arrangement.alice.stamp).hex()
+            with datastore.describe(PolicyOwner, alice_id, writeable=True) as policy_owner:
+                try:
+                    latest_expiration = policy_owner.latest_expiration
+                except AttributeError:
+                    latest_expiration = None
+                if latest_expiration is None or arrangement.expiration > latest_expiration:
+                    policy_owner.latest_expiration = arrangement.expiration
+
         # TODO: Fine, we'll add the arrangement here, but if we never hear from Alice again to enact it,
         # we need to prune it at some point.  #1700
 
@@ -221,7 +287,7 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
         policy_message_kit = UmbralMessageKit.from_bytes(request.data)
 
         alices_verifying_key = policy_message_kit.sender_verifying_key
-        alice = _alice_class.from_public_keys(verifying_key=alices_verifying_key)
+        alice = _alice_class.stranger_from_public_keys(verifying_key=alices_verifying_key)
 
         try:
             cleartext = this_node.verify_from(alice, policy_message_kit, decrypt=True)
@@ -234,22 +300,23 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
             transaction_splitter = BytestringSplitter(32)
             tx, kfrag_bytes = transaction_splitter(cleartext, return_remainder=True)
 
+            # Get all of the arrangements and verify that we'll be paid, if the payment has been mined already.
+            # Otherwise, the kfrag waits for the payment tracker to see it mined, so as not to hold up this thread.
+            # TODO: We'd love for this part to be impossible to reduce the risk of collusion.  #1274
             try:
-                # Get all of the arrangements and verify that we'll be paid.
-                # TODO: We'd love for this part to be impossible to reduce the risk of collusion.  #1274
-                arranged_addresses = this_node.policy_agent.fetch_arrangement_addresses_from_policy_txid(tx, timeout=this_node.synchronous_query_timeout)
-            except TimeExhausted:
+                arranged_addresses = this_node.policy_agent.fetch_arrangement_addresses_from_mined_policy_txid(tx)
+            except TransactionNotFound:
                 # Alice didn't pay.  Return response with that weird status code.
                 this_node.suspicious_activities_witnessed['freeriders'].append((alice, f"No transaction matching {tx}."))
                 return Response(status=402)
-
-            this_node_has_been_arranged = this_node.checksum_address in arranged_addresses
-            if not this_node_has_been_arranged:
+            if arranged_addresses is not None and this_node.checksum_address not in arranged_addresses:
                 this_node.suspicious_activities_witnessed['freeriders'].append((alice, f"The transaction {tx} does not list me as a Worker - it lists {arranged_addresses}."))
                 return Response(status=402)
+            payment_is_pending = arranged_addresses is None
         else:
             _tx = NO_BLOCKCHAIN_CONNECTION
             kfrag_bytes = cleartext
+            payment_is_pending = False
         kfrag = KFrag.from_bytes(kfrag_bytes)
 
         if not kfrag.verify(signing_pubkey=alices_verifying_key):
@@ -259,6 +326,12 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
             if not policy_arrangement.alice_verifying_key == alice.stamp.as_umbral_pubkey():
                 raise alice.SuspiciousActivity
             policy_arrangement.kfrag = kfrag
+            if payment_is_pending:
+                policy_arrangement.payment_transaction = tx
+
+        if payment_is_pending:
+            this_node.payment_tracker.track(transaction=tx, arrangement_id=id_as_hex)
+            return Response(status=202)
 
         # TODO: Sign the arrangement here.  #495
         return ""  # TODO: Return A 200, with whatever policy metadata.
@@ -289,27 +362,48 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
             log.info("KFrag successfully removed.")
             return Response(response='KFrag deleted!', status=200)
 
-    @rest_app.route('/kFrag/<id_as_hex>/reencrypt', methods=["POST"])
-    def reencrypt_via_rest(id_as_hex):
+    def _save_work_order(work_order) -> None:
+        # Note: we give the work order a random ID to store it under.
+        with datastore.describe(Workorder, str(uuid.uuid4()), writeable=True) as new_workorder:
+            new_workorder.arrangement_id = work_order.arrangement_id
+            new_workorder.bob_verifying_key = work_order.bob.stamp.as_umbral_pubkey()
+            new_workorder.bob_signature = work_order.receipt_signature
+
+    def _stream_and_save(cfrag_stream: Iterator[bytes], work_order) -> Iterator[bytes]:
+        yield from cfrag_stream
+        # Now that Bob has all of the cfrags, Ursula saves this workorder to her database.
+        _save_work_order(work_order)
+
+    def _reencrypt_work_order(id_as_hex: str, work_order_payload: bytes) -> Tuple[int, Union[bytes, Iterator[bytes]]]:
+        """
+        Re-encrypts the capsules of one work order against the KFrag of the arrangement `id_as_hex`.
+        Returns an HTTP status and either an error message or, for 200, an iterator of the cfrags
+        and signatures which does the re-encryption as it goes.
+        """
 
         # Get Policy Arrangement
         try:
             arrangement_id = binascii.unhexlify(id_as_hex)
         except (binascii.Error, TypeError):
-            return Response(response=b'Invalid arrangement ID', status=405)
+            return 405, b'Invalid arrangement ID'
         try:
             # Get KFrag
             # TODO: Yeah, well, what if this arrangement hasn't been enacted?  1702
             with datastore.describe(PolicyArrangement, id_as_hex) as policy_arrangement:
                 kfrag = policy_arrangement.kfrag
                 alice_verifying_key = policy_arrangement.alice_verifying_key
+                try:
+                    payment_transaction = policy_arrangement.payment_transaction
+                except AttributeError:
+                    payment_transaction = None
         except RecordNotFound:
-            return Response(response=arrangement_id, status=404)
+            return 404, arrangement_id
+        if payment_transaction is not None:
+            return 402, f"Payment {payment_transaction.hex()} for this policy isn't confirmed yet.".encode()
 
         # Get Work Order
         from nucypher.policy.collections import WorkOrder  # Avoid circular import
         alice_address = canonical_address_from_umbral_key(alice_verifying_key)
-        work_order_payload = request.data
         work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
                                                  rest_payload=work_order_payload,
                                                  ursula=this_node,
@@ -317,20 +411,74 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
         log.info(f"Work Order from {work_order.bob}, signed {work_order.receipt_signature}")
 
         # Re-encrypt
-        response = this_node._reencrypt(kfrag=kfrag,
-                                        work_order=work_order,
-                                        alice_verifying_key=alice_verifying_key)
+        try:
+            cfrag_stream = this_node._reencrypt_stream(kfrag=kfrag,
+                                                       work_order=work_order,
+                                                       alice_verifying_key=alice_verifying_key)
+        except ReencryptionPool.Busy:
+            return 503, b'Too many re-encryption requests; try again later.'
 
-        # Now, Ursula saves this workorder to her database...
-        # Note: we give the work order a random ID to store it under.
-        with datastore.describe(Workorder, str(uuid.uuid4()), writeable=True) as new_workorder:
-            new_workorder.arrangement_id = work_order.arrangement_id
-            new_workorder.bob_verifying_key = work_order.bob.stamp.as_umbral_pubkey()
-            new_workorder.bob_signature = work_order.receipt_signature
+        return 200, _stream_and_save(cfrag_stream, work_order)
 
+    @rest_app.route('/kFrag/<id_as_hex>/reencrypt', methods=["POST"])
+    def reencrypt_via_rest(id_as_hex):
+        status, response = _reencrypt_work_order(id_as_hex=id_as_hex, work_order_payload=request.data)
+        if status == 503:
+            return Response(response=response, status=status, headers={'Retry-After': str(REENCRYPTION_RETRY_AFTER)})
+        if status != 200:
+            return Response(response=response, status=status)
+        # Stream the cfrags, so that Bob can check each one while Ursula makes the next.
         headers = {'Content-Type': 'application/octet-stream'}
         return Response(headers=headers, response=response)
 
+    @rest_app.route('/reencrypt', methods=["POST"])
+    def reencrypt_batch_via_rest():
+        """
+        Re-encrypts several work orders, possibly for different arrangements, in one request.
+        Each work order gets its own status in the response, so one bad work order
+        doesn't spoil the rest of the batch.
+        """
+        try:
+            batch = work_order_batch_splitter.repeat(request.data)
+        except BytestringSplittingError:
+            return Response(response=b'Malformed work order batch', status=400)
+
+        results, busy = bytes(), False
+        for arrangement_id, work_order_payload in batch:
+            try:
+                status, response = _reencrypt_work_order(id_as_hex=bytes(arrangement_id).hex(),
+                                                         work_order_payload=bytes(work_order_payload))
+                if status == 200:
+                    response = bytes().join(response)
+            except ReencryptionPool.Busy:
+                status, response = 503, b'Re-encryption timed out; try again later.'
+            except InvalidSignature:
+                status, response = 401, b'Invalid work order signature'
+            except (BytestringSplittingError, ValueError) as e:
+                status, response = 400, f'Malformed work order: {e}'.encode()
+            results += status.to_bytes(2, byteorder='big') + VariableLengthBytestring(response)
+            busy = busy or status == 503
+
+        headers = {'Content-Type': 'application/octet-stream'}
+        if busy:
+            headers['Retry-After'] = str(REENCRYPTION_RETRY_AFTER)
+        return Response(headers=headers, response=results)
+
+    def _treasure_map_expiration(treasure_map) -> maya.MayaDT:
+        if not this_node.federated_only:
+            end_timestamp = this_node.policy_owners.lookup(treasure_map._hrac[:16]).end_timestamp
+            return maya.MayaDT(end_timestamp)
+
+        # Federated policies aren't recorded anywhere we can see, so keep the map for a while,
+        # or for as long as any arrangement the same Alice has made with us if that's longer.
+        expiration = maya.now().add(days=FEDERATED_TREASURE_MAP_LIFETIME_DAYS)
+        try:
+            with datastore.describe(PolicyOwner, bytes(treasure_map._verifying_key).hex()) as policy_owner:
+                expiration = max(expiration, policy_owner.latest_expiration)
+        except (RecordNotFound, AttributeError):
+            pass
+        return expiration
+
     @rest_app.route('/treasure_map/<treasure_map_id>')
     def provide_treasure_map(treasure_map_id):
         headers = {'Content-Type': 'application/octet-stream'}
@@ -383,44 +531,68 @@ def _make_rest_app(datastore: Datastore, this_node, serving_domains: Set[str], l
             return Response("Can't save a TreasureMap with this ID from you.", status=409)
 
         if do_store and not this_node.federated_only:
-            alice_checksum_address = this_node.policy_agent.contract.functions.getPolicyOwner(
-                treasure_map._hrac[:16]).call()
-            do_store = treasure_map.verify_blockchain_signature(checksum_address=alice_checksum_address)
+            try:
+                alice_checksum_address = this_node.policy_owners.owner(treasure_map._hrac[:16])
+            except PolicyOwnerCache.UnknownPolicy:
+                do_store = False
+            else:
+                do_store = treasure_map.verify_blockchain_signature(checksum_address=alice_checksum_address)
 
         if do_store:
             log.info("{} storing TreasureMap {}".format(this_node, treasure_map_id))
-            this_node.treasure_maps[treasure_map_index] = treasure_map
+            this_node.treasure_maps.store(map_id=treasure_map_index,
+                                          treasure_map=treasure_map,
+                                          expiration=_treasure_map_expiration(treasure_map))
             return Response(bytes(treasure_map), status=202)
         else:
             log.info("Bad TreasureMap ID; not storing {}".format(treasure_map_id))
             return Response("This TreasureMap doesn't match a paid Policy.", status=402)
 
+    def render_status_page() -> str:
+        previous_states = list(reversed(this_node.known_nodes.states.values()))[:5]
+        # Mature every known node before rendering.
+        for node in this_node.known_nodes:
+            node.mature()
+
+        try:
+            return status_template.render(this_node=this_node,
+                                          known_nodes=this_node.known_nodes,
+                                          previous_states=previous_states,
+                                          domains=serving_domains,
+                                          version=nucypher.__version__,
+                                          checksum_address=this_node.checksum_address)
+        except Exception as e:
+            log.debug("Template Rendering Exception: ".format(str(e)))
+            raise TemplateError(str(e)) from e
+
     @rest_app.route('/status/', methods=['GET'])
     def status():
 
         if request.args.get('json'):
-            payload = this_node.abridged_node_details()
+            if 'page' in request.args:
+                try:
+                    page = int(request.args['page'])
+                    per_page = int(request.args.get('per_page', StatusPage.DEFAULT_PAGE_SIZE))
+                except ValueError:
+                    return Response("page and per_page must be integers.", status=400)
+                if page < 1 or not 0 < per_page <= StatusPage.MAX_PAGE_SIZE:
+                    return Response(f"page must be at least 1, and per_page from 1 to {StatusPage.MAX_PAGE_SIZE}.",
+                                    status=400)
+                payload = this_node.abridged_node_details(page=page, per_page=per_page)
+            else:
+                payload = this_node.abridged_node_details()
             response = jsonify(payload)
-            return response
+            response.add_etag()
+            return response.make_conditional(request)
 
         else:
             headers = {"Content-Type": "text/html", "charset": "utf-8"}
-            previous_states = list(reversed(this_node.known_nodes.states.values()))[:5]
-            # Mature every known node before rendering.
-            for node in this_node.known_nodes:
-                node.mature()
-
-            try:
-                content = status_template.render(this_node=this_node,
-                                                 known_nodes=this_node.known_nodes,
-                                                 previous_states=previous_states,
-                                                 domains=serving_domains,
-                                                 version=nucypher.__version__,
-                                                 checksum_address=this_node.checksum_address)
-            except Exception as e:
-                log.debug("Template Rendering Exception: ".format(str(e)))
-                raise TemplateError(str(e)) from e
-            return Response(response=content, headers=headers)
+            # Rendered again only once the fleet state changes or the last rendering gets old.
+            snapshot = this_node.status_page.current(fleet_checksum=this_node.known_nodes.checksum,
+                                                     render=render_status_page)
+            response = Response(response=snapshot.content, headers=headers)
+            response.set_etag(snapshot.etag)
+            return response.make_conditional(request)
 
     return rest_app
 
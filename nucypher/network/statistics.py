@@ -0,0 +1,122 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from collections import Counter
+from threading import Lock
+from typing import Callable, Iterable, NamedTuple, Optional
+
+ROUTE_ENVIRON_KEY = 'nucypher.route'
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class RESTObservation(NamedTuple):
+    route: str  # The route's template, like /kFrag/<id_as_hex>/reencrypt, never the path itself
+    method: str
+    status: str
+    seconds: float  # From the request's arrival until the last byte of the response was handed over
+    request_bytes: int
+    response_bytes: int
+
+
+class RESTStatistics:
+    """
+    Counts of the requests Ursula's REST server has answered, by route, method and status; kept free of any
+    metrics library.  Each request is also passed, as a RESTObservation, to the `observer` if there is one.
+    """
+
+    def __init__(self):
+        self.requests = Counter()  # (route, method, status) -> count
+        self.observer = None  # type: Optional[Callable[[RESTObservation], None]]
+        self._lock = Lock()
+
+    def record(self, observation: RESTObservation) -> None:
+        with self._lock:
+            self.requests[(observation.route, observation.method, observation.status)] += 1
+        observer = self.observer
+        if observer:
+            observer(observation)
+
+
+class RESTStatisticsMiddleware:
+    """
+    WSGI middleware that times each request, and counts the bytes in and out, for `statistics`.
+
+    The route is read from the environ, where the app should put it (under ROUTE_ENVIRON_KEY) once it knows.
+    A request is recorded once its response has been sent, or closed, whichever is first; so a streamed
+    response is timed until its last byte.
+    """
+
+    def __init__(self, app: Callable, statistics: Callable[[], RESTStatistics]):
+        self.app = app
+        self.statistics = statistics
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        started = time.perf_counter()
+        status = None
+
+        def start_response_and_note_status(status_line, headers, exc_info=None):
+            nonlocal status
+            status = status_line.split(' ', 1)[0]
+            return start_response(status_line, headers, exc_info)
+
+        body = self.app(environ, start_response_and_note_status)
+        return _MeasuredBody(body=body,
+                             finish=lambda response_bytes: self.statistics().record(RESTObservation(
+                                 route=environ.get(ROUTE_ENVIRON_KEY) or UNMATCHED_ROUTE,
+                                 method=environ.get('REQUEST_METHOD', ''),
+                                 status=status or '',
+                                 seconds=time.perf_counter() - started,
+                                 request_bytes=_content_length(environ),
+                                 response_bytes=response_bytes)))
+
+
+class _MeasuredBody:
+
+    def __init__(self, body: Iterable[bytes], finish: Callable[[int], None]):
+        self.__body = body
+        self.__finish = finish
+        self.__finished = False
+        self.__bytes = 0
+
+    def __iter__(self):
+        try:
+            for chunk in self.__body:
+                self.__bytes += len(chunk)
+                yield chunk
+        finally:
+            self.__done()
+
+    def close(self) -> None:
+        try:
+            close = getattr(self.__body, 'close', None)
+            if close:
+                close()
+        finally:
+            self.__done()
+
+    def __done(self) -> None:
+        if not self.__finished:
+            self.__finished = True
+            self.__finish(self.__bytes)
+
+
+def _content_length(environ: dict) -> int:
+    try:
+        return max(int(environ.get('CONTENT_LENGTH') or 0), 0)
+    except ValueError:
+        return 0
@@ -0,0 +1,72 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import time
+from threading import Lock
+from typing import Callable, NamedTuple, Optional
+
+
+class StatusSnapshot(NamedTuple):
+    content: str
+    etag: str
+    fleet_checksum: str
+    taken: float
+
+
+class StatusPage:
+    """
+    Holds the last rendering of a node's status page, so that viewing it doesn't cost a render each time.
+
+    The page is rendered again when the fleet state it shows is no longer the node's, or once it is `max_age`
+    seconds old (so that what changes without changing the fleet state, like when nodes were last seen,
+    doesn't go stale for long).  Requests that arrive while it is being rendered wait for that rendering.
+    """
+
+    DEFAULT_MAX_AGE = 30  # seconds
+    DEFAULT_PAGE_SIZE = 100  # nodes
+    MAX_PAGE_SIZE = 1000
+
+    def __init__(self, max_age: float = None, clock: Callable[[], float] = time.monotonic):
+        self.max_age = max_age if max_age is not None else self.DEFAULT_MAX_AGE
+        self._clock = clock
+        self.__lock = Lock()
+        self.__snapshot = None  # type: Optional[StatusSnapshot]
+        self.renders = 0
+
+    def current(self, fleet_checksum: str, render: Callable[[], str]) -> StatusSnapshot:
+        """Returns the snapshot for `fleet_checksum`, calling `render` for a new one if it's missing or too old."""
+        with self.__lock:
+            now = self._clock()
+            snapshot = self.__snapshot
+            if snapshot is None or snapshot.fleet_checksum != fleet_checksum or now - snapshot.taken >= self.max_age:
+                content = render()
+                snapshot = StatusSnapshot(content=content,
+                                          etag=etag_of(content),
+                                          fleet_checksum=fleet_checksum,
+                                          taken=now)
+                self.__snapshot = snapshot
+                self.renders += 1
+            return snapshot
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__snapshot = None
+
+
+def etag_of(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
@@ -16,12 +16,16 @@
 """
 
 import random
+from threading import Lock
 
 import maya
-from twisted.internet import reactor
+from twisted.internet import reactor, threads
 from twisted.internet.task import LoopingCall
-from typing import Union
+from typing import Set, Union
+from web3.exceptions import TransactionNotFound
 
+from nucypher.datastore.datastore import DatastoreTransactionError, RecordNotFound
+from nucypher.datastore.models import PolicyArrangement
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nodes import NodeSprout
@@ -251,3 +255,118 @@ class AvailabilityTracker:
                 self.record(False, reason={'failed': f"{ursula_or_sprout.checksum_address} reported unavailability."})
             else:
                 self.record(None, reason={"error": f"{ursula_or_sprout.checksum_address} returned {response.status_code} from 'ping' endpoint."})
+
+
+class PolicyPaymentTracker:
+    """
+    Watches the transactions with which Alices paid for the kfrags they sent this Ursula.
+
+    Rather than waiting for each receipt in the request thread, `set_policy` stores the kfrag as
+    pending under its payment transaction and hands the transaction to this tracker.  A single loop
+    checks the receipts of all pending transactions; when one is mined, its kfrags are activated if it
+    lists this node and deleted if it doesn't.  Transactions not mined within `PAYMENT_TIMEOUT`
+    are treated as unpaid.
+    """
+
+    INTERVAL = 5  # Seconds
+    PAYMENT_TIMEOUT = 60 * 10
+
+    def __init__(self, ursula, payment_timeout: int = None):
+        self.log = Logger(self.__class__.__name__)
+        self._ursula = ursula
+        self.payment_timeout = payment_timeout or self.PAYMENT_TIMEOUT
+        self.__pending = dict()  # transaction -> (first seen, arrangement IDs)
+        self.__lock = Lock()
+        self._task = LoopingCall(lambda: threads.deferToThread(self.check_payments))
+
+    @property
+    def running(self) -> bool:
+        return self._task.running
+
+    @property
+    def pending(self) -> int:
+        """The number of arrangements waiting for their payment to be mined."""
+        with self.__lock:
+            return sum(len(arrangement_ids) for _since, arrangement_ids in self.__pending.values())
+
+    def start(self, now: bool = False) -> None:
+        if not self.running:
+            self.__load_pending()
+            d = self._task.start(interval=self.INTERVAL, now=now)
+            d.addErrback(self.handle_tracking_errors)
+
+    def stop(self) -> None:
+        if self.running:
+            self._task.stop()
+
+    def handle_tracking_errors(self, failure) -> None:
+        cleaned_traceback = failure.getTraceback().replace('{', '').replace('}', '')
+        self.log.warn(f"Unhandled error while checking policy payments: {cleaned_traceback}")
+        if not self.running:
+            self.start(now=False)
+
+    def track(self, transaction: bytes, arrangement_id: str) -> None:
+        """Waits for `transaction` to be mined before serving the kfrag of arrangement `arrangement_id`."""
+        with self.__lock:
+            _since, arrangement_ids = self.__pending.setdefault(bytes(transaction), (self._task.clock.seconds(), set()))
+            arrangement_ids.add(arrangement_id)
+
+    def __load_pending(self) -> None:
+        """Picks up the payments that were still pending when the node last stopped."""
+        try:
+            with self._ursula.datastore.query_by(PolicyArrangement, filter_field='payment_transaction') as pending:
+                transactions = [(arrangement.payment_transaction, arrangement._record_id) for arrangement in pending]
+        except RecordNotFound:
+            return
+        for transaction, arrangement_id in transactions:
+            self.track(transaction=transaction, arrangement_id=str(arrangement_id))
+
+    def check_payments(self) -> None:
+        with self.__lock:
+            pending = list(self.__pending.items())
+
+        now = self._task.clock.seconds()
+        policy_agent = self._ursula.policy_agent
+        for transaction, (since, arrangement_ids) in pending:
+            try:
+                arranged_addresses = policy_agent.fetch_arrangement_addresses_from_mined_policy_txid(transaction)
+            except TransactionNotFound:
+                arranged_addresses = None  # Dropped, perhaps; it may yet come back.
+            if arranged_addresses is None:
+                if now - since < self.payment_timeout:
+                    continue  # Not mined yet
+                self.__reject(transaction, f"No transaction matching {transaction.hex()}.")
+            elif self._ursula.checksum_address in arranged_addresses:
+                self.__activate(transaction)
+            else:
+                self.__reject(transaction, f"The transaction {transaction.hex()} does not list me as a Worker - "
+                                           f"it lists {arranged_addresses}.")
+
+    def __pop(self, transaction: bytes) -> Set[str]:
+        with self.__lock:
+            _since, arrangement_ids = self.__pending.pop(transaction)
+        return arrangement_ids
+
+    def __activate(self, transaction: bytes) -> None:
+        for arrangement_id in self.__pop(transaction):
+            try:
+                with self._ursula.datastore.describe(PolicyArrangement, arrangement_id, writeable=True) as arrangement:
+                    arrangement.payment_transaction = None
+            except DatastoreTransactionError:
+                self.log.debug(f"Arrangement {arrangement_id} was gone before its payment was confirmed.")
+            else:
+                self.log.info(f"Payment confirmed for arrangement {arrangement_id}.")
+
+    def __reject(self, transaction: bytes, reason: str) -> None:
+        from nucypher.characters.lawful import Alice
+        for arrangement_id in self.__pop(transaction):
+            try:
+                with self._ursula.datastore.describe(PolicyArrangement, arrangement_id, writeable=True) as arrangement:
+                    alice_verifying_key = arrangement.alice_verifying_key
+                    arrangement.kfrag = None
+                    arrangement.payment_transaction = None
+            except DatastoreTransactionError:
+                continue
+            alice = Alice.stranger_from_public_keys(verifying_key=alice_verifying_key)
+            self._ursula.suspicious_activities_witnessed['freeriders'].append((alice, reason))
+            self.log.info(f"Deleted the kfrag for arrangement {arrangement_id}: {reason}")
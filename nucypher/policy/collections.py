@@ -34,7 +34,7 @@ from nucypher.crypto.api import encrypt_and_sign, keccak_digest
 from nucypher.crypto.api import verify_eip_191
 from nucypher.crypto.constants import KECCAK_DIGEST_LENGTH, PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
-from nucypher.crypto.signing import InvalidSignature, Signature, signature_splitter
+from nucypher.crypto.signing import InvalidSignature, Signature, signature_splitter, verify_signatures
 from nucypher.crypto.splitters import capsule_splitter, cfrag_splitter, key_splitter
 from nucypher.crypto.utils import (canonical_address_from_umbral_key,
                                    get_coordinates_as_bytes,
@@ -471,15 +471,17 @@ class WorkOrder:
         if ursula._stamp_has_valid_signature_by_worker():
             ursula_identity_evidence = ursula.decentralized_identity_evidence
 
+        # Each task signature has to match the original specification
+        signatures_and_specifications = list()
         for task in tasks.values():
-            # Each task signature has to match the original specification
             specification = task.get_specification(ursula.stamp,
                                                    alice_address,
                                                    blockhash,
                                                    ursula_identity_evidence)
+            signatures_and_specifications.append((task.signature, specification))
 
-            if not task.signature.verify(specification, bob_verifying_key):
-                raise InvalidSignature()
+        if not verify_signatures(signatures_and_specifications, bob_verifying_key):
+            raise InvalidSignature()
 
         # Check receipt
         capsules = b''.join(map(bytes, tasks.keys()))
@@ -487,7 +489,7 @@ class WorkOrder:
         if not signature.verify(receipt_bytes, bob_verifying_key):
             raise InvalidSignature()
 
-        bob = Bob.from_public_keys(verifying_key=bob_verifying_key)
+        bob = Bob.stranger_from_public_keys(verifying_key=bob_verifying_key)
         return cls(bob=bob,
                    ursula=ursula,
                    arrangement_id=arrangement_id,
@@ -504,13 +506,24 @@ class WorkOrder:
         return bytes(self.receipt_signature) + self.bob.stamp + self.blockhash + tasks_bytes
 
     def complete(self, cfrags_and_signatures):
-        good_cfrags = []
-        if not len(self) == len(cfrags_and_signatures):
-            raise ValueError("Ursula gave back the wrong number of cfrags. She's up to something.")
+        """
+        Checks Ursula's cfrags and signatures and, if all is well, attaches them to the tasks.
+        `cfrags_and_signatures` may be any iterable, such as a stream from RestMiddleware.reencrypt_stream;
+        each cfrag is checked as soon as it arrives.
+        """
+        wrong_number_of_cfrags = ValueError("Ursula gave back the wrong number of cfrags. She's up to something.")
+        if hasattr(cfrags_and_signatures, '__len__') and not len(self) == len(cfrags_and_signatures):
+            raise wrong_number_of_cfrags
 
         ursula_verifying_key = self.ursula.stamp.as_umbral_pubkey()
 
-        for task, (cfrag, cfrag_signature) in zip(self.tasks.values(), cfrags_and_signatures):
+        tasks = iter(self.tasks.values())
+        verified_results = []
+        for cfrag, cfrag_signature in cfrags_and_signatures:
+            task = next(tasks, None)
+            if task is None:
+                raise wrong_number_of_cfrags
+
             # Validate re-encryption metadata
             metadata_input = bytes(task.signature)
             metadata_as_signature = Signature.from_bytes(cfrag.proof.metadata)
@@ -520,16 +533,19 @@ class WorkOrder:
 
             # Validate re-encryption signatures
             if cfrag_signature.verify(bytes(cfrag), ursula_verifying_key):
-                good_cfrags.append(cfrag)
+                verified_results.append((task, cfrag, cfrag_signature))
             else:
                 raise InvalidSignature(f"{cfrag} is not properly signed by Ursula.")
                 # TODO: Instead of raising, we should do something (#957)
 
-        for task, (cfrag, cfrag_signature) in zip(self.tasks.values(), cfrags_and_signatures):
+        if not len(verified_results) == len(self):
+            raise wrong_number_of_cfrags
+
+        for task, cfrag, cfrag_signature in verified_results:
             task.attach_work_result(cfrag, cfrag_signature)
 
         self.completed = maya.now()
-        return good_cfrags
+        return [cfrag for _task, cfrag, _signature in verified_results]
 
     def sanitize(self):
         for task in self.tasks.values():
@@ -0,0 +1,101 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from threading import Lock
+from typing import NamedTuple
+
+from eth_typing import ChecksumAddress
+from lru import LRU
+
+from nucypher.blockchain.eth.agents import PolicyManagerAgent
+from nucypher.blockchain.eth.constants import NULL_ADDRESS
+from nucypher.blockchain.eth.events import ContractEventsThrottler
+
+
+class PolicyOwner(NamedTuple):
+    owner: ChecksumAddress
+    end_timestamp: int
+
+
+class PolicyOwnerCache:
+    """
+    A bounded, least-recently-used cache of the owner and end of on-chain policies, keyed by policy ID.
+
+    Neither changes once a policy is created, so a policy is only read from PolicyManager the first
+    time it is looked up, or not at all if the cache was warmed from `PolicyCreated` events.
+    """
+
+    DEFAULT_SIZE = 10000
+
+    class UnknownPolicy(ValueError):
+        """Raised when PolicyManager has no policy with the given ID (yet)."""
+
+    def __init__(self, policy_agent: PolicyManagerAgent, size: int = DEFAULT_SIZE):
+        self.policy_agent = policy_agent
+        self._policies = LRU(size)
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._policies)
+
+    def __cache(self, policy_id: bytes, sponsor: ChecksumAddress, owner: ChecksumAddress, end_timestamp: int) -> PolicyOwner:
+        # Matches PolicyManager.getPolicyOwner: the sponsor owns the policy unless someone else was named.
+        policy = PolicyOwner(owner=sponsor if owner == NULL_ADDRESS else owner, end_timestamp=end_timestamp)
+        with self._lock:
+            self._policies[bytes(policy_id)] = policy
+        return policy
+
+    def lookup(self, policy_id: bytes) -> PolicyOwner:
+        with self._lock:
+            policy = self._policies.get(bytes(policy_id))
+            if policy is not None:
+                self.hits += 1
+                return policy
+            self.misses += 1
+
+        _disabled, sponsor, owner, _fee_rate, _start, end_timestamp, *_reserved = self.policy_agent.fetch_policy(policy_id)
+        if sponsor == NULL_ADDRESS:
+            # Not cached, since the policy may yet be created.
+            raise self.UnknownPolicy(f"No policy {bytes(policy_id).hex()} in PolicyManager.")
+        return self.__cache(policy_id, sponsor=sponsor, owner=owner, end_timestamp=end_timestamp)
+
+    def owner(self, policy_id: bytes) -> ChecksumAddress:
+        return self.lookup(policy_id).owner
+
+    def warm(self, from_block: int, to_block: int = None) -> int:
+        """Caches every policy created between the two blocks, returning how many there were."""
+        to_block = to_block or self.policy_agent.blockchain.client.block_number
+        if to_block <= from_block:
+            return 0
+        events = ContractEventsThrottler(agent=self.policy_agent,
+                                         event_name='PolicyCreated',
+                                         from_block=from_block,
+                                         to_block=to_block)
+        warmed = 0
+        for event_record in events:
+            self.__cache(event_record.args['policyId'],
+                         sponsor=event_record.args['sponsor'],
+                         owner=event_record.args['owner'],
+                         end_timestamp=event_record.args['endTimestamp'])
+            warmed += 1
+        return warmed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._policies.clear()
@@ -19,18 +19,20 @@ import time
 import random
 from abc import ABC, abstractmethod
 from collections import OrderedDict, deque
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, wait
 from queue import Queue
+from threading import Lock
 from typing import Callable
 from typing import Generator, List, Set
 
 import maya
-from twisted.internet import reactor
 from twisted.internet.defer import ensureDeferred, Deferred
-from twisted.python.threadpool import ThreadPool
+from twisted.python.failure import Failure
 
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
 from constant_sorrow.constants import NOT_SIGNED, UNKNOWN_KFRAG
-from typing import Generator, List, Set, Optional
+from typing import Dict, Generator, List, Set, Optional
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
@@ -42,6 +44,7 @@ from nucypher.crypto.constants import PUBLIC_KEY_LENGTH
 from nucypher.crypto.kits import RevocationKit
 from nucypher.crypto.powers import DecryptingPower, SigningPower, TransactingPower
 from nucypher.crypto.utils import construct_policy_id
+from nucypher.network.engagement import EngagementExecutor, EngagementTimeout, get_engagement_executor
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 from nucypher.utilities.logging import Logger
@@ -98,7 +101,7 @@ class Arrangement:
     def from_bytes(cls, arrangement_as_bytes):
         alice_verifying_key, arrangement_id, expiration_bytes = cls.splitter(arrangement_as_bytes)
         expiration = maya.MayaDT.from_iso8601(iso8601_string=expiration_bytes.decode())
-        alice = Alice.from_public_keys(verifying_key=alice_verifying_key)
+        alice = Alice.stranger_from_public_keys(verifying_key=alice_verifying_key)
         return cls(alice=alice, arrangement_id=arrangement_id, expiration=expiration)
 
     def encrypt_payload_for_ursula(self):
@@ -178,6 +181,9 @@ class NodeEngagementMutex:
        release.
 
     TODO: Make registry per... I guess Policy?  It's weird to be able to accidentally enact again.
+
+    Nodes are engaged in the process's shared EngagementExecutor, taking turns with other mutexes and policies,
+    rather than in threads of the mutex's own.
     """
     log = Logger("Policy")
 
@@ -187,7 +193,7 @@ class NodeEngagementMutex:
                  network_middleware,
                  percent_to_complete_before_release=5,
                  note=None,
-                 threadpool_size=120,
+                 executor: EngagementExecutor = None,
                  *args,
                  **kwargs):
         self.f = callable_to_engage
@@ -201,6 +207,7 @@ class NodeEngagementMutex:
 
         self._started = False
         self._finished = False
+        self.__finalizing_lock = Lock()
 
         self.percent_to_complete_before_release = percent_to_complete_before_release
         self._partial_queue = Queue()
@@ -215,8 +222,7 @@ class NodeEngagementMutex:
         else:
             self._repr = f"{note}: {callable_to_engage} to {len(nodes)} nodes"
 
-        self._threadpool = ThreadPool(minthreads=threadpool_size, maxthreads=threadpool_size, name=self._repr)
-        self.log.info(f"NEM spinning up {self._threadpool}")
+        self._executor = executor or get_engagement_executor()
 
     def __repr__(self):
         return self._repr
@@ -235,9 +241,10 @@ class NodeEngagementMutex:
     def block_until_complete(self):
         if self.total_disposed() < len(self.nodes):
             _ = self._completion_queue.get()  # Interesting opportuntiy to pass some data, like the list of contacted nodes above.
-        if not reactor.running and not self._threadpool.joined:
-            # If the reactor isn't running, the user *must* call this, because this is where we stop.
-            self._threadpool.stop()
+
+    def cancel(self) -> None:
+        """Gives up on the nodes not yet engaged; they're counted as failed."""
+        self._executor.cancel(group=self)
 
     def _handle_success(self, response, node):
         if response.status_code == 202:
@@ -252,6 +259,7 @@ class NodeEngagementMutex:
                 self.nodes_contacted_during_partial_block = contacted
                 self.log.debug(f"Blocked for a little while, completed {contacted} nodes")
                 self._partial_queue.put(contacted)
+                self._consider_finalizing()  # It may also have been the last, if the others failed.
         return response
 
     def _handle_error(self, failure, node):
@@ -263,17 +271,16 @@ class NodeEngagementMutex:
         return len(self.completed) + len(self.failed)
 
     def _consider_finalizing(self):
-        if not self._finished:
-            if self.total_disposed() == len(self.nodes):
-                # TODO: Consider whether this can possibly hang.
-                self._finished = True
-                if reactor.running:
-                    reactor.callInThread(self._threadpool.stop)
-                self._completion_queue.put(self.completed)
-                self.when_complete.callback(self.completed)
-                self.log.info(f"{self} finished.")
-        else:
-            raise RuntimeError("Already finished.")
+        with self.__finalizing_lock:  # Nodes are engaged in many threads at once.
+            if self._finished:
+                raise RuntimeError("Already finished.")
+            if self.total_disposed() < len(self.nodes):
+                return
+            # TODO: Consider whether this can possibly hang.
+            self._finished = True
+        self._completion_queue.put(self.completed)
+        self.when_complete.callback(self.completed)
+        self.log.info(f"{self} finished.")
 
     def _engage_node(self, node):
         maybe_coro = self.f(node, network_middleware=self.network_middleware, *self.args, **self.kwargs)
@@ -283,14 +290,20 @@ class NodeEngagementMutex:
         d.addErrback(self._handle_error, node)
         return d
 
+    def _note_cancellation(self, node, engagement: Future):
+        if engagement.cancelled():
+            self._handle_error(Failure(CancelledError()), node)
+
     def start(self):
         if self._started:
             raise RuntimeError("Already started.")
         self._started = True
-        self.log.info(f"NEM Starting {self._threadpool}")
+        self.log.info(f"NEM Starting {self}")
         for node in self.nodes:
-             self._threadpool.callInThread(self._engage_node, node)
-        self._threadpool.start()
+            engagement = self._executor.submit(partial(self._engage_node, node),
+                                               node_id=node.checksum_address,
+                                               group=self)
+            engagement.add_done_callback(partial(self._note_cancellation, node))
 
 
 class Policy(ABC):
@@ -311,6 +324,11 @@ class Policy(ABC):
 
     log = Logger("Policy")
 
+    PROPOSAL_CONCURRENCY = 10  # arrangements proposed at once
+    PROPOSAL_TIMEOUT = 60  # seconds for all the arrangements of a policy to be proposed and answered
+    ENACTMENT_TIMEOUT = 30  # seconds for kfrags to be sent
+    ENACTED_STATUSES = (200, 202)
+
     class Rejected(RuntimeError):
         """Too many Ursulas rejected"""
 
@@ -343,6 +361,7 @@ class Policy(ABC):
 
         self._enacted_arrangements = OrderedDict()
         self._published_arrangements = OrderedDict()
+        self._enactments = dict()  # type: Dict[Future, Arrangement]
 
         self.alice_signature = alice_signature  # TODO: This is unused / To Be Implemented?
 
@@ -450,62 +469,135 @@ class Policy(ABC):
         """
         Assign kfrags to ursulas_on_network, and distribute them via REST,
         populating enacted_arrangements
+
+        KFrags are sent concurrently, in the process's shared EngagementExecutor, and this returns as soon as
+        m Ursulas have their kfrags (or every Ursula has answered, or ENACTMENT_TIMEOUT has passed); the rest
+        are still sent in the background.  Call block_until_enacted to wait for them too, and to hear about
+        Ursulas among them who claim we didn't pay.
         """
+        executor = get_engagement_executor()
         for arrangement in self.__assign_kfrags():
             arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
-
-            try:
-                # TODO: Concurrency
-                response = network_middleware.enact_policy(arrangement.ursula,
-                                                           arrangement.id,
-                                                           arrangement_message_kit.to_bytes())
-            except network_middleware.UnexpectedResponse as e:
-                arrangement.status = e.status
-            else:
-                arrangement.status = response.status_code
+            enactment = executor.submit(partial(network_middleware.enact_policy,
+                                                arrangement.ursula,
+                                                arrangement.id,
+                                                arrangement_message_kit.to_bytes()),
+                                        node_id=arrangement.ursula.checksum_address,
+                                        group=self,
+                                        timeout=self.ENACTMENT_TIMEOUT)
+            enactment.add_done_callback(partial(self.__note_enactment, arrangement, network_middleware))
+            self._enactments[enactment] = arrangement
 
             # TODO: Handle problem here - if the arrangement is bad, deal with it.
             self.treasure_map.add_arrangement(arrangement)
 
-        else:
-            # OK, let's check: if two or more Ursulas claimed we didn't pay,
-            # we need to re-evaulate our situation here.
-            arrangement_statuses = [a.status for a in self._accepted_arrangements]
-            number_of_claims_of_freeloading = sum(status == 402 for status in arrangement_statuses)
-
-            if number_of_claims_of_freeloading > 2:
-                raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+        self.__block_for_enactments(until_enacted=self.treasure_map.m)
 
+        try:
+            self.__check_for_claims_of_freeloading()
             self.treasure_map.check_for_sufficient_destinations()
+        except Exception:
+            executor.cancel(group=self)  # Don't bother sending the rest of the kfrags of a failed policy.
+            raise
 
-            # TODO: Leave a note to try any failures later.
-            pass
+        # TODO: Leave a note to try any failures later.
+        pass
 
-            # ...After *all* the arrangements are enacted
-            # Create Alice's revocation kit
-            self.revocation_kit = RevocationKit(self, self.alice.stamp)
-            self.alice.add_active_policy(self)
+        # ...After enough of the arrangements are enacted
+        # Create Alice's revocation kit
+        self.revocation_kit = RevocationKit(self, self.alice.stamp)
+        self.alice.add_active_policy(self)
 
-            if publish_treasure_map is True:
-                return self.publish_treasure_map(network_middleware=network_middleware)  # TODO: blockchain_signer?
+        if publish_treasure_map is True:
+            return self.publish_treasure_map(network_middleware=network_middleware)  # TODO: blockchain_signer?
 
-    def propose_arrangement(self, network_middleware, ursula, arrangement) -> bool:
-        negotiation_response = network_middleware.propose_arrangement(arrangement=arrangement)
+    def block_until_enacted(self, timeout: float = None) -> dict:
+        """
+        Waits until every kfrag has been sent (or failed to be), or for `timeout` seconds;
+        returns the status of each enacted arrangement, by arrangement, for those that were sent.
+        Raises Alice.NotEnoughNodes if, by then, too many Ursulas claim we didn't pay.
+        """
+        self.__block_for_enactments(until_enacted=None, timeout=timeout)
+        self.__check_for_claims_of_freeloading()
+        return {arrangement: arrangement.status for arrangement in self._enactments.values()
+                if arrangement.status is not None}
+
+    def __block_for_enactments(self, until_enacted: Optional[int], timeout: float = None) -> None:
+        timeout = timeout if timeout is not None else self.ENACTMENT_TIMEOUT
+        deadline = time.monotonic() + timeout
+        pending = {enactment for enactment in self._enactments if not enactment.done()}
+        while pending:
+            if until_enacted is not None:
+                enacted = sum(self.__enactment_status(e) in self.ENACTED_STATUSES
+                              for e in self._enactments if e.done())
+                if enacted >= until_enacted:
+                    break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.log.warn(f"Gave up waiting for {len(pending)} kfrags of {self} to be sent after {timeout} seconds.")
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for enactment in done:
+                arrangement = self._enactments[enactment]
+                arrangement.status = self.__enactment_status(enactment)
 
-        # TODO: check out the response: need to assess the result and see if we're actually good to go.
-        arrangement_is_accepted = negotiation_response.status_code == 200
+    def __claims_of_freeloading(self) -> int:
+        return sum(arrangement.status == 402 for arrangement in self._enactments.values())
+
+    def __check_for_claims_of_freeloading(self) -> None:
+        # OK, let's check: if two or more Ursulas claimed we didn't pay,
+        # we need to re-evaulate our situation here.
+        if self.__claims_of_freeloading() > 2:
+            raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+
+    @staticmethod
+    def __enactment_status(enactment: Future) -> Optional[int]:
+        try:
+            response = enactment.result()
+        except RestMiddleware.UnexpectedResponse as e:
+            return e.status
+        except (*NodeSeemsToBeDown, EngagementTimeout, CancelledError):
+            return None
+        return response.status_code
+
+    def __note_enactment(self, arrangement: Arrangement, network_middleware, enactment: Future) -> None:
+        arrangement.status = self.__enactment_status(enactment)
+        if arrangement.status not in self.ENACTED_STATUSES and not enactment.cancelled():
+            self.log.warn(f"Failed to send a kfrag of {self} to {arrangement.ursula}: "
+                          f"{arrangement.status or enactment.exception()}")
+        if arrangement.status == 402 and self.__claims_of_freeloading() > 2:
+            # Whoever waits in block_until_enacted hears about it; don't bother sending the rest.
+            self.log.warn(f"Too many Ursulas claim {self} wasn't paid for; not sending the rest of its kfrags.")
+            get_engagement_executor().cancel(group=self)
 
+    def propose_arrangement(self, network_middleware, ursula, arrangement) -> bool:
+        arrangement_is_accepted = self._consider_arrangement(network_middleware=network_middleware,
+                                                             arrangement=arrangement)
         bucket = self._accepted_arrangements if arrangement_is_accepted else self._rejected_arrangements
         bucket.add(arrangement)
 
         return arrangement_is_accepted
 
+    @staticmethod
+    def _consider_arrangement(network_middleware, arrangement) -> bool:
+        negotiation_response = network_middleware.propose_arrangement(arrangement=arrangement)
+
+        # TODO: check out the response: need to assess the result and see if we're actually good to go.
+        return negotiation_response.status_code == 200
+
     def make_arrangements(self,
                           network_middleware: RestMiddleware,
                           handpicked_ursulas: Optional[Set[Ursula]] = None,
                           discover_on_this_thread: bool = True,
+                          max_concurrency: int = None,
+                          timeout: float = None,
                           *args, **kwargs,
                           ) -> None:
+        """
+        Samples n Ursulas (besides any handpicked ones) and proposes an arrangement to each, up to
+        `max_concurrency` at once.  Ursulas that reject their arrangement, or can't be reached, are replaced
+        by others until n have accepted or `timeout` seconds have passed.
+        """
 
         sampled_ursulas = self.sample(handpicked_ursulas=handpicked_ursulas,
                                       discover_on_this_thread=discover_on_this_thread)
@@ -517,9 +609,11 @@ class Policy(ABC):
                  know which nodes to use.  Either pass them here or when you make ' \
                  the Policy.".format(self.n))
 
-        # TODO: One of these layers needs to add concurrency.
         self._propose_arrangements(network_middleware=network_middleware,
                                    candidate_ursulas=sampled_ursulas,
+                                   max_concurrency=max_concurrency,
+                                   timeout=timeout,
+                                   discover_on_this_thread=discover_on_this_thread,
                                    *args, **kwargs)
 
         if len(self._accepted_arrangements) < self.n:
@@ -554,38 +648,109 @@ class Policy(ABC):
                               network_middleware: RestMiddleware,
                               candidate_ursulas: Set[Ursula],
                               consider_everyone: bool = False,
+                              max_concurrency: int = None,
+                              timeout: float = None,
+                              discover_on_this_thread: bool = False,
                               *args,
                               **kwargs) -> None:
+        """
+        Proposes arrangements to `candidate_ursulas`, up to `max_concurrency` at a time (in the process's shared
+        EngagementExecutor), until n have been accepted (or, with `consider_everyone`, until every candidate has
+        answered), or until `timeout` seconds have passed.  Only as many proposals as are still needed are outstanding at once; when one is rejected
+        or its Ursula seems to be down, it is replaced by a candidate not yet asked - one of the spares among
+        `candidate_ursulas` if there are any, or else a newly sampled one.
+
+        Proposals still unanswered at the deadline are abandoned; their arrangements are neither accepted
+        nor rejected.  Candidates that were never asked are kept as spares.
+        """
+        max_concurrency = max_concurrency or self.PROPOSAL_CONCURRENCY
+        timeout = timeout if timeout is not None else self.PROPOSAL_TIMEOUT
+        deadline = time.monotonic() + timeout
 
-        for index, selected_ursula in enumerate(candidate_ursulas):
-            arrangement = self.make_arrangement(ursula=selected_ursula, *args, **kwargs)
-            try:
-                is_accepted = self.propose_arrangement(ursula=selected_ursula,
-                                                       arrangement=arrangement,
-                                                       network_middleware=network_middleware)
-
-            except NodeSeemsToBeDown as e:  # TODO: #355 Also catch InvalidNode here?
-                # This arrangement won't be added to the accepted bucket.
-                # If too many nodes are down, it will fail in make_arrangements.
-                # Also TODO: Prolly log this or something at this stage.
-                continue
+        candidates = deque(candidate_ursulas)
+        asked = set()  # type: Set[Ursula]
+        pending = dict()  # type: Dict[Future, Arrangement]
+        out_of_candidates = False
 
-            else:
-                # Bucket the arrangements
-                if is_accepted:
-                    self.log.debug(f"Arrangement accepted by {selected_ursula}")
-                    self._accepted_arrangements.add(arrangement)
-                    accepted = len(self._accepted_arrangements)
-                    if accepted == self.n and not consider_everyone:
-                        try:
-                            spares = set(list(candidate_ursulas)[index + 1::])
-                            self._spare_candidates.update(spares)
-                        except IndexError:
-                            self._spare_candidates = set()
-                        break
-                else:
-                    self.log.debug(f"Arrangement failed with {selected_ursula}")
-                    self._rejected_arrangements.add(arrangement)
+        executor = get_engagement_executor()
+        try:
+            while True:
+                accepted = len(self._accepted_arrangements)
+                if accepted >= self.n and not consider_everyone:
+                    break
+
+                # Keep as many proposals outstanding as could still be needed.
+                wanted = len(candidates) if consider_everyone else self.n - accepted - len(pending)
+                wanted = min(wanted, max_concurrency - len(pending))
+                if wanted > len(candidates) and not out_of_candidates and not consider_everyone:
+                    replacements = self._sample_replacements(quantity=wanted - len(candidates),
+                                                             exclude=asked.union(candidates),
+                                                             timeout=max(deadline - time.monotonic(), 0),
+                                                             discover_on_this_thread=discover_on_this_thread)
+                    candidates.extend(replacements)
+                    out_of_candidates = not replacements
+                for _ in range(min(wanted, len(candidates))):
+                    ursula = candidates.popleft()
+                    asked.add(ursula)
+                    arrangement = self.make_arrangement(ursula=ursula, *args, **kwargs)
+                    future = executor.submit(partial(self._consider_arrangement,
+                                                     network_middleware=network_middleware,
+                                                     arrangement=arrangement),
+                                             node_id=ursula.checksum_address,
+                                             group=self)
+                    pending[future] = arrangement
+
+                if not pending:
+                    break  # Nobody left to ask; if too few accepted, make_arrangements will say so.
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.log.warn(f"Gave up waiting for {len(pending)} arrangement proposals after {timeout} seconds.")
+                    break
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    arrangement = pending.pop(future)
+                    try:
+                        is_accepted = future.result()
+                    except NodeSeemsToBeDown as e:  # TODO: #355 Also catch InvalidNode here?
+                        # This arrangement won't be added to either bucket; its Ursula will be replaced.
+                        self.log.debug(f"Arrangement proposal to {arrangement.ursula} failed: {e}")
+                        continue
+                    except RestMiddleware.UnexpectedResponse as e:
+                        # e.g. an Ursula too busy to consider it
+                        self.log.debug(f"Arrangement proposal to {arrangement.ursula} failed: {e}")
+                        is_accepted = False
+
+                    # Bucket the arrangements
+                    if is_accepted and (consider_everyone or len(self._accepted_arrangements) < self.n):
+                        self.log.debug(f"Arrangement accepted by {arrangement.ursula}")
+                        self._accepted_arrangements.add(arrangement)
+                    elif is_accepted:
+                        self._spare_candidates.add(arrangement.ursula)  # Accepted, but no longer needed.
+                    else:
+                        self.log.debug(f"Arrangement failed with {arrangement.ursula}")
+                        self._rejected_arrangements.add(arrangement)
+        finally:
+            executor.cancel(group=self)  # Those still waiting for a thread; the others are left to finish.
+
+        self._spare_candidates.update(candidates)
+
+    def _sample_replacements(self,
+                             quantity: int,
+                             exclude: Set[Ursula],
+                             timeout: float,
+                             discover_on_this_thread: bool = False) -> Set[Ursula]:
+        """Samples up to `quantity` Ursulas, none of them in `exclude`, to replace those that didn't accept."""
+        try:
+            sampled_ursulas = self.sample_essential(quantity=quantity,
+                                                    handpicked_ursulas=exclude,
+                                                    timeout=timeout,
+                                                    discover_on_this_thread=discover_on_this_thread)
+        except (self.MoreKFragsThanArrangements, ValueError, RuntimeError) as e:
+            self.log.debug(f"Couldn't sample replacements for rejected arrangements: {e}")
+            return set()
+        return set(sampled_ursulas) - exclude
 
 
 class FederatedPolicy(Policy):
@@ -605,8 +770,11 @@ class FederatedPolicy(Policy):
     def sample_essential(self,
                          quantity: int,
                          handpicked_ursulas: Set[Ursula],
+                         timeout: int = 10,
                          discover_on_this_thread: bool = True) -> Set[Ursula]:
-        self.alice.block_until_number_of_known_nodes_is(quantity, learn_on_this_thread=discover_on_this_thread)
+        self.alice.block_until_number_of_known_nodes_is(quantity,
+                                                        timeout=timeout,
+                                                        learn_on_this_thread=discover_on_this_thread)
         known_nodes = self.alice.known_nodes
         if handpicked_ursulas:
             # Prevent re-sampling of handpicked ursulas.
@@ -764,8 +932,11 @@ class BlockchainPolicy(Policy):
 
         return set(found_ursulas)
 
-    def publish_to_blockchain(self) -> dict:
-
+    def publish_to_blockchain(self, fire_and_forget: bool = False) -> dict:
+        """
+        Creates this policy on chain, paying the accepted Ursulas.  With `fire_and_forget`, returns the
+        transaction hash as soon as the transaction is broadcast; call confirm_publication to wait for it.
+        """
         prearranged_ursulas = list(a.ursula.checksum_address for a in self._accepted_arrangements)
 
         # Transact  # TODO: Move this logic to BlockchainPolicyActor
@@ -774,8 +945,12 @@ class BlockchainPolicy(Policy):
             author_address=self.author.checksum_address,
             value=self.value,
             end_timestamp=self.expiration.epoch,  # uint16 _numberOfPeriods
-            node_addresses=prearranged_ursulas  # address[] memory _nodes
+            node_addresses=prearranged_ursulas,  # address[] memory _nodes
+            fire_and_forget=fire_and_forget
         )
+        if fire_and_forget:
+            self.publish_transaction = receipt  # Only its hash, so far
+            return receipt
 
         # Capture Response
         self.receipt = receipt
@@ -784,6 +959,19 @@ class BlockchainPolicy(Policy):
 
         return receipt
 
+    def confirm_publication(self, timeout: float = None) -> dict:
+        """Waits for the receipt of a transaction broadcast by publish_to_blockchain(fire_and_forget=True)."""
+        if self.is_published:
+            return self.receipt
+        blockchain = self.author.policy_agent.blockchain
+        receipt = blockchain.client.wait_for_receipt(self.publish_transaction,
+                                                     timeout=timeout or blockchain.TIMEOUT)
+        if receipt.get('status') == 0:
+            raise blockchain.InterfaceError(f"Publishing {self} failed; the receipt returned status code 0.")
+        self.receipt = receipt
+        self.is_published = True
+        return receipt
+
     def make_arrangement(self, ursula: Ursula, *args, **kwargs):
         return self._arrangement_class(alice=self.alice,
                                        expiration=self.expiration,
@@ -800,9 +988,9 @@ class BlockchainPolicy(Policy):
         if publish_to_blockchain is True:
             self.publish_to_blockchain()
 
-            # Not in love with this block here, but I want 121 closed.
-            for arrangement in self._accepted_arrangements:
-                arrangement.publish_transaction = self.publish_transaction
+        # Not in love with this block here, but I want 121 closed.
+        for arrangement in self._accepted_arrangements:
+            arrangement.publish_transaction = self.publish_transaction
 
         publisher = super().enact(network_middleware, publish_treasure_map=False)
 
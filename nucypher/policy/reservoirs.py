@@ -0,0 +1,168 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import Future
+from threading import Lock
+from typing import Iterable, NamedTuple, Optional
+
+from eth_typing import ChecksumAddress
+from lru import LRU
+from twisted.internet import threads
+from twisted.internet.task import LoopingCall
+
+from nucypher.blockchain.eth.agents import StakersReservoir, StakingEscrowAgent, WeightedSampler
+from nucypher.utilities.logging import Logger
+
+
+class StakerDistribution(NamedTuple):
+    duration: int  # periods, rounded up to the cache's duration bucket
+    period: int
+    sampler: Optional[WeightedSampler]  # None if no tokens are locked for the duration
+
+
+class StakerDistributionCache:
+    """
+    The active stakers that policies sample their Ursulas from, weighted by their locked tokens, shared by
+    all of the policies an Alice creates.
+
+    Finding them scans every active staker on chain, and they only change once a period, as stakers commit
+    to the next; so they're fetched once per duration and period rather than once per policy, and each
+    policy's exclusions are applied as it draws.  Durations are rounded up to a multiple of `duration_bucket`
+    periods: a larger bucket shares more among policies of different durations, but leaves out the stakers
+    whose tokens are locked for less than the rounded-up duration.
+
+    Once started, a loop fetches the durations that were in use again as soon as a new period begins,
+    so that the first policy of each period needn't wait for them.
+    """
+
+    DEFAULT_DURATION_BUCKET = 1  # periods
+    INTERVAL = 60  # seconds between checks for a new period
+    MAX_CACHED = 32
+
+    def __init__(self, staking_agent: StakingEscrowAgent, duration_bucket: int = None):
+        self.log = Logger(self.__class__.__name__)
+        self.staking_agent = staking_agent
+        self.duration_bucket = duration_bucket or self.DEFAULT_DURATION_BUCKET
+        self.__lock = Lock()
+        self.__distributions = LRU(self.MAX_CACHED)  # (duration, period) -> StakerDistribution
+        self.__in_flight = dict()  # (duration, period) -> Future
+        self.__refreshed_period = None
+        self._task = LoopingCall(lambda: threads.deferToThread(self.refresh))
+
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def __len__(self):
+        return len(self.__distributions)
+
+    @property
+    def running(self) -> bool:
+        return self._task.running
+
+    def start(self, now: bool = False) -> None:
+        if not self.running:
+            d = self._task.start(interval=self.INTERVAL, now=now)
+            d.addErrback(self.handle_refresh_errors)
+
+    def stop(self) -> None:
+        if self.running:
+            self._task.stop()
+
+    def handle_refresh_errors(self, failure) -> None:
+        cleaned_traceback = failure.getTraceback().replace('{', '').replace('}', '')
+        self.log.warn(f"Unhandled error while refreshing staker distributions: {cleaned_traceback}")
+        if not self.running:
+            self.start(now=False)
+
+    def bucket(self, duration: int) -> int:
+        if not duration > 0:
+            raise ValueError("Period must be > 0")
+        return -(-duration // self.duration_bucket) * self.duration_bucket
+
+    def reservoir(self, duration: int, without: Iterable[ChecksumAddress] = ()) -> StakersReservoir:
+        """A reservoir of the stakers with tokens locked for `duration` periods, none of them in `without`."""
+        distribution = self.distribution(duration=duration)
+        if distribution.sampler is None:
+            raise StakingEscrowAgent.NotEnoughStakers(f'There are no locked tokens for duration {duration}.')
+        return StakersReservoir(sampler=distribution.sampler, without=without)
+
+    def distribution(self, duration: int, period: int = None) -> StakerDistribution:
+        """The stakers for `duration` in `period` (by default, the current one), fetching them if need be."""
+        if period is None:
+            period = self.staking_agent.get_current_period()
+        key = (self.bucket(duration), period)
+        with self.__lock:
+            cached = self.__distributions.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            in_flight = self.__in_flight.get(key)
+            if in_flight:
+                self.shared += 1
+            else:
+                self.misses += 1
+                self.__in_flight[key] = Future()
+
+        if in_flight:
+            return in_flight.result()
+        return self.__fetch(key)
+
+    def __fetch(self, key: tuple) -> StakerDistribution:
+        duration, period = key
+        future = self.__in_flight[key]
+        try:
+            n_tokens, stakers_map = self.staking_agent.get_all_active_stakers(periods=duration)
+        except BaseException as e:
+            with self.__lock:
+                del self.__in_flight[key]
+            future.set_exception(e)
+            raise
+        self.log.debug(f"Got {len(stakers_map)} stakers with {n_tokens} total tokens "
+                       f"for {duration} periods in period {period}")
+        distribution = StakerDistribution(duration=duration,
+                                          period=period,
+                                          sampler=WeightedSampler(stakers_map) if n_tokens else None)
+        with self.__lock:
+            self.__distributions[key] = distribution
+            del self.__in_flight[key]
+        future.set_result(distribution)
+        return distribution
+
+    def refresh(self) -> int:
+        """
+        Once a new period has begun, fetches the durations that were cached for earlier periods for this one,
+        and forgets the earlier ones; returns how many were fetched.
+        """
+        period = self.staking_agent.get_current_period()
+        with self.__lock:
+            if period == self.__refreshed_period:
+                return 0
+            stale = [key for key in self.__distributions.keys() if key[1] < period]
+        durations = {duration for duration, _period in stale}
+        for duration in durations:
+            self.distribution(duration=duration, period=period)
+        with self.__lock:
+            for key in stale:
+                if key in self.__distributions:
+                    del self.__distributions[key]
+            self.__refreshed_period = period
+        return len(durations)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__distributions.clear()
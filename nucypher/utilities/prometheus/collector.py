@@ -23,6 +23,9 @@ except ImportError:
     raise ImportError('"prometheus_client" must be installed - run "pip install nucypher[ursula]" and try again.')
 
 from abc import ABC, abstractmethod
+
+import maya
+from constant_sorrow.constants import NO_KNOWN_NODES
 from eth_typing.evm import ChecksumAddress
 
 import nucypher
@@ -30,8 +33,11 @@ from nucypher.blockchain.eth.actors import NucypherTokenActor
 from nucypher.blockchain.eth.agents import ContractAgency, PolicyManagerAgent, StakingEscrowAgent, WorkLockAgent
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 from nucypher.blockchain.eth.registry import BaseContractRegistry
+from nucypher.characters.base import Character, StrangerCache
 from nucypher.datastore.datastore import RecordNotFound
 from nucypher.datastore.models import Workorder, PolicyArrangement
+from nucypher.network.engagement import EngagementExecutor, EngagementObservation, get_engagement_executor
+from nucypher.network.statistics import RESTObservation
 
 from prometheus_client.metrics import MetricWrapperBase
 from prometheus_client.registry import CollectorRegistry
@@ -153,6 +159,277 @@ class UrsulaInfoMetricsCollector(BaseMetricsCollector):
         self.metrics["host_info"].info(base_payload)
 
 
+class LearningMetricsCollector(BaseMetricsCollector):
+    """Collector for the learning loop and fleet state."""
+
+    NODES_LEARNED_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000, float('inf'))
+
+    def __init__(self, ursula: 'Ursula'):
+        super().__init__()
+        self.ursula = ursula
+        self._last_counts = dict()
+
+    def initialize(self, metrics_prefix: str, registry: CollectorRegistry) -> None:
+        self.metrics = {
+            "rounds_counter": Counter(f'{metrics_prefix}_learning_rounds',
+                                      'Number of learning rounds',
+                                      registry=registry),
+            "round_duration_histogram": Histogram(f'{metrics_prefix}_learning_round_duration_seconds',
+                                                  'Duration of learning rounds',
+                                                  registry=registry),
+            "phase_duration_histogram": Histogram(f'{metrics_prefix}_learning_phase_duration_seconds',
+                                                  'Time spent in each phase of a learning round, per round',
+                                                  labelnames=('phase',),
+                                                  registry=registry),
+            "nodes_learned_histogram": Histogram(f'{metrics_prefix}_learning_nodes_learned',
+                                                 'Number of new nodes learned per learning round',
+                                                 buckets=self.NODES_LEARNED_BUCKETS,
+                                                 registry=registry),
+            "teacher_failures_counter": Counter(f'{metrics_prefix}_learning_teacher_failures',
+                                                'Number of learning rounds in which the teacher failed',
+                                                labelnames=('reason',),
+                                                registry=registry),
+            "fleet_states_match_counter": Counter(f'{metrics_prefix}_learning_fleet_states_match',
+                                                  'Number of learning rounds in which the teacher '
+                                                  'reported the same fleet state',
+                                                  registry=registry),
+            "no_known_nodes_counter": Counter(f'{metrics_prefix}_learning_teacher_knew_no_nodes',
+                                              'Number of learning rounds in which the teacher knew no nodes',
+                                              registry=registry),
+            "seconds_since_new_node_gauge": Gauge(f'{metrics_prefix}_learning_seconds_since_new_node',
+                                                  'Seconds since a previously unknown node was learned about',
+                                                  registry=registry),
+            "fleet_states_gauge": Gauge(f'{metrics_prefix}_fleet_states',
+                                        'Number of distinct fleet states recorded',
+                                        registry=registry),
+        }
+
+    def _increment(self, counter, key: str, total: int) -> None:
+        counter.inc(total - self._last_counts.get(key, 0))
+        self._last_counts[key] = total
+
+    def _collect_internal(self) -> None:
+        statistics = self.ursula.learning_statistics
+
+        round_durations, phase_durations, nodes_learned = statistics.drain()
+        for duration in round_durations:
+            self.metrics["round_duration_histogram"].observe(duration)
+        for phase, duration in phase_durations:
+            self.metrics["phase_duration_histogram"].labels(phase=phase).observe(duration)
+        for quantity in nodes_learned:
+            self.metrics["nodes_learned_histogram"].observe(quantity)
+
+        self._increment(self.metrics["rounds_counter"], 'rounds', statistics.rounds)
+        self._increment(self.metrics["fleet_states_match_counter"], 'match', statistics.fleet_states_match)
+        self._increment(self.metrics["no_known_nodes_counter"], 'no_nodes', statistics.no_known_nodes)
+        for reason, total in list(statistics.teacher_failures.items()):
+            self._increment(self.metrics["teacher_failures_counter"].labels(reason=reason), reason, total)
+
+        known_nodes = self.ursula.known_nodes
+        if known_nodes.most_recent_node_change is not NO_KNOWN_NODES:
+            seconds = (maya.now() - known_nodes.most_recent_node_change).total_seconds()
+            self.metrics["seconds_since_new_node_gauge"].set(seconds)
+        self.metrics["fleet_states_gauge"].set(len(known_nodes.states))
+
+
+class NodeCircuitBreakerMetricsCollector(BaseMetricsCollector):
+    """Collector for the state of the network middleware's per-node circuit breaker."""
+    def __init__(self, ursula: 'Ursula'):
+        super().__init__()
+        self.ursula = ursula
+        self._last_trips = 0
+        self._last_rejections = 0
+
+    def initialize(self, metrics_prefix: str, registry: CollectorRegistry) -> None:
+        self.metrics = {
+            "nodes_by_state_gauge": Gauge(f'{metrics_prefix}_circuit_breaker_nodes',
+                                          'Number of nodes whose circuit is open or half-open',
+                                          labelnames=('state',),
+                                          registry=registry),
+            "trips_counter": Counter(f'{metrics_prefix}_circuit_breaker_trips',
+                                     'Number of times a node circuit has opened',
+                                     registry=registry),
+            "rejections_counter": Counter(f'{metrics_prefix}_circuit_breaker_rejections',
+                                          'Number of requests failed fast by an open circuit',
+                                          registry=registry),
+        }
+
+    def _collect_internal(self) -> None:
+        circuit_breaker = self.ursula.network_middleware.client.circuit_breaker
+        for state, count in circuit_breaker.count_by_state().items():
+            self.metrics["nodes_by_state_gauge"].labels(state=state).set(count)
+
+        trips, rejections = circuit_breaker.total_trips, circuit_breaker.total_rejections
+        self.metrics["trips_counter"].inc(trips - self._last_trips)
+        self.metrics["rejections_counter"].inc(rejections - self._last_rejections)
+        self._last_trips, self._last_rejections = trips, rejections
+
+
+class StrangerCacheMetricsCollector(BaseMetricsCollector):
+    """Collector for the cache of stranger Characters built from public keys."""
+    def __init__(self, stranger_cache: StrangerCache = None):
+        super().__init__()
+        self.stranger_cache = stranger_cache if stranger_cache is not None else Character.stranger_cache
+        self._last_hits = 0
+        self._last_misses = 0
+
+    def initialize(self, metrics_prefix: str, registry: CollectorRegistry) -> None:
+        self.metrics = {
+            "hits_counter": Counter(f'{metrics_prefix}_stranger_cache_hits',
+                                    'Number of stranger Characters found in the cache',
+                                    registry=registry),
+            "misses_counter": Counter(f'{metrics_prefix}_stranger_cache_misses',
+                                      'Number of stranger Characters built because they were not in the cache',
+                                      registry=registry),
+            "size_gauge": Gauge(f'{metrics_prefix}_stranger_cache_size',
+                                'Number of stranger Characters in the cache',
+                                registry=registry),
+        }
+
+    def _collect_internal(self) -> None:
+        hits, misses = self.stranger_cache.hits, self.stranger_cache.misses
+        self.metrics["hits_counter"].inc(hits - self._last_hits)
+        self.metrics["misses_counter"].inc(misses - self._last_misses)
+        self._last_hits, self._last_misses = hits, misses
+        self.metrics["size_gauge"].set(len(self.stranger_cache))
+
+
+class AdmissionMetricsCollector(BaseMetricsCollector):
+    """Collector for admission control of the REST server."""
+    def __init__(self, ursula: 'Ursula'):
+        super().__init__()
+        self.ursula = ursula
+        self._last_counts = dict()
+
+    def initialize(self, metrics_prefix: str, registry: CollectorRegistry) -> None:
+        self.metrics = {
+            "admitted_counter": Counter(f'{metrics_prefix}_rest_requests_admitted',
+                                        'Number of REST requests admitted',
+                                        labelnames=('priority_class',),
+                                        registry=registry),
+            "rejected_counter": Counter(f'{metrics_prefix}_rest_requests_rejected',
+                                        'Number of REST requests turned away',
+                                        labelnames=('priority_class', 'reason'),
+                                        registry=registry),
+            "in_flight_gauge": Gauge(f'{metrics_prefix}_rest_requests_in_flight',
+                                     'Number of REST requests being handled',
+                                     labelnames=('priority_class',),
+                                     registry=registry),
+        }
+
+    def _increment(self, counter, key, total: int) -> None:
+        counter.inc(total - self._last_counts.get(key, 0))
+        self._last_counts[key] = total
+
+    def _collect_internal(self) -> None:
+        admission_controller = self.ursula.admission_controller
+        for priority_class, total in list(admission_controller.admitted.items()):
+            self._increment(self.metrics["admitted_counter"].labels(priority_class=priority_class),
+                            key=('admitted', priority_class),
+                            total=total)
+        for (priority_class, reason), total in list(admission_controller.rejected.items()):
+            self._increment(self.metrics["rejected_counter"].labels(priority_class=priority_class, reason=reason),
+                            key=('rejected', priority_class, reason),
+                            total=total)
+        for priority_class in admission_controller.PRIORITY_SHARES:
+            self.metrics["in_flight_gauge"].labels(priority_class=priority_class).set(
+                admission_controller.in_flight[priority_class] + admission_controller.in_flight_elsewhere[priority_class])
+
+
+class RESTMetricsCollector(BaseMetricsCollector):
+    """
+    Collector for requests to the REST server, by route template (never the path itself, so that IDs in
+    paths don't multiply the label values), method and status.  Requests are observed as they are answered.
+    """
+
+    BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, float('inf'))
+
+    def __init__(self, ursula: 'Ursula'):
+        super().__init__()
+        self.ursula = ursula
+
+    def initialize(self, metrics_prefix: str, registry: CollectorRegistry) -> None:
+        self.metrics = {
+            "requests_counter": Counter(f'{metrics_prefix}_rest_requests',
+                                        'Number of REST requests answered',
+                                        labelnames=('route', 'method', 'status'),
+                                        registry=registry),
+            "duration_histogram": Histogram(f'{metrics_prefix}_rest_request_duration_seconds',
+                                            'Time from the arrival of a REST request until its response was sent',
+                                            labelnames=('route', 'method'),
+                                            registry=registry),
+            "request_bytes_histogram": Histogram(f'{metrics_prefix}_rest_request_bytes',
+                                                 'Size of REST request bodies',
+                                                 labelnames=('route', 'method'),
+                                                 buckets=self.BYTES_BUCKETS,
+                                                 registry=registry),
+            "response_bytes_histogram": Histogram(f'{metrics_prefix}_rest_response_bytes',
+                                                  'Size of REST response bodies',
+                                                  labelnames=('route', 'method'),
+                                                  buckets=self.BYTES_BUCKETS,
+                                                  registry=registry),
+        }
+        self.ursula.rest_statistics.observer = self._observe
+
+    def _observe(self, observation: RESTObservation) -> None:
+        route, method = observation.route, observation.method
+        self.metrics["requests_counter"].labels(route=route, method=method, status=observation.status).inc()
+        self.metrics["duration_histogram"].labels(route=route, method=method).observe(observation.seconds)
+        self.metrics["request_bytes_histogram"].labels(route=route, method=method).observe(observation.request_bytes)
+        self.metrics["response_bytes_histogram"].labels(route=route, method=method).observe(observation.response_bytes)
+
+    def _collect_internal(self) -> None:
+        pass  # Everything is observed as requests are answered.
+
+
+class EngagementMetricsCollector(BaseMetricsCollector):
+    """Collector for the process's shared executor of node engagements (enacting policies, publishing maps)."""
+
+    def __init__(self, executor: EngagementExecutor = None):
+        super().__init__()
+        self.executor = executor or get_engagement_executor()
+        self._last_outcomes = dict()
+
+    def initialize(self, metrics_prefix: str, registry: CollectorRegistry) -> None:
+        self.metrics = {
+            "engagements_counter": Counter(f'{metrics_prefix}_node_engagements',
+                                           'Number of node engagements finished',
+                                           labelnames=('outcome',),
+                                           registry=registry),
+            "queued_gauge": Gauge(f'{metrics_prefix}_node_engagements_queued',
+                                  'Number of node engagements waiting to start',
+                                  registry=registry),
+            "running_gauge": Gauge(f'{metrics_prefix}_node_engagements_running',
+                                   'Number of node engagements running',
+                                   registry=registry),
+            "threads_gauge": Gauge(f'{metrics_prefix}_node_engagement_threads',
+                                   'Number of threads engaging nodes',
+                                   registry=registry),
+            "queued_histogram": Histogram(f'{metrics_prefix}_node_engagement_queued_seconds',
+                                          'Time node engagements waited to start',
+                                          labelnames=('outcome',),
+                                          registry=registry),
+            "engaged_histogram": Histogram(f'{metrics_prefix}_node_engagement_duration_seconds',
+                                           'Time node engagements took, once started',
+                                           labelnames=('outcome',),
+                                           registry=registry),
+        }
+        self.executor.observer = self._observe
+
+    def _observe(self, observation: EngagementObservation) -> None:
+        self.metrics["queued_histogram"].labels(outcome=observation.outcome).observe(observation.queued_seconds)
+        if observation.engaged_seconds:
+            self.metrics["engaged_histogram"].labels(outcome=observation.outcome).observe(observation.engaged_seconds)
+
+    def _collect_internal(self) -> None:
+        for outcome, total in list(self.executor.outcomes.items()):
+            self.metrics["engagements_counter"].labels(outcome=outcome).inc(total - self._last_outcomes.get(outcome, 0))
+            self._last_outcomes[outcome] = total
+        self.metrics["queued_gauge"].set(self.executor.queued)
+        self.metrics["running_gauge"].set(self.executor.running)
+        self.metrics["threads_gauge"].set(self.executor.workers)
+
+
 class BlockchainMetricsCollector(BaseMetricsCollector):
     """Collector for Blockchain specific metrics."""
     def __init__(self, provider_uri: str):
@@ -33,6 +33,12 @@ import json
 from nucypher.utilities.prometheus.collector import (
     MetricsCollector,
     UrsulaInfoMetricsCollector,
+    NodeCircuitBreakerMetricsCollector,
+    LearningMetricsCollector,
+    StrangerCacheMetricsCollector,
+    AdmissionMetricsCollector,
+    RESTMetricsCollector,
+    EngagementMetricsCollector,
     BlockchainMetricsCollector,
     StakerMetricsCollector,
     WorkerMetricsCollector,
@@ -179,7 +185,13 @@ def start_prometheus_exporter(ursula: 'Ursula',
 
 def create_metrics_collectors(ursula: 'Ursula', metrics_prefix: str) -> List[MetricsCollector]:
     """Create collectors used to obtain metrics."""
-    collectors: List[MetricsCollector] = [UrsulaInfoMetricsCollector(ursula=ursula)]
+    collectors: List[MetricsCollector] = [UrsulaInfoMetricsCollector(ursula=ursula),
+                                          NodeCircuitBreakerMetricsCollector(ursula=ursula),
+                                          LearningMetricsCollector(ursula=ursula),
+                                          StrangerCacheMetricsCollector(),
+                                          AdmissionMetricsCollector(ursula=ursula),
+                                          RESTMetricsCollector(ursula=ursula),
+                                          EngagementMetricsCollector()]
 
     if not ursula.federated_only:
         # Blockchain prometheus
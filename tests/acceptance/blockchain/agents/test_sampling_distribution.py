@@ -24,6 +24,7 @@ import pytest
 from nucypher.blockchain.economics import BaseEconomics
 from nucypher.blockchain.eth.agents import StakingEscrowAgent, WeightedSampler
 from nucypher.blockchain.eth.constants import NULL_ADDRESS, STAKING_ESCROW_CONTRACT_NAME
+from tests.utils.sampling import linear_sample_no_replacement
 
 
 @pytest.fixture()
@@ -179,3 +180,55 @@ def test_weighted_sampler(sample_size):
         # A little too forgiving for samples with smaller probabilities,
         # but can go up to 0.5 on occasion.
         assert abs(test_prob - ref_prob) * samples**0.5 < 1
+
+
+@pytest.mark.parametrize('sample_size', [1, 2, 3])
+def test_weighted_sampler_with_exclusions(sample_size):
+    weights = [1, 9, 100, 2, 18, 70]
+    elements = list(range(len(weights)))
+    excluded = {2, 4}
+
+    # Use a fixed seed to avoid flakyness of the test
+    rng = random.Random(123)
+
+    counter = Counter()
+
+    weighted_elements = {element: weight for element, weight in zip(elements, weights)}
+
+    samples = 100000
+    sampler = WeightedSampler(weighted_elements)
+    for i in range(samples):
+        sample_set = sampler.sample_no_replacement(rng, sample_size, exclude=excluded)
+        counter.update({tuple(sample_set): 1})
+
+    # The same as sampling without the excluded elements at all.
+    weights_without = [0 if element in excluded else weight for element, weight in zip(elements, weights)]
+    for idxs in permutations(elements, sample_size):
+        test_prob = counter[idxs] / samples
+        ref_prob = probability_reference_no_replacement(weights_without, idxs)
+        assert abs(test_prob - ref_prob) * samples**0.5 < 1
+
+    with pytest.raises(ValueError):
+        sampler.sample_no_replacement(rng, len(elements) - len(excluded) + 1, exclude=excluded)
+
+
+@pytest.mark.parametrize('n_elements', [1, 2, 7, 64, 1000])
+def test_weighted_sampler_matches_linear_sampling(n_elements):
+    # Zero weights included, as the stakers without locked tokens.
+    rng = random.Random(n_elements)
+    weighted_elements = {f'0x{i:040x}': rng.choice([0, 1, 10, 1000, rng.randint(1, 10**9)])
+                         for i in range(n_elements)}
+    weighted_elements[f'0x{n_elements:040x}'] = 1
+    sampler = WeightedSampler(weighted_elements)
+
+    stakers = [element for element, weight in weighted_elements.items() if weight]
+    for _ in range(20):
+        exclude = set(rng.sample(stakers, rng.randint(0, len(stakers) - 1)))
+        quantity = rng.randint(0, len(stakers) - len(exclude))
+        seed = rng.random()
+
+        # The same draws, from the same random numbers.
+        samples = sampler.sample_no_replacement(random.Random(seed), quantity, exclude=exclude)
+        reference = linear_sample_no_replacement(weighted_elements, random.Random(seed), quantity, exclude=exclude)
+        assert samples == reference
+        assert not exclude & set(samples)
@@ -114,7 +114,7 @@ def test_alice_web_character_control_grant_error_messages(alice_web_controller_t
     assert response.status_code == 400
 
 
-def test_alice_character_control_revoke(alice_web_controller_test_client, blockchain_bob):
+def test_alice_character_control_revoke(alice_web_controller_test_client, blockchain_alice, blockchain_bob):
     bob_pubkey_enc = blockchain_bob.public_keys(DecryptingPower)
 
     grant_request_data = {
@@ -129,6 +129,10 @@ def test_alice_character_control_revoke(alice_web_controller_test_client, blockc
     response = alice_web_controller_test_client.put('/grant', data=json.dumps(grant_request_data))
     assert response.status_code == 200
 
+    # Grants return once m kfrags are sent; every Ursula needs hers to revoke it.
+    for policy in blockchain_alice.active_policies.values():
+        policy.block_until_enacted()
+
     revoke_request_data = {
         'label': 'test',
         'bob_verifying_key': bytes(blockchain_bob.stamp).hex()
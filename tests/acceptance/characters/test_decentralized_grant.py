@@ -50,13 +50,17 @@ def test_decentralized_grant(blockchain_alice, blockchain_bob, agency):
     # The number of actually enacted arrangements is exactly equal to n.
     assert len(policy._enacted_arrangements) == n
 
-    # Let's look at the enacted arrangements.
+    # Let's look at the enacted arrangements, once every kfrag has been sent (grant returns after m of them).
+    policy.block_until_enacted()
     for kfrag in policy.kfrags:
         arrangement = policy._enacted_arrangements[kfrag]
 
         # Get the Arrangement from Ursula's datastore, looking up by the Arrangement ID.
         with arrangement.ursula.datastore.describe(PolicyArrangement, arrangement.id.hex()) as policy_arrangement:
             assert kfrag == policy_arrangement.kfrag
+            # Alice's payment was already mined, so the kfrag isn't waiting on it.
+            with pytest.raises(AttributeError):
+                _payment_transaction = policy_arrangement.payment_transaction
 
     # Test PolicyCredential w/o TreasureMap
     credential = policy.credential(with_treasure_map=False)
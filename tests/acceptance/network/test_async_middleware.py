@@ -0,0 +1,116 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+import pytest_twisted
+from constant_sorrow.constants import EXEMPT_FROM_VERIFICATION
+from cryptography.hazmat.primitives import serialization
+from twisted.internet import defer
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.exceptions import NodeSeemsToBeDown
+from nucypher.network.middleware import AsyncResponse, AsyncRestMiddleware, RestMiddleware
+from nucypher.policy.collections import WorkOrder
+from tests.utils.ursula import start_pytest_ursula_services
+
+
+@pytest.fixture(scope='module')
+def serving_ursula(federated_ursulas, tmpdir_factory):
+    ursula = list(federated_ursulas)[0]
+    certificate = start_pytest_ursula_services(ursula=ursula)
+    certificate_filepath = str(tmpdir_factory.mktemp('certificates').join('ursula.pem'))
+    with open(certificate_filepath, 'wb') as certificate_file:
+        certificate_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    return ursula, certificate_filepath
+
+
+@pytest_twisted.inlineCallbacks
+def test_async_middleware_fans_out_from_one_thread(serving_ursula):
+    ursula, certificate_filepath = serving_ursula
+    middleware = AsyncRestMiddleware()
+    host, port = ursula.rest_interface.host, ursula.rest_interface.port
+
+    requests = [middleware.client.node_information(host=host, port=port, certificate_filepath=certificate_filepath)
+                for _ in range(50)]
+    responses = yield defer.gatherResults(requests, consumeErrors=True)
+    assert all(response == bytes(ursula) for response in responses)
+
+    response = yield middleware.client.get(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                                           host=host, port=port,
+                                           path="node_metadata",
+                                           certificate_filepath=certificate_filepath)
+    assert response.status_code == 200
+    assert response.content
+
+    with pytest.raises(RestMiddleware.NotFound):
+        yield middleware.client.get(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                                    host=host, port=port,
+                                    path=f"treasure_map/{'f' * 64}",
+                                    certificate_filepath=certificate_filepath)
+
+    yield middleware.client.close()
+
+
+@pytest_twisted.inlineCallbacks
+def test_async_middleware_failures_look_like_blocking_ones(serving_ursula):
+    ursula, certificate_filepath = serving_ursula
+    middleware = AsyncRestMiddleware()
+    host, port = ursula.rest_interface.host, ursula.rest_interface.port
+
+    # Nobody is listening here.
+    with pytest.raises(NodeSeemsToBeDown):
+        yield middleware.client.node_information(host=host, port=port + 1000, certificate_filepath=certificate_filepath)
+
+    # A per-call timeout which can't possibly be met.
+    with pytest.raises(NodeSeemsToBeDown):
+        yield middleware.client.get(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                                    host=host, port=port,
+                                    path="public_information",
+                                    certificate_filepath=certificate_filepath,
+                                    timeout=0.000001)
+
+    yield middleware.client.close()
+
+
+@pytest_twisted.inlineCallbacks
+def test_async_middleware_reencrypt_stream_fires_with_every_cfrag(enacted_federated_policy, federated_alice,
+                                                                  federated_bob, federated_ursulas,
+                                                                  capsule_side_channel):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+    capsule = capsule_side_channel().capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+    work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                            alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                            capsules=[capsule],
+                                            ursula=ursula,
+                                            bob=federated_bob)
+
+    # Ursula's own (streamed) answer, as the asynchronous client would have read it.
+    with ursula.rest_app.test_client() as client:
+        response = client.post(f'/kFrag/{arrangement_id.hex()}/reencrypt', data=work_order.payload())
+        content = response.data
+    middleware = AsyncRestMiddleware()
+    middleware.send_work_order_payload_to_ursula = lambda _work_order: defer.succeed(
+        AsyncResponse(status_code=200, content=content, headers=None))
+
+    cfrags_and_signatures = yield middleware.reencrypt_stream(work_order)
+    assert len(cfrags_and_signatures) == 1
+    cfrags = work_order.complete(cfrags_and_signatures)
+    assert len(cfrags) == 1
@@ -0,0 +1,160 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.admission import AdmissionController
+from nucypher.network.status import StatusPage
+from nucypher.policy.collections import WorkOrder
+
+pytest.importorskip('pytest_benchmark')
+
+SERVER_THREADS = AdmissionController().server_threads  # The same for every arm, so only admission control differs
+REENCRYPTIONS = 20
+
+# A burst of status requests, sent without waiting for answers, faster than the page can be rendered.
+FLOOD_RATE = 200  # requests per second
+FLOOD_REQUESTS = 500
+RENDER_SECONDS = 0.02  # As long as the page of a node that knows thousands of others takes
+REENCRYPTION_INTERVAL = FLOOD_REQUESTS / FLOOD_RATE / REENCRYPTIONS  # So that Bobs keep coming throughout
+
+# How much slower re-encryption may get during the flood, at the 95th percentile, than on an idle server,
+# with admission control.  Turning status requests away still takes some of this process's GIL; without
+# admission control, re-encryptions wait behind the whole backlog of renders instead, for seconds.
+LATENCY_FACTOR = 10
+
+
+class LargeFleetStatusPage(StatusPage):
+    """Renders every time, and slowly, until `slow` is cleared."""
+
+    def __init__(self):
+        super().__init__(max_age=0)
+        self.slow = threading.Event()
+        self.slow.set()
+
+    def current(self, fleet_checksum, render):
+        def slow_render():
+            if self.slow.is_set():
+                time.sleep(RENDER_SECONDS)
+            return render()
+        return super().current(fleet_checksum, slow_render)
+
+
+@pytest.fixture(scope='module')
+def ursula_and_work_order(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas,
+                          capsule_side_channel):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+    capsule = capsule_side_channel().capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+    work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                            alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                            capsules=[capsule],
+                                            ursula=ursula,
+                                            bob=federated_bob)
+    return ursula, work_order
+
+
+def request(ursula, method: str, path: str, **kwargs) -> int:
+    with ursula.rest_app.test_client() as client:
+        response = getattr(client, method)(path, **kwargs)
+        _body = response.data
+        return response.status_code
+
+
+def reencryption_latencies(ursula, work_order, server: ThreadPoolExecutor, interval: float = 0):
+    latencies = list()
+    next_reencryption = time.perf_counter()
+    for _ in range(REENCRYPTIONS):
+        time.sleep(max(0, next_reencryption - time.perf_counter()))
+        next_reencryption += interval
+        started = time.perf_counter()
+        status = server.submit(request, ursula, 'post', f'/kFrag/{work_order.arrangement_id.hex()}/reencrypt',
+                               data=work_order.payload()).result()
+        latencies.append(time.perf_counter() - started)
+        assert status == 200
+    return latencies
+
+
+def p95(latencies) -> float:
+    return sorted(latencies)[math.ceil(0.95 * len(latencies)) - 1]
+
+
+@pytest.fixture(scope='module')
+def idle_p95(ursula_and_work_order):
+    ursula, work_order = ursula_and_work_order
+    with ThreadPoolExecutor(max_workers=SERVER_THREADS) as server:
+        reencryption_latencies(ursula, work_order, server)  # Warm up
+        return p95(reencryption_latencies(ursula, work_order, server))
+
+
+@pytest.mark.parametrize('admission_control', (False, True), ids=('unlimited', 'admission_control'))
+def test_reencryption_latency_under_a_flood_of_status_requests(benchmark, ursula_and_work_order, idle_p95,
+                                                               admission_control):
+    ursula, work_order = ursula_and_work_order
+    original_controller, original_status_page = ursula.admission_controller, ursula.status_page
+    ursula.status_page = LargeFleetStatusPage()
+    if admission_control:
+        ursula.admission_controller = AdmissionController()
+    else:
+        ursula.admission_controller = AdmissionController(max_concurrent_requests=10 ** 6)
+    server = ThreadPoolExecutor(max_workers=SERVER_THREADS)
+    flooding = threading.Event()
+
+    def flood():
+        next_request = time.perf_counter()
+        for _ in range(FLOOD_REQUESTS):
+            if not flooding.is_set():
+                return
+            server.submit(request, ursula, 'get', '/status/')
+            next_request += 1 / FLOOD_RATE
+            time.sleep(max(0, next_request - time.perf_counter()))
+
+    flooding.set()
+    flooder = threading.Thread(target=flood, daemon=True)
+    flooder.start()
+    try:
+        latencies = benchmark.pedantic(reencryption_latencies, args=(ursula, work_order, server, REENCRYPTION_INTERVAL),
+                                       rounds=1, warmup_rounds=0)
+        rejected = sum(ursula.admission_controller.rejected.values())
+    finally:
+        flooding.clear()
+        flooder.join()
+        ursula.status_page.slow.clear()  # So that what's left of the flood drains quickly
+        server.shutdown()
+        ursula.admission_controller, ursula.status_page = original_controller, original_status_page
+
+    benchmark.extra_info['idle_p95_reencryption_seconds'] = idle_p95
+    benchmark.extra_info['p95_reencryption_seconds'] = p95(latencies)
+    benchmark.extra_info['median_reencryption_seconds'] = statistics.median(latencies)
+    benchmark.extra_info['status_requests_rejected'] = rejected
+    benchmark.extra_info['server_threads'] = SERVER_THREADS
+
+    if admission_control:
+        assert rejected, "The flood of status requests wasn't shed"
+        assert p95(latencies) <= LATENCY_FACTOR * idle_p95
+    else:
+        assert not rejected
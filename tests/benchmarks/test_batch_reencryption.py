@@ -0,0 +1,63 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.policy.collections import WorkOrder
+
+pytest.importorskip('pytest_benchmark')
+
+NUMBER_OF_WORK_ORDERS = 20
+
+
+@pytest.fixture(scope='module')
+def work_orders_for_one_ursula(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas,
+                               capsule_side_channel):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+
+    work_orders = list()
+    for _ in range(NUMBER_OF_WORK_ORDERS):
+        capsule = capsule_side_channel().capsule
+        capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=federated_alice.stamp.as_umbral_pubkey())
+        work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                                alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                                capsules=[capsule],
+                                                ursula=ursula,
+                                                bob=federated_bob)
+        work_orders.append(work_order)
+    return work_orders
+
+
+@pytest.mark.parametrize('batched', (False, True), ids=('single', 'batched'))
+def test_reencryption_of_many_work_orders(benchmark, federated_bob, work_orders_for_one_ursula, batched):
+    middleware = federated_bob.network_middleware
+
+    def reencrypt_one_by_one():
+        return [middleware.reencrypt(work_order) for work_order in work_orders_for_one_ursula]
+
+    def reencrypt_in_one_batch():
+        return [result for _status, result in middleware.reencrypt_batch(work_orders_for_one_ursula)]
+
+    reencrypt = reencrypt_in_one_batch if batched else reencrypt_one_by_one
+    results = benchmark.pedantic(reencrypt, rounds=10, warmup_rounds=1)
+
+    assert len(results) == NUMBER_OF_WORK_ORDERS
+    assert all(len(cfrags_and_signatures) == 1 for cfrags_and_signatures in results)
@@ -0,0 +1,56 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import datetime
+from itertools import count
+
+import maya
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+POLICIES = 10
+M, N = 2, 3
+RATE = int(1e18)
+
+_labels = count()
+
+
+def _grants(bob, quantity):
+    return [(bob, f'bulk grant benchmark {next(_labels)}'.encode()) for _ in range(quantity)]
+
+
+@pytest.mark.usefixtures('blockchain_ursulas')
+@pytest.mark.parametrize('bulk', (False, True))
+def test_granting_many_policies(benchmark, blockchain_alice, blockchain_bob, agency, bulk):
+    expiration = maya.now() + datetime.timedelta(days=5)
+
+    def grant_one_by_one(grants):
+        return [blockchain_alice.grant(bob=bob, label=label, m=M, n=N, rate=RATE, expiration=expiration)
+                for bob, label in grants]
+
+    def grant_in_bulk(grants):
+        return blockchain_alice.bulk_grant(grants=grants, m=M, n=N, rate=RATE, expiration=expiration)
+
+    policies = benchmark.pedantic(grant_in_bulk if bulk else grant_one_by_one,
+                                  setup=lambda: ((_grants(blockchain_bob, POLICIES),), {}),
+                                  rounds=3)
+    assert len(policies) == POLICIES
+    assert all(policy.is_published for policy in policies)
+
+    benchmark.extra_info['policies'] = POLICIES
+    benchmark.extra_info['policies_per_second'] = POLICIES / benchmark.stats.stats.mean
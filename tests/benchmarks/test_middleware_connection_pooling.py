@@ -0,0 +1,56 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+import pytest_twisted
+from cryptography.hazmat.primitives import serialization
+from twisted.internet import threads
+
+from nucypher.network.middleware import NucypherMiddlewareClient
+from tests.utils.ursula import start_pytest_ursula_services
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.fixture(scope='module')
+def serving_ursula(federated_ursulas, tmpdir_factory):
+    ursula = list(federated_ursulas)[0]
+    certificate = start_pytest_ursula_services(ursula=ursula)
+    certificate_filepath = str(tmpdir_factory.mktemp('certificates').join('ursula.pem'))
+    with open(certificate_filepath, 'wb') as certificate_file:
+        certificate_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    return ursula, certificate_filepath
+
+
+@pytest.mark.parametrize('pool_size', (0, NucypherMiddlewareClient.pool_size), ids=('unpooled', 'pooled'))
+@pytest_twisted.inlineCallbacks
+def test_middleware_request_latency(benchmark, serving_ursula, pool_size):
+    ursula, certificate_filepath = serving_ursula
+    client = NucypherMiddlewareClient(pool_size=pool_size)
+    host, port = ursula.rest_interface.host, ursula.rest_interface.port
+
+    def request_public_information():
+        return client.node_information(host=host, port=port, certificate_filepath=certificate_filepath)
+
+    def measure():
+        return benchmark.pedantic(request_public_information, rounds=100, warmup_rounds=1)
+
+    try:
+        public_information = yield threads.deferToThread(measure)
+        assert public_information == bytes(ursula)
+    finally:
+        client.close()
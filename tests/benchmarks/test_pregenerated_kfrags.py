@@ -0,0 +1,91 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import datetime
+from itertools import count
+
+import maya
+import pytest
+
+from tests.utils.ursula import MOCK_KNOWN_URSULAS_CACHE, make_federated_ursulas
+
+pytest.importorskip('pytest_benchmark')
+
+NS = (5, 20, 50)
+
+_labels = count()
+
+
+@pytest.fixture(scope='module')
+def fleet(federated_ursulas, ursula_federated_test_config):
+    more_ursulas = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                          quantity=max(NS) - len(federated_ursulas),
+                                          know_each_other=False)
+    yield federated_ursulas | more_ursulas
+
+    for ursula in more_ursulas:
+        del MOCK_KNOWN_URSULAS_CACHE[ursula.rest_interface.port]
+        ursula.stop()
+
+
+@pytest.fixture(scope='module')
+def alice(alice_federated_test_config, fleet):
+    alice = alice_federated_test_config.produce(known_nodes=fleet, kfrag_workers=1)
+    yield alice
+    alice.disenchant()
+
+
+def _setup(alice, bob, m, n, pregenerated):
+    def setup():
+        label = f'pregenerated kfrags benchmark {next(_labels)}'.encode()
+        if pregenerated:
+            # Requested ahead of time, and ready by the time the grant is.
+            alice.pregenerate_kfrags(bob=bob, label=label, m=m, n=n).result()
+        return (label,), {}
+    return setup
+
+
+@pytest.mark.parametrize('pregenerated', (False, True))
+@pytest.mark.parametrize('n', NS)
+def test_grant_latency_by_n(benchmark, alice, federated_bob, n, pregenerated):
+    m = n // 2 + 1
+    expiration = maya.now() + datetime.timedelta(days=5)
+
+    def grant(label):
+        return alice.grant(federated_bob, label, m=m, n=n, expiration=expiration)
+
+    hits = alice.kfrag_pool.hits
+    benchmark.pedantic(grant, setup=_setup(alice, federated_bob, m, n, pregenerated), rounds=3)
+    assert alice.kfrag_pool.hits - hits == (3 if pregenerated else 0)
+
+    benchmark.extra_info['n'] = n
+    benchmark.extra_info['pregenerated'] = pregenerated
+
+
+@pytest.mark.parametrize('pregenerated', (False, True))
+@pytest.mark.parametrize('n', NS)
+def test_policy_creation_latency_by_n(benchmark, alice, federated_bob, n, pregenerated):
+    """The part of granting that pregenerated kfrags take off, without the network's share."""
+    m = n // 2 + 1
+    expiration = maya.now() + datetime.timedelta(days=5)
+
+    def create_policy(label):
+        return alice.create_policy(federated_bob, label, m=m, n=n, expiration=expiration)
+
+    benchmark.pedantic(create_policy, setup=_setup(alice, federated_bob, m, n, pregenerated), rounds=5)
+    benchmark.extra_info['n'] = n
+    benchmark.extra_info['pregenerated'] = pregenerated
@@ -0,0 +1,93 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from constant_sorrow.constants import EXEMPT_FROM_VERIFICATION
+from cryptography.hazmat.primitives import serialization
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.middleware import RestMiddleware
+from nucypher.network.processes import RESTProcessPool
+from nucypher.policy.collections import WorkOrder
+
+pytest.importorskip('pytest_benchmark')
+
+CLIENTS = 8
+REQUESTS_PER_CLIENT = 5
+CAPSULES_PER_WORK_ORDER = 5
+
+
+@pytest.fixture(scope='module')
+def ursula_and_work_order(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas,
+                          capsule_side_channel, tmpdir_factory):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[1]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+
+    certificate_filepath = str(tmpdir_factory.mktemp('certificates').join('ursula.pem'))
+    with open(certificate_filepath, 'wb') as certificate_file:
+        certificate_file.write(ursula.rest_server_certificate().public_bytes(serialization.Encoding.PEM))
+
+    capsules = list()
+    for _ in range(CAPSULES_PER_WORK_ORDER):
+        capsule = capsule_side_channel().capsule
+        capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=federated_alice.stamp.as_umbral_pubkey())
+        capsules.append(capsule)
+    work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                            alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                            capsules=capsules,
+                                            ursula=ursula,
+                                            bob=federated_bob)
+    return ursula, certificate_filepath, work_order
+
+
+@pytest.mark.parametrize('processes', (1, 2, 4))
+def test_reencryption_throughput_by_rest_processes(benchmark, ursula_and_work_order, processes):
+    ursula, certificate_filepath, work_order = ursula_and_work_order
+    path = f"kFrag/{work_order.arrangement_id.hex()}/reencrypt"
+    payload = work_order.payload()
+
+    def client():
+        middleware = RestMiddleware()
+        for _ in range(REQUESTS_PER_CLIENT):
+            response = middleware.client.post(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                                              host=ursula.rest_interface.host,
+                                              port=ursula.rest_interface.port,
+                                              certificate_filepath=certificate_filepath,
+                                              path=path,
+                                              data=payload,
+                                              timeout=60)
+            assert response.status_code == 200
+
+    def flood():
+        with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+            for future in [executor.submit(client) for _ in range(CLIENTS)]:
+                future.result()
+
+    pool = RESTProcessPool(ursula=ursula, processes=processes)
+    pool.start()
+    try:
+        benchmark.pedantic(flood, rounds=3, warmup_rounds=1)
+    finally:
+        pool.stop()
+
+    benchmark.extra_info['cpus'] = os.cpu_count()
+    benchmark.extra_info['requests_per_second'] = CLIENTS * REQUESTS_PER_CLIENT / benchmark.stats.stats.mean
@@ -0,0 +1,51 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.characters.base import Character
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.policy.collections import WorkOrder
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.fixture(scope='module')
+def work_order(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas, capsule_side_channel):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+    capsule = capsule_side_channel().capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+    return WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                      alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                      capsules=[capsule],
+                                      ursula=ursula,
+                                      bob=federated_bob)
+
+
+@pytest.mark.parametrize('cached', (False, True), ids=('uncached', 'cached'))
+def test_reencryption_request_latency(benchmark, federated_bob, work_order, cached):
+    # Without the cache, every request has to build a new Bob.
+    setup = None if cached else Character.stranger_cache.clear
+
+    def reencrypt():
+        return federated_bob.network_middleware.reencrypt(work_order)
+
+    cfrags_and_signatures = benchmark.pedantic(reencrypt, setup=setup, rounds=50, warmup_rounds=1)
+    assert len(cfrags_and_signatures) == 1
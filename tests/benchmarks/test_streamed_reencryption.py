@@ -0,0 +1,100 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+import pytest
+import pytest_twisted
+from constant_sorrow.constants import EXEMPT_FROM_VERIFICATION
+from cryptography.hazmat.primitives import serialization
+from twisted.internet import threads
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.crypto.splitters import cfrag_splitter
+from nucypher.crypto.signing import signature_splitter
+from nucypher.network.middleware import RestMiddleware
+from nucypher.policy.collections import WorkOrder
+from tests.utils.ursula import start_pytest_ursula_services
+
+pytest.importorskip('pytest_benchmark')
+
+NUMBER_OF_CAPSULES = 200
+
+
+@pytest.fixture(scope='module')
+def serving_ursula_and_work_order(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas,
+                                  capsule_side_channel, tmpdir_factory):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+
+    certificate = start_pytest_ursula_services(ursula=ursula)
+    certificate_filepath = str(tmpdir_factory.mktemp('certificates').join('ursula.pem'))
+    with open(certificate_filepath, 'wb') as certificate_file:
+        certificate_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+
+    capsules = list()
+    for _ in range(NUMBER_OF_CAPSULES):
+        capsule = capsule_side_channel().capsule
+        capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=federated_alice.stamp.as_umbral_pubkey())
+        capsules.append(capsule)
+    work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                            alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                            capsules=capsules,
+                                            ursula=ursula,
+                                            bob=federated_bob)
+    return ursula, certificate_filepath, work_order
+
+
+@pytest.mark.parametrize('streamed', (False, True), ids=('buffered', 'streamed'))
+@pytest_twisted.inlineCallbacks
+def test_large_work_order_latency(benchmark, serving_ursula_and_work_order, streamed):
+    ursula, certificate_filepath, work_order = serving_ursula_and_work_order
+    middleware = RestMiddleware()
+    seconds_to_first_cfrag = list()
+
+    def reencrypt():
+        started = time.perf_counter()
+        response = middleware.client.post(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                                          host=ursula.rest_interface.host,
+                                          port=ursula.rest_interface.port,
+                                          certificate_filepath=certificate_filepath,
+                                          path=f"kFrag/{work_order.arrangement_id.hex()}/reencrypt",
+                                          data=work_order.payload(),
+                                          timeout=60,
+                                          stream=streamed)
+        if streamed:
+            cfrags_and_signatures = middleware._parse_cfrag_stream(middleware._iter_content(response))
+        else:
+            cfrags_and_signatures = iter((cfrag_splitter + signature_splitter).repeat(response.content))
+
+        results = [next(cfrags_and_signatures)]
+        seconds_to_first_cfrag.append(time.perf_counter() - started)
+        results.extend(cfrags_and_signatures)
+        return results
+
+    def measure():
+        return benchmark.pedantic(reencrypt, rounds=3, warmup_rounds=1)
+
+    try:
+        cfrags_and_signatures = yield threads.deferToThread(measure)
+    finally:
+        middleware.client.close()
+
+    assert len(cfrags_and_signatures) == NUMBER_OF_CAPSULES
+    benchmark.extra_info['seconds_to_first_cfrag'] = min(seconds_to_first_cfrag)
@@ -0,0 +1,66 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+
+import pytest
+
+from nucypher.blockchain.eth.agents import WeightedSampler
+from tests.utils.sampling import linear_sample_no_replacement
+
+pytest.importorskip('pytest_benchmark')
+
+N_STAKERS = (10_000, 100_000)
+QUANTITIES = (10, 100)
+
+
+def _stakers(n_stakers):
+    rng = random.Random(n_stakers)
+    return {f'0x{i:040x}': rng.randint(15_000, 4_000_000) * 10**18 for i in range(n_stakers)}
+
+
+@pytest.fixture(scope='module', params=N_STAKERS)
+def stakers(request):
+    return _stakers(request.param)
+
+
+@pytest.mark.parametrize('linear', (False, True))
+@pytest.mark.parametrize('quantity', QUANTITIES)
+def test_sampling_latency_by_stakers(benchmark, stakers, quantity, linear):
+    if linear:
+        def sample(rng):
+            return linear_sample_no_replacement(stakers, rng, quantity)
+    else:
+        sampler = WeightedSampler(stakers)
+
+        def sample(rng):
+            return sampler.sample_no_replacement(rng, quantity)
+
+    seeds = iter(range(1000))
+    samples = benchmark.pedantic(sample, setup=lambda: ((random.Random(next(seeds)),), {}), rounds=5)
+    assert len(set(samples)) == quantity
+
+    benchmark.extra_info['stakers'] = len(stakers)
+    benchmark.extra_info['quantity'] = quantity
+    benchmark.extra_info['linear'] = linear
+
+
+def test_sampler_construction_latency_by_stakers(benchmark, stakers):
+    """Paid once per duration and period, by the StakerDistributionCache."""
+    sampler = benchmark.pedantic(WeightedSampler, args=(stakers,), rounds=5)
+    assert len(sampler) == len(stakers)
+    benchmark.extra_info['stakers'] = len(stakers)
@@ -246,6 +246,7 @@ def enacted_federated_policy(idle_federated_policy, federated_ursulas):
 
     # REST call happens here, as does population of TreasureMap.
     idle_federated_policy.enact(network_middleware)
+    idle_federated_policy.block_until_enacted()
     idle_federated_policy.publishing_mutex.block_until_complete()
 
     return idle_federated_policy
@@ -284,6 +285,7 @@ def enacted_blockchain_policy(idle_blockchain_policy, blockchain_ursulas):
         network_middleware, handpicked_ursulas=list(blockchain_ursulas))
 
     idle_blockchain_policy.enact(network_middleware)  # REST call happens here, as does population of TreasureMap.
+    idle_blockchain_policy.block_until_enacted()
     idle_blockchain_policy.publishing_mutex.block_until_complete()
     return idle_blockchain_policy
 
@@ -115,6 +115,23 @@ def grant_control_request(federated_bob):
     return method_name, params
 
 
+@pytest.fixture(scope='module')
+def bulk_grant_control_request(federated_bob):
+    method_name = 'bulk_grant'
+    bob_pubkey_enc = federated_bob.public_keys(DecryptingPower)
+    grants = [{'bob_encrypting_key': bytes(bob_pubkey_enc).hex(),
+               'bob_verifying_key': bytes(federated_bob.stamp).hex(),
+               'label': label}
+              for label in ('bulk test one', 'bulk test two')]
+    params = {
+        'grants': grants,
+        'm': 2,
+        'n': 3,
+        'expiration': (maya.now() + datetime.timedelta(days=3)).iso8601(),
+    }
+    return method_name, params
+
+
 @pytest.fixture(scope='module')
 def join_control_request(federated_bob, enacted_federated_policy):
     method_name = 'join_policy'
@@ -107,7 +107,34 @@ def test_alice_web_character_control_grant(alice_web_controller_test_client, gra
     assert b'non-hexadecimal number found in fromhex' in response.data
 
 
-def test_alice_character_control_revoke(alice_web_controller_test_client, federated_bob):
+def test_alice_web_character_control_bulk_grant(alice_web_controller_test_client, bulk_grant_control_request):
+    method_name, params = bulk_grant_control_request
+    endpoint = f'/{method_name}'
+
+    response = alice_web_controller_test_client.put(endpoint, data=json.dumps(params))
+    assert response.status_code == 200
+
+    response_data = json.loads(response.data)
+    assert 'alice_verifying_key' in response_data['result']
+    granted = response_data['result']['grants']
+    assert [grant['label'] for grant in granted] == [grant['label'] for grant in params['grants']]
+    for grant in granted:
+        assert 'policy_encrypting_key' in grant
+        encrypted_map = TreasureMap.from_bytes(b64decode(grant['treasure_map']))
+        assert encrypted_map._hrac is not None
+
+    # Nothing to grant
+    response = alice_web_controller_test_client.put(endpoint, data=json.dumps(dict(params, grants=[])))
+    assert response.status_code == 400
+
+    # Malform one of the grants
+    bad_grants = [dict(params['grants'][0]), params['grants'][1]]
+    del(bad_grants[0]['bob_encrypting_key'])
+    response = alice_web_controller_test_client.put(endpoint, data=json.dumps(dict(params, grants=bad_grants)))
+    assert response.status_code == 400
+
+
+def test_alice_character_control_revoke(alice_web_controller_test_client, federated_alice, federated_bob):
     bob_pubkey_enc = federated_bob.public_keys(DecryptingPower)
 
     grant_request_data = {
@@ -121,6 +148,10 @@ def test_alice_character_control_revoke(alice_web_controller_test_client, federa
     response = alice_web_controller_test_client.put('/grant', data=json.dumps(grant_request_data))
     assert response.status_code == 200
 
+    # Grants return once m kfrags are sent; every Ursula needs hers to revoke it.
+    for policy in federated_alice.active_policies.values():
+        policy.block_until_enacted()
+
     revoke_request_data = {
         'label': 'test',
         'bob_verifying_key': bytes(federated_bob.stamp).hex()
@@ -93,6 +93,9 @@ def test_bob_joins_policy_and_retrieves(federated_alice,
     assert bob == policy.bob
     assert label == policy.label
 
+    # Grant returns once m kfrags are sent; the rest must arrive before every Ursula can serve, and be revoked.
+    policy.block_until_enacted()
+
     try:
         # Now, Bob joins the policy
         bob.join_policy(label=label,
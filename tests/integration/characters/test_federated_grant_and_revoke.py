@@ -50,7 +50,8 @@ def test_federated_grant(federated_alice, federated_bob):
     # The number of actually enacted arrangements is exactly equal to n.
     assert len(policy._enacted_arrangements) == n
 
-    # Let's look at the enacted arrangements.
+    # Let's look at the enacted arrangements, once every kfrag has been sent (grant returns after m of them).
+    policy.block_until_enacted()
     for kfrag in policy.kfrags:
         arrangement = policy._enacted_arrangements[kfrag]
 
@@ -60,6 +61,55 @@ def test_federated_grant(federated_alice, federated_bob):
         assert kfrag == retrieved_kfrag
 
 
+@pytest.mark.usefixtures('federated_ursulas')
+def test_federated_bulk_grant(federated_alice, federated_bob):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    labels = [b"bulk grant one", b"bulk grant two", b"bulk grant three"]
+
+    policies = federated_alice.bulk_grant(grants=[(federated_bob, label) for label in labels],
+                                          m=m, n=n, expiration=policy_end_datetime)
+    assert [policy.label for policy in policies] == labels
+
+    for policy in policies:
+        assert federated_alice.active_policies[policy.id] == policy
+        policy.block_until_enacted()
+        assert len(policy._enacted_arrangements) == n
+        for kfrag in policy.kfrags:
+            arrangement = policy._enacted_arrangements[kfrag]
+            with arrangement.ursula.datastore.describe(PolicyArrangement, arrangement.id.hex()) as policy_arrangement:
+                assert kfrag == policy_arrangement.kfrag
+
+    # The Ursulas were sampled once, for all of the policies.
+    ursulas_of_each_policy = [{node_id for node_id, _arrangement_id in policy.treasure_map} for policy in policies]
+    assert all(ursulas == ursulas_of_each_policy[0] for ursulas in ursulas_of_each_policy)
+
+    with pytest.raises(ValueError):
+        federated_alice.bulk_grant(grants=[], m=m, n=n, expiration=policy_end_datetime)
+
+
+@pytest.mark.usefixtures('federated_ursulas')
+def test_federated_grant_with_pregenerated_kfrags(alice_federated_test_config, federated_bob):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"pregenerated kfrags"
+
+    alice = alice_federated_test_config.produce(kfrag_workers=1)
+    try:
+        public_key, kfrags = alice.pregenerate_kfrags(bob=federated_bob, label=label, m=m, n=n).result()
+        policy = alice.grant(federated_bob, label, m=m, n=n, expiration=policy_end_datetime)
+        assert (alice.kfrag_pool.hits, alice.kfrag_pool.pending) == (1, 0)
+        assert policy.public_key == public_key == alice.get_policy_encrypting_key_from_label(label)
+        assert policy.kfrags == kfrags
+
+        # Without kfrags generated ahead of time, they're generated as the policy is granted.
+        other_policy = alice.grant(federated_bob, b"not pregenerated", m=m, n=n, expiration=policy_end_datetime)
+        assert alice.kfrag_pool.misses == 1
+        assert len(other_policy.kfrags) == n
+    finally:
+        alice.disenchant()
+
+
 def test_federated_alice_can_decrypt(federated_alice, federated_bob):
     """
     Test that alice can decrypt data encrypted by an enrico
@@ -107,6 +157,7 @@ def test_revocation(federated_alice, federated_bob):
     label = b"revocation test"
 
     policy = federated_alice.grant(federated_bob, label, m=m, n=n, expiration=policy_end_datetime)
+    policy.block_until_enacted()  # So that every Ursula has an arrangement to revoke.
 
     # Test that all arrangements are included in the RevocationKit
     for node_id, arrangement_id in policy.treasure_map:
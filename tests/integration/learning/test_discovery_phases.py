@@ -157,6 +157,9 @@ def test_mass_treasure_map_placement(fleet_of_highperf_mocked_ursulas,
         # Causes rest app to be made (happens JIT in other testS)
         highperf_mocked_alice.network_middleware.client.parse_node_or_host_and_port(node)
 
+        # These nodes have no datastore behind them, so keep their maps in a plain dict.
+        node.treasure_maps = dict()
+
         def _partial_rest_app(node):
             def faster_receive_map(treasure_map_id, *args, **kwargs):
                 node.treasure_maps[treasure_map_id] = True
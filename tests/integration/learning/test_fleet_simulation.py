@@ -0,0 +1,58 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from tests.utils.fleet_simulation import FleetSimulation
+
+
+@pytest.fixture(scope='module')
+def simulated_fleet(ursula_federated_test_config):
+    with FleetSimulation(ursula_config=ursula_federated_test_config,
+                         quantity=300,
+                         view_size=30,
+                         loss=0.1,
+                         churn=0.05,
+                         seed=1) as simulation:
+        yield simulation
+
+
+def test_learner_converges_on_a_lossy_churning_fleet(simulated_fleet):
+    report = simulated_fleet.run(target_coverage=0.9)
+
+    assert report.converged
+    assert report.known_nodes >= 0.9 * report.fleet_size
+    assert report.failed_requests > 0  # Loss and churn did happen...
+    assert report.requests == report.rounds  # ...and every round was an attempt to learn.
+    assert report.bytes_received > 0
+    assert report.simulated_network_seconds > 0
+    assert sum(report.nodes_learned_per_round) == report.known_nodes - 1  # Less the original teacher
+
+
+def test_fleet_simulation_is_reproducible(simulated_fleet):
+    first = simulated_fleet.run()
+    second = simulated_fleet.run()
+    for field in first.DETERMINISTIC_FIELDS:
+        assert getattr(first, field) == getattr(second, field)
+
+    baseline = first.to_dict()
+    assert not second.regressions(baseline, cpu_tolerance=float('inf'))
+
+    baseline['rounds'] -= 1
+    baseline['bytes_received'] -= 1
+    problems = second.regressions(baseline, cpu_tolerance=float('inf'))
+    assert len(problems) == 2
@@ -0,0 +1,88 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.network.admission import AdmissionController
+from nucypher.policy.collections import WorkOrder
+
+
+@pytest.fixture(scope='module')
+def ursula_and_work_order(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas,
+                          capsule_side_channel):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+    capsule = capsule_side_channel().capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+    work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                            alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                            capsules=[capsule],
+                                            ursula=ursula,
+                                            bob=federated_bob)
+    return ursula, work_order
+
+
+@pytest.fixture(scope='function')
+def saturated_ursula(ursula_and_work_order):
+    ursula, work_order = ursula_and_work_order
+    original_controller = ursula.admission_controller
+    ursula.admission_controller = AdmissionController(max_concurrent_requests=4)
+    try:
+        # Requests already in progress fill everything but the share kept for re-encryption.
+        tickets = [ursula.admission_controller.admit('all_known_nodes') for _ in range(3)]
+        yield ursula, work_order
+        for ticket in tickets:
+            ticket.release()
+    finally:
+        ursula.admission_controller = original_controller
+
+
+def test_saturated_ursula_sheds_status_and_learning(saturated_ursula):
+    ursula, _work_order = saturated_ursula
+    client = ursula.rest_app.test_client()
+
+    for path in ('/status/', '/node_metadata'):
+        response = client.get(path)
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == str(AdmissionController.DEFAULT_RETRY_AFTER)
+
+    rejected = ursula.admission_controller.rejected
+    assert rejected[(AdmissionController.STATUS, AdmissionController.SATURATED)] == 1
+    assert rejected[(AdmissionController.LEARNING, AdmissionController.SATURATED)] == 1
+
+
+def test_saturated_ursula_still_reencrypts(saturated_ursula):
+    ursula, work_order = saturated_ursula
+    client = ursula.rest_app.test_client()
+
+    response = client.post(f'/kFrag/{work_order.arrangement_id.hex()}/reencrypt', data=work_order.payload())
+    assert response.status_code == 200
+    assert response.data
+
+    # Once the response has been sent, the request is no longer in flight.
+    response.close()
+    assert ursula.admission_controller.in_flight[AdmissionController.REENCRYPTION] == 0
+
+
+def test_ursula_serves_with_enough_threads_to_shed_load(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    deployer = ursula.get_deployer()
+    assert deployer.threadpool.max == ursula.admission_controller.server_threads
+    assert deployer.threadpool.max > ursula.admission_controller.max_concurrent_requests
@@ -0,0 +1,111 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+
+import pytest
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.datastore.models import Workorder
+from nucypher.policy.collections import WorkOrder
+
+
+@pytest.fixture(scope='module')
+def ursula_and_arrangement(enacted_federated_policy, federated_ursulas):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+    return ursula, arrangement_id
+
+
+def _work_order(bob, alice, policy, ursula, arrangement_id, message_kit):
+    capsule = message_kit.capsule
+    capsule.set_correctness_keys(delegating=policy.public_key,
+                                 receiving=bob.public_keys(DecryptingPower),
+                                 verifying=alice.stamp.as_umbral_pubkey())
+    return WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                      alice_verifying=alice.stamp.as_umbral_pubkey(),
+                                      capsules=[capsule],
+                                      ursula=ursula,
+                                      bob=bob)
+
+
+def test_batch_reencryption(enacted_federated_policy,
+                            federated_alice,
+                            federated_bob,
+                            ursula_and_arrangement,
+                            capsule_side_channel):
+    ursula, arrangement_id = ursula_and_arrangement
+    work_orders = [_work_order(federated_bob, federated_alice, enacted_federated_policy,
+                               ursula, arrangement_id, capsule_side_channel())
+                   for _ in range(3)]
+
+    results = federated_bob.network_middleware.reencrypt_batch(work_orders)
+    assert len(results) == len(work_orders)
+
+    for work_order, (status, cfrags_and_signatures) in zip(work_orders, results):
+        assert status == 200
+        cfrags = work_order.complete(cfrags_and_signatures)
+        assert len(cfrags) == 1
+        capsule = list(work_order.tasks)[0]
+        assert cfrags[0].verify_correctness(capsule)
+
+    # Ursula saved every work order in the batch.
+    receipts = [work_order.receipt_signature for work_order in work_orders]
+    with ursula.datastore.query_by(Workorder, filter_field='bob_signature',
+                                   filter_func=lambda signature: signature in receipts) as saved_work_orders:
+        assert len(saved_work_orders) == len(work_orders)
+
+
+def test_batch_reencryption_reports_each_failure(enacted_federated_policy,
+                                                federated_alice,
+                                                federated_bob,
+                                                ursula_and_arrangement,
+                                                capsule_side_channel):
+    ursula, arrangement_id = ursula_and_arrangement
+
+    good = _work_order(federated_bob, federated_alice, enacted_federated_policy,
+                       ursula, arrangement_id, capsule_side_channel())
+
+    unknown_arrangement = _work_order(federated_bob, federated_alice, enacted_federated_policy,
+                                      ursula, os.urandom(len(arrangement_id)), capsule_side_channel())
+
+    forged = _work_order(federated_bob, federated_alice, enacted_federated_policy,
+                         ursula, arrangement_id, capsule_side_channel())
+    forged.receipt_signature = good.receipt_signature
+
+    results = federated_bob.network_middleware.reencrypt_batch([unknown_arrangement, good, forged])
+    statuses = [status for status, _result in results]
+    assert statuses == [404, 200, 401]
+
+    # The good work order in the middle of the batch was still served.
+    _status, cfrags_and_signatures = results[1]
+    assert len(good.complete(cfrags_and_signatures)) == 1
+
+
+def test_batch_of_work_orders_must_be_for_one_ursula(enacted_federated_policy,
+                                                     federated_alice,
+                                                     federated_bob,
+                                                     federated_ursulas,
+                                                     capsule_side_channel):
+    work_orders = list()
+    for node_id, arrangement_id in list(enacted_federated_policy.treasure_map)[:2]:
+        ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+        work_orders.append(_work_order(federated_bob, federated_alice, enacted_federated_policy,
+                                       ursula, arrangement_id, capsule_side_channel()))
+
+    with pytest.raises(ValueError):
+        federated_bob.network_middleware.reencrypt_batch(work_orders)
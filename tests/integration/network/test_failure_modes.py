@@ -16,6 +16,9 @@
 """
 
 import datetime
+import time
+from threading import Event
+
 import maya
 import os
 import pytest
@@ -25,9 +28,10 @@ from bytestring_splitter import BytestringSplittingError
 from functools import partial
 from twisted.internet import threads
 
+from nucypher.network.middleware import RestMiddleware
 from nucypher.policy.collections import TreasureMap
 from nucypher.policy.policies import Policy
-from tests.utils.middleware import EvilMiddleWare, NodeIsDownMiddleware
+from tests.utils.middleware import EvilMiddleWare, NodeIsDownMiddleware, SluggishNodesMiddleware
 from tests.utils.ursula import make_federated_ursulas
 
 
@@ -94,6 +98,107 @@ def test_alice_can_grant_even_when_the_first_nodes_she_tries_are_down(federated_
     assert len(policy._enacted_arrangements) == n
 
 
+def test_rejected_and_unresponsive_arrangements_are_replaced(federated_alice, federated_bob, federated_ursulas):
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"proposed concurrently",
+                                           m=2, n=3,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    middleware = SluggishNodesMiddleware()
+    down_node, hanging_node, *_ = candidates = list(federated_ursulas)
+    middleware.node_is_down(down_node)
+    middleware.hanging_nodes.add(hanging_node.checksum_address)
+
+    try:
+        started = time.monotonic()
+        policy._propose_arrangements(network_middleware=middleware,
+                                     candidate_ursulas=[down_node, hanging_node] + candidates[2:])
+        elapsed = time.monotonic() - started
+    finally:
+        middleware.released.set()
+
+    # Others were asked in place of the node that's down and the one that timed out, without starting over.
+    assert len(policy._accepted_arrangements) == policy.n
+    assert {down_node, hanging_node}.isdisjoint(policy.accepted_ursulas)
+    assert elapsed < 2 * middleware.hang_for
+    assert 1 < middleware.most_in_flight <= policy.n
+    # Candidates that were never asked are kept as spares.
+    assert len(policy._spare_candidates) >= len(candidates) - policy.n - 2
+
+
+def test_arrangement_proposals_give_up_at_the_deadline(federated_alice, federated_bob, federated_ursulas):
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"proposed before a deadline",
+                                           m=2, n=3,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    middleware = SluggishNodesMiddleware(hang_for=60)
+    responsive_nodes = list(federated_ursulas)[:2]
+    middleware.hanging_nodes.update(federated_alice.known_nodes.addresses())
+    middleware.hanging_nodes.update(u.checksum_address for u in federated_ursulas)
+    middleware.hanging_nodes.difference_update(u.checksum_address for u in responsive_nodes)
+
+    try:
+        started = time.monotonic()
+        with pytest.raises(Policy.Rejected):
+            policy.make_arrangements(network_middleware=middleware,
+                                     handpicked_ursulas=set(federated_ursulas),
+                                     timeout=0.5)
+        assert time.monotonic() - started < 3
+    finally:
+        middleware.released.set()
+    assert policy.accepted_ursulas == set(responsive_nodes)
+
+
+def test_enactment_completes_once_m_ursulas_have_their_kfrags(federated_alice, federated_bob, federated_ursulas):
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"enacted without waiting for everyone",
+                                           m=2, n=3,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    middleware = SluggishNodesMiddleware(hang_for=60)
+    policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=set(list(federated_ursulas)[:3]))
+    slow_ursula = next(iter(policy.accepted_ursulas))
+    middleware.hanging_nodes.add(slow_ursula.checksum_address)
+
+    try:
+        started = time.monotonic()
+        policy.enact(network_middleware=middleware, publish_treasure_map=False)
+        assert time.monotonic() - started < 5
+        assert len(policy.treasure_map.destinations) == policy.n
+        statuses = {a.ursula: a.status for a in policy._enacted_arrangements.values()}
+        assert statuses.pop(slow_ursula) is None
+        assert set(statuses.values()) == {200}
+    finally:
+        middleware.released.set()
+
+    # The slow Ursula's kfrag is still sent in the background; here, it times out.
+    statuses = policy.block_until_enacted(timeout=10)
+    assert len(statuses) == policy.n - 1
+
+
+def test_claims_of_freeloading_made_after_enactment_are_heard(federated_alice, federated_bob, federated_ursulas):
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"enacted, then claimed unpaid",
+                                           m=1, n=4,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    middleware = SluggishNodesMiddleware()
+    policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=set(list(federated_ursulas)[:4]))
+    honest_ursula = next(iter(policy.accepted_ursulas))
+    claimed_unpaid = Event()
+
+    def enact_policy(ursula, kfrag_id, payload):
+        if ursula == honest_ursula:
+            return SluggishNodesMiddleware.enact_policy(middleware, ursula, kfrag_id, payload)
+        claimed_unpaid.wait(timeout=10)  # Only once the policy has been enacted
+        raise RestMiddleware.UnexpectedResponse("Alice didn't pay", status=402)
+
+    middleware.enact_policy = enact_policy
+    try:
+        policy.enact(network_middleware=middleware, publish_treasure_map=False)
+    finally:
+        claimed_unpaid.set()
+    with pytest.raises(federated_alice.NotEnoughNodes):
+        policy.block_until_enacted(timeout=10)
+
+
 def test_node_has_changed_cert(federated_alice, federated_ursulas):
     federated_alice.known_nodes._nodes = {}
     federated_alice.network_middleware = NodeIsDownMiddleware()
@@ -0,0 +1,84 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.crypto.reencryption import ReencryptionPool
+from nucypher.network.middleware import RestMiddleware
+from nucypher.policy.collections import WorkOrder
+
+
+@pytest.fixture(scope='module')
+def ursula_and_arrangement(enacted_federated_policy, federated_ursulas):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+    return ursula, arrangement_id
+
+
+@pytest.fixture(scope='function')
+def make_work_order(enacted_federated_policy, federated_alice, federated_bob, ursula_and_arrangement,
+                    capsule_side_channel):
+    ursula, arrangement_id = ursula_and_arrangement
+
+    def _make_work_order(number_of_capsules=1):
+        capsules = list()
+        for _ in range(number_of_capsules):
+            capsule = capsule_side_channel().capsule
+            capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                         receiving=federated_bob.public_keys(DecryptingPower),
+                                         verifying=federated_alice.stamp.as_umbral_pubkey())
+            capsules.append(capsule)
+        return WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                          alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                          capsules=capsules,
+                                          ursula=ursula,
+                                          bob=federated_bob)
+    return _make_work_order
+
+
+def test_ursula_reencrypts_in_worker_processes(ursula_and_arrangement, federated_bob, make_work_order):
+    ursula, _arrangement_id = ursula_and_arrangement
+    ursula.reencryption_pool = ReencryptionPool(workers=2)
+    try:
+        work_order = make_work_order(number_of_capsules=3)
+        cfrags_and_signatures = federated_bob.network_middleware.reencrypt(work_order)
+    finally:
+        ursula.reencryption_pool.shutdown()
+        ursula.reencryption_pool = None
+
+    cfrags = work_order.complete(cfrags_and_signatures)
+    assert len(cfrags) == 3
+    for capsule, cfrag in zip(work_order.tasks, cfrags):
+        assert cfrag.verify_correctness(capsule)
+
+
+def test_busy_ursula_asks_bob_to_retry(ursula_and_arrangement, federated_bob, make_work_order, mocker):
+    ursula, _arrangement_id = ursula_and_arrangement
+    ursula.reencryption_pool = mocker.Mock(reencrypt_iter=mocker.Mock(side_effect=ReencryptionPool.Busy))
+    try:
+        work_order = make_work_order()
+        with pytest.raises(RestMiddleware.UnexpectedResponse) as e:
+            federated_bob.network_middleware.reencrypt(work_order)
+        assert e.value.status == 503
+
+        response = federated_bob.network_middleware.send_work_orders_payload_to_ursula([work_order])
+        assert response.headers['Retry-After']
+        [(status, _message)] = federated_bob.network_middleware._parse_reencryption_batch(response.content)
+        assert status == 503
+    finally:
+        ursula.reencryption_pool = None
@@ -0,0 +1,165 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+
+import pytest
+import requests
+from bytestring_splitter import VariableLengthBytestring
+from constant_sorrow.constants import EXEMPT_FROM_VERIFICATION, FLEET_STATES_MATCH
+from cryptography.hazmat.primitives import serialization
+
+from nucypher.crypto.powers import DecryptingPower
+from nucypher.crypto.signing import signature_splitter
+from nucypher.crypto.splitters import cfrag_splitter
+from nucypher.network.admission import AdmissionController
+from nucypher.network.middleware import RestMiddleware
+from nucypher.network.processes import RESTProcessPool, _PooledWSGIServer
+from nucypher.policy.collections import WorkOrder
+from tests.utils.ursula import make_federated_ursulas
+
+
+@pytest.fixture(scope='module')
+def ursula_served_from_processes(enacted_federated_policy, federated_alice, federated_bob, federated_ursulas,
+                                 capsule_side_channel, tmpdir_factory):
+    node_id, arrangement_id = list(enacted_federated_policy.treasure_map)[0]
+    ursula = {u.checksum_address: u for u in federated_ursulas}[node_id]
+
+    certificate_filepath = str(tmpdir_factory.mktemp('certificates').join('ursula.pem'))
+    with open(certificate_filepath, 'wb') as certificate_file:
+        certificate_file.write(ursula.rest_server_certificate().public_bytes(serialization.Encoding.PEM))
+
+    capsule = capsule_side_channel().capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=federated_alice.stamp.as_umbral_pubkey())
+    work_order = WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                            alice_verifying=federated_alice.stamp.as_umbral_pubkey(),
+                                            capsules=[capsule],
+                                            ursula=ursula,
+                                            bob=federated_bob)
+
+    pool = RESTProcessPool(ursula=ursula, processes=2)
+    pool.start()
+    try:
+        yield ursula, pool, certificate_filepath, work_order
+    finally:
+        pool.stop()
+
+
+def test_rest_processes_reencrypt(ursula_served_from_processes):
+    ursula, pool, certificate_filepath, work_order = ursula_served_from_processes
+    assert len(pool.pids) == 2
+    route = '/kFrag/<id_as_hex>/reencrypt'
+    answered = ursula.rest_statistics.requests[(route, 'POST', '200')]
+    admitted = ursula.admission_controller.admitted[AdmissionController.REENCRYPTION]
+
+    client = RestMiddleware().client
+    for _ in range(4):
+        response = client.post(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                               host=ursula.rest_interface.host,
+                               port=ursula.rest_interface.port,
+                               certificate_filepath=certificate_filepath,
+                               path=f"kFrag/{work_order.arrangement_id.hex()}/reencrypt",
+                               data=work_order.payload(),
+                               timeout=10)
+        assert response.status_code == 200
+        cfrags_and_signatures = (cfrag_splitter + signature_splitter).repeat(response.content)
+        assert len(cfrags_and_signatures) == 1
+
+    # The coordinator hears about every request the REST processes answer, for her metrics.
+    deadline = time.monotonic() + 10
+    while (ursula.rest_statistics.requests[(route, 'POST', '200')] - answered < 4
+           or ursula.admission_controller.admitted[AdmissionController.REENCRYPTION] - admitted < 4):
+        assert time.monotonic() < deadline, "The coordinator never heard about the requests."
+        time.sleep(0.1)
+
+
+def test_nodes_announced_to_rest_processes_are_learned_by_the_coordinator(ursula_served_from_processes,
+                                                                          ursula_federated_test_config):
+    ursula, pool, certificate_filepath, _work_order = ursula_served_from_processes
+    newcomer = make_federated_ursulas(ursula_config=ursula_federated_test_config, quantity=1, know_each_other=False).pop()
+    assert newcomer.checksum_address not in ursula.known_nodes
+
+    client = RestMiddleware().client
+    response = client.post(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                           host=ursula.rest_interface.host,
+                           port=ursula.rest_interface.port,
+                           certificate_filepath=certificate_filepath,
+                           path="node_metadata",
+                           data=bytes(VariableLengthBytestring(newcomer)),
+                           timeout=10)
+    assert response.status_code == 200
+
+    deadline = time.monotonic() + 10
+    while newcomer.checksum_address not in ursula.known_nodes:
+        assert time.monotonic() < deadline, "The coordinator never learned about the announced node."
+        time.sleep(0.1)
+
+    # ...and once the coordinator passes on what it knows, the REST processes share its fleet state.
+    pool.sync_known_nodes()
+    consecutive_matches = 0
+    deadline = time.monotonic() + 10
+    while consecutive_matches < 2 * len(pool.pids):
+        assert time.monotonic() < deadline, "The REST processes never caught up with the coordinator."
+        response = client.post(node_or_sprout=EXEMPT_FROM_VERIFICATION,
+                               host=ursula.rest_interface.host,
+                               port=ursula.rest_interface.port,
+                               certificate_filepath=certificate_filepath,
+                               path="node_metadata",
+                               params={'fleet': ursula.known_nodes.checksum},
+                               data=b"",
+                               timeout=10)
+        assert response.status_code == 200
+        if response.content.endswith(bytes(FLEET_STATES_MATCH)):
+            consecutive_matches += 1
+        else:
+            consecutive_matches = 0
+            time.sleep(0.1)
+
+
+def test_rest_processes_serve_requests_from_a_bounded_number_of_threads():
+    threads, requested = 2, 6
+    released, lock = Event(), Lock()
+    serving = {'now': 0, 'most': 0}
+
+    def app(environ, start_response):
+        with lock:
+            serving['now'] += 1
+            serving['most'] = max(serving['most'], serving['now'])
+        released.wait(timeout=10)
+        with lock:
+            serving['now'] -= 1
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [b'served']
+
+    server = _PooledWSGIServer('127.0.0.1', 0, app, threads=threads)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/'
+    try:
+        with ThreadPoolExecutor(max_workers=requested) as clients:
+            responses = [clients.submit(requests.get, url, timeout=10) for _ in range(requested)]
+            time.sleep(0.5)
+            assert serving['most'] == threads  # The rest wait their turn.
+            released.set()
+            assert all(response.result().content == b'served' for response in responses)
+    finally:
+        released.set()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,57 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from prometheus_client.registry import CollectorRegistry
+
+from nucypher.utilities.prometheus.collector import RESTMetricsCollector
+
+
+def test_rest_requests_are_recorded_by_route_template(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    client = ursula.rest_app.test_client()
+    statistics = ursula.rest_statistics
+    status_key = ('/status/', 'GET', '200')
+    reencrypt_key = ('/kFrag/<id_as_hex>/reencrypt', 'POST', '404')
+    before = dict(statistics.requests)
+
+    assert client.get('/status/').status_code == 200
+    for arrangement_id in ('aa' * 16, 'bb' * 16):  # Unknown arrangements
+        assert client.post(f'/kFrag/{arrangement_id}/reencrypt', data=b'not a work order').status_code == 404
+    response = client.get('/no/such/route')
+    assert response.status_code == 404
+    assert response.data  # Requests are recorded once their responses have been sent
+
+    assert statistics.requests[status_key] == before.get(status_key, 0) + 1
+    assert statistics.requests[reencrypt_key] == before.get(reencrypt_key, 0) + 2
+    assert statistics.requests[('unmatched', 'GET', '404')] >= 1
+    assert not any(arrangement_id in route for route, _method, _status in statistics.requests
+                   for arrangement_id in ('aa' * 16, 'bb' * 16))
+
+
+def test_rest_metrics_collector(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    registry = CollectorRegistry()
+    collector = RESTMetricsCollector(ursula=ursula)
+    collector.initialize(metrics_prefix='test', registry=registry)
+    try:
+        ursula.rest_app.test_client().get('/status/')
+        labels = {'route': '/status/', 'method': 'GET'}
+        assert registry.get_sample_value('test_rest_requests_total', dict(labels, status='200')) == 1
+        assert registry.get_sample_value('test_rest_request_duration_seconds_count', labels) == 1
+        assert registry.get_sample_value('test_rest_response_bytes_sum', labels) > 0
+    finally:
+        ursula.rest_statistics.observer = None
@@ -0,0 +1,71 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def ursula(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    ursula.status_page.clear()
+    return ursula
+
+
+def test_status_page_is_served_from_a_snapshot(ursula):
+    client = ursula.rest_app.test_client()
+    renders = ursula.status_page.renders
+
+    response = client.get('/status/')
+    assert response.status_code == 200
+    assert ursula.checksum_address.encode() in response.data
+    etag = response.headers['ETag']
+
+    response = client.get('/status/')
+    assert response.status_code == 200
+    assert response.headers['ETag'] == etag
+    assert ursula.status_page.renders == renders + 1
+
+    response = client.get('/status/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert not response.data
+
+
+def test_paginated_json_status(ursula):
+    client = ursula.rest_app.test_client()
+    known_nodes = sorted(ursula.known_nodes.addresses())
+    assert len(known_nodes) > 2
+
+    pages = list()
+    for page in range(1, len(known_nodes) + 1):
+        response = client.get(f'/status/?json=true&page={page}&per_page=2')
+        assert response.status_code == 200
+        status = response.get_json()
+        assert status['total_known_nodes'] == len(known_nodes)
+        assert status['staker_address'] == ursula.checksum_address
+        assert len(status['states']) <= ursula.PAGINATED_FLEET_STATES
+        if not status['known_nodes']:
+            break
+        pages.append(list(status['known_nodes']))
+    assert [address for page in pages for address in page] == known_nodes
+    assert all(len(page) <= 2 for page in pages)
+
+    etag = client.get('/status/?json=true&page=1&per_page=2').headers['ETag']
+    response = client.get('/status/?json=true&page=1&per_page=2', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+    for bad_query in ('page=0', 'page=1&per_page=0', 'page=one', 'page=1&per_page=100000'):
+        assert client.get(f'/status/?json=true&{bad_query}').status_code == 400
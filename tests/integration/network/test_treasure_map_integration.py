@@ -15,10 +15,14 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import maya
 import pytest
 
 from nucypher.characters.lawful import Ursula
 from nucypher.crypto.api import keccak_digest
+from nucypher.datastore.datastore import RecordNotFound
+from nucypher.datastore.models import TreasureMap as TreasureMapRecord
+from nucypher.network.server import FEDERATED_TREASURE_MAP_LIFETIME_DAYS
 from tests.utils.middleware import MockRestMiddleware
 
 
@@ -128,3 +132,23 @@ def test_alice_does_not_update_with_old_ursula_info(federated_alice, federated_u
 
     new_metadata = bytes(federated_alice.known_nodes[ursula.checksum_address])
     assert new_metadata != old_metadata
+
+
+def test_federated_treasure_map_is_kept_as_long_as_alices_arrangements(federated_alice, federated_bob,
+                                                                       federated_ursulas):
+    expiration = maya.now().add(days=FEDERATED_TREASURE_MAP_LIFETIME_DAYS * 2)
+    policy = federated_alice.grant(federated_bob, b'a long policy', m=2, n=3, expiration=expiration)
+    policy.block_until_enacted()
+
+    # The Ursulas with one of Alice's arrangements keep the map for as long as it, wherever it was published.
+    treasure_map_id = policy.treasure_map.public_id()
+    ursulas = {u.checksum_address: u for u in federated_ursulas}
+    checked = 0
+    for node_id, _arrangement_id in policy.treasure_map:
+        try:
+            with ursulas[node_id].datastore.describe(TreasureMapRecord, treasure_map_id) as record:
+                assert record.expiration >= expiration
+        except RecordNotFound:
+            continue
+        checked += 1
+    assert checked
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+"""
+Simulates learning against in-process fleets of mock Ursulas and reports convergence
+time, bytes transferred and CPU per learning round.
+
+    python tests/metrics/fleet_learning_report.py --nodes 500 --nodes 5000 --loss 0.05 --churn 0.02 --output report.json
+
+Pass a previous report as --baseline to use this as a performance regression gate;
+the script exits non-zero if any fleet size got worse.
+"""
+
+import argparse
+import json
+import sys
+from os.path import abspath, dirname, join
+
+import tabulate
+
+sys.path.insert(0, abspath(join(dirname(__file__), '..', '..')))
+
+from tests.utils.config import make_ursula_test_configuration
+from tests.utils.fleet_simulation import FleetSimulation
+from tests.utils.ursula import MOCK_URSULA_STARTING_PORT
+
+
+def simulate(fleet_sizes, **simulation_parameters):
+    ursula_config = make_ursula_test_configuration(federated=True, rest_port=MOCK_URSULA_STARTING_PORT)
+    try:
+        for fleet_size in fleet_sizes:
+            with FleetSimulation(ursula_config=ursula_config, quantity=fleet_size, **simulation_parameters) as simulation:
+                yield simulation.run()
+    finally:
+        ursula_config.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, action='append', help="Fleet size; may be repeated (default 500)")
+    parser.add_argument('--view-size', type=int, default=100, help="Number of nodes each fleet node knows about")
+    parser.add_argument('--latency', type=float, default=0.05, help="Mean request latency in seconds")
+    parser.add_argument('--latency-jitter', type=float, default=0.02, help="Standard deviation of request latency")
+    parser.add_argument('--loss', type=float, default=0.0, help="Fraction of requests which are lost")
+    parser.add_argument('--churn', type=float, default=0.0, help="Fraction of the fleet which is down each round")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the report to this JSON file")
+    parser.add_argument('--baseline', help="Compare against this JSON report and fail on regressions")
+    parser.add_argument('--cpu-tolerance', type=float, default=0.5,
+                        help="Allowed fractional increase in mean CPU per round before it counts as a regression")
+    args = parser.parse_args()
+
+    reports = list(simulate(fleet_sizes=args.nodes or [500],
+                            view_size=args.view_size,
+                            latency=args.latency,
+                            latency_jitter=args.latency_jitter,
+                            loss=args.loss,
+                            churn=args.churn,
+                            seed=args.seed))
+
+    headers = ('Nodes', 'Converged', 'Rounds', 'Known', 'Requests', 'Failed', 'KiB received',
+               'Convergence (s)', 'CPU/round (ms)')
+    rows = [(r.fleet_size, r.converged, r.rounds, r.known_nodes, r.requests, r.failed_requests,
+             r.bytes_received // 1024, round(r.convergence_seconds, 2),
+             round(1000 * r.cpu_seconds / max(r.rounds, 1), 2)) for r in reports]
+    print(tabulate.tabulate(rows, headers=headers, tablefmt="simple"), end="\n\n")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(json.dumps([r.to_dict() for r in reports], indent=4))
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = {b['fleet_size']: b for b in json.load(file)}
+        failed = False
+        for report in reports:
+            if report.fleet_size not in baseline:
+                print(f"No baseline for a fleet of {report.fleet_size}.")
+                continue
+            for problem in report.regressions(baseline[report.fleet_size], cpu_tolerance=args.cpu_tolerance):
+                failed = True
+                print(f"REGRESSION ({report.fleet_size} nodes): {problem}")
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import tempfile
+
+import maya
+import pytest
+
+from nucypher.datastore.datastore import Datastore
+from nucypher.datastore.treasure_maps import TreasureMapStore
+
+
+class FakeTreasureMap:
+    def __init__(self, payload: bytes):
+        self.payload = payload
+
+    @classmethod
+    def from_bytes(cls, bytes_representation, verify=True):
+        return cls(bytes_representation)
+
+    def __bytes__(self):
+        return self.payload
+
+    def __eq__(self, other):
+        return self.payload == other.payload
+
+
+@pytest.fixture()
+def datastore():
+    return Datastore(tempfile.mkdtemp())
+
+
+def test_treasure_maps_survive_a_restart(datastore):
+    store = TreasureMapStore(datastore=datastore, map_class=FakeTreasureMap)
+    map_id = os.urandom(32)
+    store.store(map_id=map_id, treasure_map=FakeTreasureMap(b'a map'), expiration=maya.now().add(days=1))
+    assert store[map_id] == FakeTreasureMap(b'a map')
+
+    # A new store over the same datastore, like an Ursula that has just restarted.
+    restarted_store = TreasureMapStore(datastore=datastore, map_class=FakeTreasureMap)
+    assert restarted_store.cached == 0
+    assert map_id in restarted_store
+    assert restarted_store[map_id] == FakeTreasureMap(b'a map')
+    assert list(restarted_store.values()) == [FakeTreasureMap(b'a map')]
+
+    with pytest.raises(KeyError):
+        _map = restarted_store[os.urandom(32)]
+
+
+def test_treasure_maps_in_memory_are_bounded(datastore):
+    store = TreasureMapStore(datastore=datastore, map_class=FakeTreasureMap, cache_size=10)
+    expiration = maya.now().add(days=1)
+    map_ids = [os.urandom(32) for _ in range(50)]
+    for map_id in map_ids:
+        store.store(map_id=map_id, treasure_map=FakeTreasureMap(map_id), expiration=expiration)
+    assert store.cached == 10
+
+    # Maps that were pushed out of memory are still in the datastore.
+    for map_id in map_ids:
+        assert store[map_id] == FakeTreasureMap(map_id)
+    assert store.cached == 10
+
+
+def test_expired_treasure_maps_are_pruned(datastore):
+    store = TreasureMapStore(datastore=datastore, map_class=FakeTreasureMap)
+    now = maya.now()
+    expired_id, current_id = os.urandom(32), os.urandom(32)
+    store.store(map_id=expired_id, treasure_map=FakeTreasureMap(b'expired'), expiration=now.subtract(minutes=1))
+    store.store(map_id=current_id, treasure_map=FakeTreasureMap(b'current'), expiration=now.add(days=1))
+
+    # Expired maps aren't served, even before they are pruned.
+    assert expired_id not in store
+    assert current_id in store
+
+    assert store.prune(now=now) == 1
+    assert store.cached == 1
+    assert store.prune(now=now) == 0
+    assert list(store.values()) == [FakeTreasureMap(b'current')]
+
+    assert store.prune(now=now.add(days=2)) == 1
+    assert store.cached == 0
+    assert list(store.values()) == []
@@ -0,0 +1,159 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from nucypher.network.admission import AdmissionController, TokenBucket
+from nucypher.utilities.prometheus.collector import AdmissionMetricsCollector
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=2, burst=3, now=0)
+    assert [bucket.take(now=0) for _ in range(3)] == [0, 0, 0]
+    assert bucket.take(now=0) == 0.5
+    assert bucket.take(now=0.5) == 0
+    assert bucket.take(now=100) == 0
+    assert bucket.tokens == 2  # No more than the burst is saved up
+
+
+def test_lower_priority_classes_are_shed_first():
+    controller = AdmissionController(max_concurrent_requests=4)
+    assert controller.classify('reencrypt_via_rest') == AdmissionController.REENCRYPTION
+    assert controller.classify('node_metadata_exchange') == AdmissionController.LEARNING
+    assert controller.classify('status') == AdmissionController.STATUS
+    assert controller.classify(None) == AdmissionController.STATUS
+
+    # Status requests may only fill half of the server...
+    tickets = [controller.admit('status'), controller.admit('status')]
+    with pytest.raises(AdmissionController.Rejected) as rejection:
+        controller.admit('status')
+    assert (rejection.value.status, rejection.value.retry_after) == (503, AdmissionController.DEFAULT_RETRY_AFTER)
+
+    # ...learning three quarters of it...
+    tickets.append(controller.admit('all_known_nodes'))
+    with pytest.raises(AdmissionController.Rejected):
+        controller.admit('all_known_nodes')
+
+    # ...and re-encryption all of it.
+    tickets.append(controller.admit('reencrypt_via_rest'))
+    with pytest.raises(AdmissionController.Rejected):
+        controller.admit('reencrypt_via_rest')
+    assert sum(controller.in_flight.values()) == 4
+
+    # Tickets can be released more than once, but only count once.
+    tickets[0].release()
+    tickets[0].release()
+    assert sum(controller.in_flight.values()) == 3
+    controller.admit('reencrypt_via_rest')
+
+    assert controller.rejected == {(AdmissionController.STATUS, AdmissionController.SATURATED): 1,
+                                   (AdmissionController.LEARNING, AdmissionController.SATURATED): 1,
+                                   (AdmissionController.REENCRYPTION, AdmissionController.SATURATED): 1}
+
+
+def test_clients_are_rate_limited_per_class():
+    now = [0.0]
+    controller = AdmissionController(client_request_rate=1, client_request_burst=2, clock=lambda: now[0])
+
+    for _ in range(2):
+        controller.admit('status', client='10.0.0.1').release()
+    with pytest.raises(AdmissionController.Rejected) as rejection:
+        controller.admit('status', client='10.0.0.1')
+    assert (rejection.value.status, rejection.value.retry_after) == (429, 1)
+
+    # Other clients, and other classes of request from the same client, are unaffected.
+    controller.admit('status', client='10.0.0.2').release()
+    controller.admit('reencrypt_via_rest', client='10.0.0.1').release()
+
+    now[0] += 1
+    controller.admit('status', client='10.0.0.1').release()
+    assert controller.rejected == {(AdmissionController.STATUS, AdmissionController.RATE_LIMITED): 1}
+
+
+def test_admission_metrics_collector():
+    controller = AdmissionController(max_concurrent_requests=2)
+    collector = AdmissionMetricsCollector(ursula=Mock(admission_controller=controller))
+    registry = CollectorRegistry()
+    collector.initialize(metrics_prefix='test', registry=registry)
+
+    ticket = controller.admit('status')
+    for _ in range(2):
+        with pytest.raises(AdmissionController.Rejected):
+            controller.admit('status')
+    collector.collect()
+
+    def sample(name, **labels):
+        return registry.get_sample_value(f'test_rest_requests_{name}', labels=labels)
+
+    assert sample('admitted_total', priority_class='status') == 1
+    assert sample('rejected_total', priority_class='status', reason='saturated') == 2
+    assert sample('in_flight', priority_class='status') == 1
+
+    ticket.release()
+    controller.admit('reencrypt_via_rest')
+    collector.collect()
+    assert sample('admitted_total', priority_class='status') == 1
+    assert sample('admitted_total', priority_class='reencryption') == 1
+    assert sample('in_flight', priority_class='status') == 0
+    assert sample('in_flight', priority_class='reencryption') == 1
+
+
+def test_cheap_routes_are_held_to_their_own_share():
+    controller = AdmissionController()
+    ping_limit = int(AdmissionController.ROUTE_SHARES['ping'] * controller.max_concurrent_requests)
+
+    tickets = [controller.admit('ping') for _ in range(ping_limit)]
+    with pytest.raises(AdmissionController.Rejected) as rejection:
+        controller.admit('ping')
+    assert (rejection.value.reason, rejection.value.status) == (AdmissionController.ROUTE_SATURATED, 503)
+
+    # Though the server has room for other status requests.
+    controller.admit('node_status').release()
+    tickets.pop().release()
+    controller.admit('ping')
+    assert controller.in_flight_by_route['ping'] == ping_limit
+    assert controller.rejected == {(AdmissionController.STATUS, AdmissionController.ROUTE_SATURATED): 1}
+
+
+def test_default_limits_are_reached_before_the_server_runs_out_of_threads():
+    controller = AdmissionController()
+    for route in AdmissionController.ROUTE_SHARES:
+        assert int(AdmissionController.ROUTE_SHARES[route] * controller.max_concurrent_requests) >= 1
+
+    # Every admitted request holds a server thread; past the limits there are still threads to say no with.
+    tickets = list()
+    while True:
+        try:
+            tickets.append(controller.admit('reencrypt_via_rest'))
+        except AdmissionController.Rejected:
+            break
+    assert len(tickets) == controller.max_concurrent_requests < controller.server_threads
+
+
+def test_divided_limits_add_up_to_no_more_than_the_whole():
+    controller = AdmissionController(max_concurrent_requests=64, client_request_rate=6)
+    shares = [controller.divided(3) for _ in range(3)]
+    assert sum(share.max_concurrent_requests for share in shares) <= controller.max_concurrent_requests
+    assert sum(share.client_request_rate for share in shares) == controller.client_request_rate
+    assert all(share.server_threads > share.max_concurrent_requests for share in shares)
+
+    # However many there are, each may take at least one request at a time.
+    assert AdmissionController(max_concurrent_requests=2).divided(4).max_concurrent_requests == 1
+    assert AdmissionController().divided(4).client_request_rate is None
@@ -0,0 +1,172 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from prometheus_client import CollectorRegistry
+from twisted.internet import error
+from twisted.python.failure import Failure
+
+from nucypher.network.circuit_breaker import NodeCircuitBreaker
+from nucypher.network.exceptions import NodeCircuitOpen, NodeSeemsToBeDown
+from nucypher.network.middleware import AsyncNucypherMiddlewareClient, NucypherMiddlewareClient
+from nucypher.utilities.prometheus.collector import NodeCircuitBreakerMetricsCollector
+
+NODE = '127.0.0.1:9151'
+OTHER_NODE = '127.0.0.1:9152'
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture()
+def breaker(clock):
+    return NodeCircuitBreaker(failure_threshold=3, reset_timeout=10, jitter=0.5, clock=clock)
+
+
+def trip(breaker, node_address=NODE):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request(node_address)
+        breaker.record_failure(node_address)
+
+
+def test_open_circuit_is_a_connection_error():
+    assert issubclass(NodeCircuitOpen, requests.exceptions.ConnectionError)
+    assert issubclass(NodeCircuitOpen, NodeSeemsToBeDown)
+
+
+def test_circuit_opens_after_consecutive_failures(breaker):
+    for _ in range(breaker.failure_threshold - 1):
+        breaker.record_failure(NODE)
+    assert breaker.state(NODE) == NodeCircuitBreaker.CLOSED
+
+    # A success resets the count.
+    breaker.record_success(NODE)
+    breaker.record_failure(NODE)
+    assert breaker.state(NODE) == NodeCircuitBreaker.CLOSED
+    breaker.record_success(NODE)
+
+    trip(breaker)
+    assert breaker.state(NODE) == NodeCircuitBreaker.OPEN
+    assert breaker.total_trips == 1
+
+    with pytest.raises(NodeCircuitOpen):
+        breaker.before_request(NODE)
+    assert breaker.total_rejections == 1
+
+    # Other nodes are unaffected.
+    breaker.before_request(OTHER_NODE)
+    assert breaker.states() == {NODE: NodeCircuitBreaker.OPEN}
+
+
+def test_half_open_circuit_allows_a_single_probe(breaker, clock):
+    trip(breaker)
+
+    # The retry time is jittered, but never by more than the jitter fraction.
+    clock.now = 10 * (1 - breaker.jitter) - 0.01
+    with pytest.raises(NodeCircuitOpen):
+        breaker.before_request(NODE)
+
+    clock.now = 10 * (1 + breaker.jitter)
+    assert breaker.state(NODE) == NodeCircuitBreaker.HALF_OPEN
+    breaker.before_request(NODE)  # The probe
+    with pytest.raises(NodeCircuitOpen):
+        breaker.before_request(NODE)
+
+    breaker.record_success(NODE)
+    assert breaker.state(NODE) == NodeCircuitBreaker.CLOSED
+    assert breaker.states() == {}
+    breaker.before_request(NODE)
+
+
+def test_failed_probe_reopens_with_backoff(breaker, clock):
+    trip(breaker)
+    clock.now = 10 * (1 + breaker.jitter)
+    breaker.before_request(NODE)
+    breaker.record_failure(NODE)
+    assert breaker.state(NODE) == NodeCircuitBreaker.OPEN
+    assert breaker.total_trips == 2
+
+    # The second opening waits twice as long.
+    reopened_at = clock.now
+    clock.now = reopened_at + 20 * (1 - breaker.jitter) - 0.01
+    assert breaker.state(NODE) == NodeCircuitBreaker.OPEN
+    clock.now = reopened_at + 20 * (1 + breaker.jitter)
+    assert breaker.state(NODE) == NodeCircuitBreaker.HALF_OPEN
+
+
+def test_circuit_breaker_metrics_collector(breaker, clock):
+    ursula = Mock()
+    ursula.network_middleware.client.circuit_breaker = breaker
+    collector = NodeCircuitBreakerMetricsCollector(ursula=ursula)
+    registry = CollectorRegistry()
+    collector.initialize(metrics_prefix='test', registry=registry)
+
+    trip(breaker, NODE)
+    trip(breaker, OTHER_NODE)
+    clock.now = 10 * (1 + breaker.jitter)
+    breaker.before_request(OTHER_NODE)
+    breaker.record_failure(OTHER_NODE)
+    with pytest.raises(NodeCircuitOpen):
+        breaker.before_request(OTHER_NODE)
+    collector.collect()
+
+    assert registry.get_sample_value('test_circuit_breaker_nodes', {'state': 'open'}) == 1
+    assert registry.get_sample_value('test_circuit_breaker_nodes', {'state': 'half-open'}) == 1
+    assert registry.get_sample_value('test_circuit_breaker_trips_total') == 3
+    assert registry.get_sample_value('test_circuit_breaker_rejections_total') == 1
+
+    collector.collect()
+    assert registry.get_sample_value('test_circuit_breaker_trips_total') == 3
+
+
+def test_probe_that_raises_something_else_releases_the_circuit(breaker, clock):
+    client = NucypherMiddlewareClient(circuit_breaker=breaker)
+    trip(breaker, NODE)
+    clock.now = 10 * (1 + breaker.jitter)
+
+    host, port = NODE.split(':')
+    with patch.object(NucypherMiddlewareClient, 'invoke_method', side_effect=TypeError("Not the node's fault")):
+        with pytest.raises(TypeError):
+            client.get(path='ping', host=host, port=port)
+
+    # Still half-open, and the next request is the probe.
+    assert breaker.state(NODE) == NodeCircuitBreaker.HALF_OPEN
+    response = Mock(status_code=200)
+    with patch.object(NucypherMiddlewareClient, 'invoke_method', return_value=response):
+        assert client.get(path='ping', host=host, port=port) is response
+    assert breaker.state(NODE) == NodeCircuitBreaker.CLOSED
+
+
+def test_async_timeout_while_connecting_is_a_node_failure():
+    # So that the circuit breaker counts it against the node, as it does for the blocking client.
+    failure = Failure(error.ConnectingCancelledError(address=None))
+    with pytest.raises(NodeSeemsToBeDown):
+        AsyncNucypherMiddlewareClient._translate_failure(failure)
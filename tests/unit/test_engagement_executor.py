@@ -0,0 +1,226 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from threading import Event, Lock
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from nucypher.network.engagement import EngagementExecutor, EngagementTimeout
+from nucypher.policy.policies import NodeEngagementMutex
+from nucypher.utilities.prometheus.collector import EngagementMetricsCollector
+
+
+class Gate:
+    """Engagements that wait at the gate until it opens, keeping count of how many are inside at once."""
+
+    def __init__(self):
+        self.opened = Event()
+        self.inside = 0
+        self.most_inside = 0
+        self._lock = Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.inside += 1
+            self.most_inside = max(self.most_inside, self.inside)
+        try:
+            assert self.opened.wait(timeout=10)
+            return 'engaged'
+        finally:
+            with self._lock:
+                self.inside -= 1
+
+
+def test_engagements_share_a_bounded_number_of_threads():
+    executor = EngagementExecutor(threads=3, per_node=100)
+    gate = Gate()
+    futures = [executor.submit(gate, node_id=f'node {i}') for i in range(10)]
+
+    time.sleep(0.2)
+    assert gate.most_inside == 3
+    assert executor.workers == 3
+    assert executor.queued == 7
+
+    gate.opened.set()
+    assert [future.result(timeout=10) for future in futures] == ['engaged'] * 10
+    assert gate.most_inside == 3
+    assert executor.queued == 0
+
+
+def test_engagements_with_the_same_node_take_turns():
+    executor = EngagementExecutor(threads=10, per_node=2)
+    busy_node, other_node = Gate(), Gate()
+    busy_futures = [executor.submit(busy_node, node_id='busy') for _ in range(5)]
+    other_futures = [executor.submit(other_node, node_id='other') for _ in range(2)]
+
+    time.sleep(0.2)
+    assert busy_node.most_inside == 2
+    assert other_node.most_inside == 2  # Not held up behind the busy node's queue
+
+    busy_node.opened.set()
+    other_node.opened.set()
+    for future in busy_futures + other_futures:
+        assert future.result(timeout=10) == 'engaged'
+    assert busy_node.most_inside == 2
+
+
+def test_engagements_that_miss_their_deadline_or_are_cancelled_are_never_started():
+    executor = EngagementExecutor(threads=1)
+    gate = Gate()
+    engaged = list()
+    blocking = executor.submit(gate, node_id='first')
+    late = executor.submit(lambda: engaged.append('late'), node_id='second', timeout=0.1)
+    cancelled = executor.submit(lambda: engaged.append('cancelled'), node_id='third')
+    assert cancelled.cancel()
+
+    time.sleep(0.3)
+    gate.opened.set()
+    assert blocking.result(timeout=10) == 'engaged'
+    with pytest.raises(EngagementTimeout):
+        late.result(timeout=10)
+    assert executor.submit(lambda: 'still working', node_id='fourth').result(timeout=10) == 'still working'
+    assert not engaged
+
+
+def test_workers_that_stop_as_they_are_woken_dont_wedge_the_executor():
+    executor = EngagementExecutor(threads=4)
+    executor.IDLE_TIMEOUT = 0.002  # So that workers often stop just as they're woken
+
+    for i in range(200):
+        futures = [executor.submit(lambda: 'engaged', node_id=f'node {i % 7}') for _ in range(i % 3 + 1)]
+        for future in futures:
+            assert future.result(timeout=10) == 'engaged'
+        time.sleep(0.002 * (i % 3))
+
+    time.sleep(0.2)
+    assert executor.workers == 0  # They all stopped in the end...
+    assert executor.submit(lambda: 'still working', node_id='last').result(timeout=10) == 'still working'  # ...yet one starts again
+
+
+def test_engagement_errors_are_raised_by_their_futures():
+    executor = EngagementExecutor(threads=1)
+
+    def refuse():
+        raise ConnectionRefusedError
+
+    with pytest.raises(ConnectionRefusedError):
+        executor.submit(refuse, node_id='down').result(timeout=10)
+    assert executor.submit(lambda: 'up', node_id='up').result(timeout=10) == 'up'
+
+
+def test_groups_take_turns():
+    executor = EngagementExecutor(threads=1, per_node=100)
+    gate = Gate()
+    engaged = list()
+    blocking = executor.submit(gate, node_id='first')
+
+    # A big policy submits all of its engagements before a small one submits its own...
+    big = [executor.submit(lambda i=i: engaged.append(('big', i)), node_id=f'big {i}', group='big') for i in range(6)]
+    small = [executor.submit(lambda i=i: engaged.append(('small', i)), node_id=f'small {i}', group='small')
+             for i in range(2)]
+    gate.opened.set()
+    for future in [blocking] + big + small:
+        future.result(timeout=10)
+
+    # ...but the small one isn't kept waiting until the big one is done.
+    assert engaged[:4] == [('big', 0), ('small', 0), ('big', 1), ('small', 1)]
+    assert engaged[4:] == [('big', i) for i in range(2, 6)]
+
+
+def test_a_groups_engagements_can_be_cancelled_together():
+    executor = EngagementExecutor(threads=1, per_node=1)
+    gate = Gate()
+    engaged = list()
+    blocking = executor.submit(gate, node_id='node', group='other')
+    cancelled = [executor.submit(lambda: engaged.append('cancelled'), node_id=node_id, group='failed policy')
+                 for node_id in ('node', 'another node')]
+    kept = executor.submit(lambda: engaged.append('kept'), node_id='node', group='other')
+    time.sleep(0.2)
+    assert executor.queued == 3
+
+    assert executor.cancel(group='failed policy') == 2
+    assert all(future.cancelled() for future in cancelled)
+    assert executor.queued == 1
+
+    gate.opened.set()
+    blocking.result(timeout=10)
+    kept.result(timeout=10)
+    assert engaged == ['kept']
+    assert executor.outcomes == {EngagementExecutor.SUCCEEDED: 2, EngagementExecutor.CANCELLED: 2}
+
+
+def test_engagement_metrics_collector():
+    executor = EngagementExecutor(threads=2)
+    collector = EngagementMetricsCollector(executor=executor)
+    registry = CollectorRegistry()
+    collector.initialize(metrics_prefix='test', registry=registry)
+
+    def refuse():
+        raise ConnectionRefusedError
+
+    executor.submit(lambda: 'up', node_id='up').result(timeout=10)
+    with pytest.raises(ConnectionRefusedError):
+        executor.submit(refuse, node_id='down').result(timeout=10)
+    collector.collect()
+
+    assert registry.get_sample_value('test_node_engagements_total', {'outcome': 'succeeded'}) == 1
+    assert registry.get_sample_value('test_node_engagements_total', {'outcome': 'failed'}) == 1
+    assert registry.get_sample_value('test_node_engagements_queued') == 0
+    assert registry.get_sample_value('test_node_engagement_duration_seconds_count', {'outcome': 'succeeded'}) == 1
+    assert registry.get_sample_value('test_node_engagement_queued_seconds_count', {'outcome': 'failed'}) == 1
+
+
+class FakeNode:
+
+    def __init__(self, checksum_address):
+        self.checksum_address = checksum_address
+
+    def __repr__(self):
+        return self.checksum_address
+
+
+class Accepted:
+    status_code = 202
+
+
+def test_node_engagement_mutex_shares_the_executor_and_can_be_cancelled():
+    executor = EngagementExecutor(threads=1)
+    gate = Gate()
+    nodes = [FakeNode(f'node {i}') for i in range(4)]
+
+    async def engage(node, network_middleware):
+        if node is nodes[0]:
+            gate()
+        return Accepted()
+
+    mutex = NodeEngagementMutex(callable_to_engage=engage,
+                                nodes=nodes,
+                                network_middleware=None,
+                                percent_to_complete_before_release=25,
+                                executor=executor)
+    mutex.start()
+    time.sleep(0.2)
+    assert executor.workers == 1
+    mutex.cancel()
+    gate.opened.set()
+
+    mutex.block_until_complete()
+    assert set(mutex.completed) == {nodes[0]}
+    assert set(mutex.failed) == set(nodes[1:])
+    assert list(mutex.block_until_success_is_reasonably_likely()) == [nodes[0]]
@@ -15,6 +15,7 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import base64
+import ssl
 
 import sha3
 from constant_sorrow.constants import PUBLIC_ONLY
@@ -83,3 +84,10 @@ def test_signing():
 
 
 # TODO: Add test for DecryptingKeypair.decrypt
+
+
+def test_hosting_keypair_ssl_context_refuses_old_tls():
+    hosting_keypair = keypairs.HostingKeypair(host='127.0.0.1', checksum_address='0x' + '1' * 40)
+    context = hosting_keypair.get_ssl_context()
+    assert context.options & ssl.OP_NO_TLSv1
+    assert context.options & ssl.OP_NO_TLSv1_1
@@ -0,0 +1,94 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from threading import Event
+
+import pytest
+from umbral import pre
+from umbral.keys import UmbralPrivateKey
+from umbral.signing import Signer
+
+from nucypher.crypto.kfrags import KFragPool
+
+
+@pytest.fixture(scope='module')
+def keys():
+    return UmbralPrivateKey.gen_key(), UmbralPrivateKey.gen_key().pubkey, UmbralPrivateKey.gen_key()
+
+
+def test_kfrags_are_generated_ahead_of_time_and_taken_once(keys):
+    delegating_privkey, bob_encrypting_key, signing_privkey = keys
+    generated = list()
+
+    def generate(label, bob_encrypting_key, m, n):
+        generated.append(label)
+        kfrags = pre.generate_kfrags(delegating_privkey=delegating_privkey,
+                                     receiving_pubkey=bob_encrypting_key,
+                                     threshold=m,
+                                     N=n,
+                                     signer=Signer(signing_privkey))
+        return delegating_privkey.pubkey, kfrags
+
+    pool = KFragPool(generate=generate, workers=2)
+    try:
+        future = pool.pregenerate(label=b'label', bob_encrypting_key=bob_encrypting_key, m=2, n=5)
+        assert pool.pregenerate(label=b'label', bob_encrypting_key=bob_encrypting_key, m=2, n=5) is future
+        future.result()
+        assert pool.pending == 1
+
+        # Another policy's terms aren't a match.
+        assert pool.take(label=b'label', bob_encrypting_key=bob_encrypting_key, m=3, n=5) is None
+
+        public_key, kfrags = pool.take(label=b'label', bob_encrypting_key=bob_encrypting_key, m=2, n=5)
+        assert public_key == delegating_privkey.pubkey
+        assert len(kfrags) == 5
+        assert all(kfrag.verify(signing_pubkey=signing_privkey.pubkey,
+                                delegating_pubkey=delegating_privkey.pubkey,
+                                receiving_pubkey=bob_encrypting_key) for kfrag in kfrags)
+
+        # Never handed out twice.
+        assert pool.take(label=b'label', bob_encrypting_key=bob_encrypting_key, m=2, n=5) is None
+        assert generated == [b'label']
+        assert (pool.hits, pool.misses, pool.pending) == (1, 2, 0)
+    finally:
+        pool.shutdown()
+
+
+def test_kfrag_pool_turns_work_away_when_full(keys):
+    _delegating_privkey, bob_encrypting_key, _signing_privkey = keys
+    release = Event()
+
+    def generate(label, bob_encrypting_key, m, n):
+        release.wait()
+        raise ValueError("Left for the caller to generate.")
+
+    pool = KFragPool(generate=generate, workers=1, max_pending=2)
+    try:
+        pool.pregenerate(label=b'one', bob_encrypting_key=bob_encrypting_key, m=1, n=1)
+        pool.pregenerate(label=b'two', bob_encrypting_key=bob_encrypting_key, m=1, n=1)
+        with pytest.raises(KFragPool.Busy):
+            pool.pregenerate(label=b'three', bob_encrypting_key=bob_encrypting_key, m=1, n=1)
+
+        # A failure is no kfrags at all, and makes room for more.
+        release.set()
+        assert pool.take(label=b'one', bob_encrypting_key=bob_encrypting_key, m=1, n=1) is None
+        pool.pregenerate(label=b'three', bob_encrypting_key=bob_encrypting_key, m=1, n=1)
+    finally:
+        pool.shutdown()
+
+    with pytest.raises(KFragPool.Busy):
+        pool.pregenerate(label=b'four', bob_encrypting_key=bob_encrypting_key, m=1, n=1)
@@ -0,0 +1,119 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from unittest.mock import Mock
+
+from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
+from prometheus_client import CollectorRegistry
+
+from nucypher.acumen.perception import FleetSensor, LearningStatistics
+from nucypher.utilities.prometheus.collector import LearningMetricsCollector
+
+
+def test_learning_statistics():
+    statistics = LearningStatistics()
+
+    with statistics.phase('request'):
+        pass
+    statistics.record_round(duration=0.5, nodes_learned=3)
+    statistics.record_round(duration=0.1, nodes_learned=0, result=FLEET_STATES_MATCH)
+    statistics.record_round(duration=0.1, nodes_learned=0, result=NO_KNOWN_NODES)
+    statistics.record_teacher_failure('unreachable')
+
+    assert statistics.rounds == 3
+    assert statistics.fleet_states_match == 1
+    assert statistics.no_known_nodes == 1
+    assert statistics.teacher_failures == {'unreachable': 1}
+
+    round_durations, phase_durations, nodes_learned = statistics.drain()
+    assert round_durations == [0.5, 0.1, 0.1]
+    assert [phase for phase, _duration in phase_durations] == ['request']
+    assert nodes_learned == [3, 0, 0]
+
+    # Observations are drained, but totals are not.
+    assert statistics.drain() == ([], [], [])
+    assert statistics.rounds == 3
+
+    # Undrained observations are bounded.
+    for _ in range(statistics.MAXIMUM_PENDING_OBSERVATIONS + 1):
+        statistics.record_round(duration=0.1, nodes_learned=1)
+    round_durations, _phase_durations, _nodes_learned = statistics.drain()
+    assert len(round_durations) == statistics.MAXIMUM_PENDING_OBSERVATIONS
+
+
+def test_learning_phases_are_observed_once_per_round():
+    statistics = LearningStatistics()
+
+    with statistics.phase('parse'):
+        time.sleep(0.01)
+    with statistics.phase('check_signature'):
+        pass
+    with statistics.phase('parse'):
+        time.sleep(0.01)
+    statistics.record_round(duration=0.5, nodes_learned=1)
+    statistics.record_round(duration=0.5, nodes_learned=0)  # In which no phase took any time
+
+    _round_durations, phase_durations, _nodes_learned = statistics.drain()
+    assert [phase for phase, _duration in phase_durations] == ['parse', 'check_signature']
+    assert dict(phase_durations)['parse'] >= 0.02
+
+
+def test_fleet_sensor_notices_new_nodes():
+    fleet_sensor = FleetSensor()
+    assert fleet_sensor.most_recent_node_change is NO_KNOWN_NODES
+
+    fleet_sensor['0xA'] = 'node'
+    first_change = fleet_sensor.most_recent_node_change
+    assert first_change is not NO_KNOWN_NODES
+
+    fleet_sensor['0xA'] = 'updated node'
+    assert fleet_sensor.most_recent_node_change is first_change
+
+
+def test_learning_metrics_collector():
+    ursula = Mock()
+    ursula.learning_statistics = LearningStatistics()
+    ursula.known_nodes = FleetSensor()
+    ursula.known_nodes['0xA'] = 'node'
+
+    collector = LearningMetricsCollector(ursula=ursula)
+    registry = CollectorRegistry()
+    collector.initialize(metrics_prefix='test', registry=registry)
+
+    statistics = ursula.learning_statistics
+    with statistics.phase('parse'):
+        pass
+    statistics.record_round(duration=0.2, nodes_learned=7)
+    statistics.record_round(duration=0.2, nodes_learned=0, result=FLEET_STATES_MATCH)
+    statistics.record_teacher_failure('invalid')
+    collector.collect()
+
+    assert registry.get_sample_value('test_learning_rounds_total') == 2
+    assert registry.get_sample_value('test_learning_round_duration_seconds_count') == 2
+    assert registry.get_sample_value('test_learning_phase_duration_seconds_count', {'phase': 'parse'}) == 1
+    assert registry.get_sample_value('test_learning_nodes_learned_sum') == 7
+    assert registry.get_sample_value('test_learning_fleet_states_match_total') == 1
+    assert registry.get_sample_value('test_learning_teacher_failures_total', {'reason': 'invalid'}) == 1
+    assert registry.get_sample_value('test_learning_seconds_since_new_node') >= 0
+
+    # Collecting again doesn't double count.
+    statistics.record_round(duration=0.2, nodes_learned=1)
+    collector.collect()
+    assert registry.get_sample_value('test_learning_rounds_total') == 3
+    assert registry.get_sample_value('test_learning_round_duration_seconds_count') == 3
+    assert registry.get_sample_value('test_learning_teacher_failures_total', {'reason': 'invalid'}) == 1
@@ -0,0 +1,81 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from nucypher.blockchain.eth.constants import NULL_ADDRESS
+from nucypher.blockchain.eth.events import EventRecord
+from nucypher.policy.owners import PolicyOwnerCache
+
+SPONSOR = '0x' + '1' * 40
+OWNER = '0x' + '2' * 40
+
+
+def policy_record(sponsor=SPONSOR, owner=NULL_ADDRESS, end_timestamp=1000):
+    # As returned by PolicyManager.policies(policyId)
+    return [False, sponsor, owner, 10, 0, end_timestamp, 0, 0, 0, 0, 0]
+
+
+def test_policy_owners_are_read_once():
+    policy_agent = Mock()
+    policy_agent.fetch_policy.return_value = policy_record()
+    cache = PolicyOwnerCache(policy_agent=policy_agent)
+    policy_id = os.urandom(16)
+
+    # Without a separate owner, the sponsor owns the policy.
+    assert cache.owner(policy_id) == SPONSOR
+    assert cache.lookup(policy_id).end_timestamp == 1000
+    assert policy_agent.fetch_policy.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    policy_agent.fetch_policy.return_value = policy_record(owner=OWNER)
+    assert cache.owner(os.urandom(16)) == OWNER
+    assert len(cache) == 2
+
+
+def test_unknown_policies_are_not_cached():
+    policy_agent = Mock()
+    policy_agent.fetch_policy.return_value = policy_record(sponsor=NULL_ADDRESS)
+    cache = PolicyOwnerCache(policy_agent=policy_agent)
+    policy_id = os.urandom(16)
+
+    with pytest.raises(PolicyOwnerCache.UnknownPolicy):
+        cache.owner(policy_id)
+    assert len(cache) == 0
+
+    # Once the policy is created, it's found.
+    policy_agent.fetch_policy.return_value = policy_record()
+    assert cache.owner(policy_id) == SPONSOR
+
+
+def test_warm_policy_owner_cache_from_events():
+    policy_ids = [os.urandom(16) for _ in range(3)]
+    events = [EventRecord(dict(args=dict(policyId=policy_id, sponsor=SPONSOR, owner=OWNER, endTimestamp=2000),
+                               blockNumber=block_number,
+                               transactionHash=os.urandom(32)))
+              for block_number, policy_id in enumerate(policy_ids)]
+    policy_agent = Mock()
+    policy_agent.events = {'PolicyCreated': lambda from_block, to_block: iter(events[from_block:to_block])}
+    cache = PolicyOwnerCache(policy_agent=policy_agent)
+
+    assert cache.warm(from_block=0, to_block=3) == 3
+    assert all(cache.owner(policy_id) == OWNER for policy_id in policy_ids)
+    assert cache.misses == 0
+    policy_agent.fetch_policy.assert_not_called()
@@ -0,0 +1,141 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import tempfile
+from unittest.mock import Mock
+
+import maya
+import pytest
+from twisted.internet import task
+from umbral.keys import UmbralPrivateKey
+from web3.exceptions import TransactionNotFound
+
+from nucypher.datastore.datastore import Datastore
+from nucypher.datastore.models import PolicyArrangement
+from nucypher.network.trackers import PolicyPaymentTracker
+
+URSULA_ADDRESS = '0x' + '1' * 40
+SOMEONE_ELSE = '0x' + '2' * 40
+
+
+@pytest.fixture()
+def ursula():
+    ursula = Mock()
+    ursula.checksum_address = URSULA_ADDRESS
+    ursula.datastore = Datastore(tempfile.mkdtemp())
+    ursula.suspicious_activities_witnessed = {'freeriders': []}
+    return ursula
+
+
+def pending_arrangement(ursula, transaction: bytes) -> str:
+    arrangement_id = os.urandom(32).hex()
+    with ursula.datastore.describe(PolicyArrangement, arrangement_id, writeable=True) as arrangement:
+        arrangement.expiration = maya.now().add(days=1)
+        arrangement.alice_verifying_key = UmbralPrivateKey.gen_key().pubkey
+        arrangement.payment_transaction = transaction
+    return arrangement_id
+
+
+def payment_transaction(ursula, arrangement_id: str):
+    with ursula.datastore.describe(PolicyArrangement, arrangement_id) as arrangement:
+        try:
+            return arrangement.payment_transaction
+        except AttributeError:
+            return None
+
+
+def test_payments_are_confirmed_when_mined(ursula):
+    tracker = PolicyPaymentTracker(ursula=ursula)
+    transaction = os.urandom(32)
+    arrangement_ids = [pending_arrangement(ursula, transaction) for _ in range(2)]
+    for arrangement_id in arrangement_ids:
+        tracker.track(transaction=transaction, arrangement_id=arrangement_id)
+    assert tracker.pending == 2
+
+    # Not mined yet
+    ursula.policy_agent.fetch_arrangement_addresses_from_mined_policy_txid.return_value = None
+    tracker.check_payments()
+    assert tracker.pending == 2
+    assert all(payment_transaction(ursula, arrangement_id) == transaction for arrangement_id in arrangement_ids)
+
+    # Mined, paying this node
+    ursula.policy_agent.fetch_arrangement_addresses_from_mined_policy_txid.return_value = [SOMEONE_ELSE, URSULA_ADDRESS]
+    tracker.check_payments()
+    assert tracker.pending == 0
+    assert all(payment_transaction(ursula, arrangement_id) is None for arrangement_id in arrangement_ids)
+    assert not ursula.suspicious_activities_witnessed['freeriders']
+
+
+def test_unpaid_kfrags_are_deleted(ursula):
+    clock = task.Clock()
+    tracker = PolicyPaymentTracker(ursula=ursula, payment_timeout=60)
+    tracker._task.clock = clock
+
+    wrong_payee, never_mined = os.urandom(32), os.urandom(32)
+    wrong_payee_arrangement = pending_arrangement(ursula, wrong_payee)
+    never_mined_arrangement = pending_arrangement(ursula, never_mined)
+    tracker.track(transaction=wrong_payee, arrangement_id=wrong_payee_arrangement)
+    tracker.track(transaction=never_mined, arrangement_id=never_mined_arrangement)
+
+    def mined_payments(transaction):
+        if transaction == wrong_payee:
+            return [SOMEONE_ELSE]
+        raise TransactionNotFound
+    ursula.policy_agent.fetch_arrangement_addresses_from_mined_policy_txid.side_effect = mined_payments
+
+    tracker.check_payments()
+    assert tracker.pending == 1
+    assert payment_transaction(ursula, wrong_payee_arrangement) is None
+    assert len(ursula.suspicious_activities_witnessed['freeriders']) == 1
+
+    # The other payment is given some time to show up...
+    clock.advance(59)
+    tracker.check_payments()
+    assert tracker.pending == 1
+    assert payment_transaction(ursula, never_mined_arrangement) == never_mined
+
+    # ...but not forever.
+    clock.advance(1)
+    tracker.check_payments()
+    assert tracker.pending == 0
+    assert payment_transaction(ursula, never_mined_arrangement) is None
+    assert len(ursula.suspicious_activities_witnessed['freeriders']) == 2
+
+    # The arrangements are kept, but not their kfrags.
+    for arrangement_id in (wrong_payee_arrangement, never_mined_arrangement):
+        with ursula.datastore.describe(PolicyArrangement, arrangement_id) as arrangement:
+            assert arrangement.alice_verifying_key
+            with pytest.raises(AttributeError):
+                _kfrag = arrangement.kfrag
+
+
+def test_pending_payments_survive_a_restart(ursula):
+    transaction = os.urandom(32)
+    arrangement_id = pending_arrangement(ursula, transaction)
+
+    tracker = PolicyPaymentTracker(ursula=ursula)
+    tracker._task.clock = task.Clock()
+    tracker.start(now=False)
+    try:
+        assert tracker.pending == 1
+    finally:
+        tracker.stop()
+
+    ursula.policy_agent.fetch_arrangement_addresses_from_mined_policy_txid.return_value = [URSULA_ADDRESS]
+    tracker.check_payments()
+    assert payment_transaction(ursula, arrangement_id) is None
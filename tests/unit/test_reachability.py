@@ -0,0 +1,121 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from nucypher.network.reachability import ReachabilityChecker
+
+NODE = b'the node that pinged'
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_verdicts_are_cached_until_they_expire():
+    checked = list()
+
+    def check(host, port):
+        checked.append((host, port))
+        return NODE
+
+    clock = FakeClock()
+    checker = ReachabilityChecker(check=check, check_rate=1, check_burst=10, clock=clock)
+
+    for _ in range(3):
+        assert checker.verdict('0xA', '10.0.0.1', 9151, NODE) == ReachabilityChecker.REACHABLE
+    assert checked == [('10.0.0.1', 9151)]
+    assert (checker.checks, checker.hits) == (1, 2)
+
+    # A node claiming to be something else is checked again, and found out.
+    assert checker.verdict('0xA', '10.0.0.1', 9151, b'someone else') == ReachabilityChecker.MISMATCHED
+    assert len(checked) == 2
+
+    clock.now = ReachabilityChecker.REACHABLE_TTL
+    assert checker.verdict('0xA', '10.0.0.1', 9151, NODE) == ReachabilityChecker.REACHABLE
+    assert len(checked) == 3
+
+
+def test_unreachable_verdicts_expire_sooner():
+    reachable = False
+
+    def check(host, port):
+        if not reachable:
+            raise ConnectionError
+        return NODE
+
+    clock = FakeClock()
+    checker = ReachabilityChecker(check=check, check_rate=1, check_burst=10, clock=clock)
+    assert checker.verdict('0xA', '10.0.0.1', 9151, NODE) == ReachabilityChecker.UNREACHABLE
+
+    reachable = True
+    assert checker.verdict('0xA', '10.0.0.1', 9151, NODE) == ReachabilityChecker.UNREACHABLE
+    clock.now = ReachabilityChecker.UNREACHABLE_TTL
+    assert checker.verdict('0xA', '10.0.0.1', 9151, NODE) == ReachabilityChecker.REACHABLE
+
+
+def test_simultaneous_pings_share_one_check():
+    started, release = Event(), Event()
+    checked = list()
+
+    def check(host, port):
+        checked.append((host, port))
+        started.set()
+        release.wait(timeout=10)
+        return NODE
+
+    checker = ReachabilityChecker(check=check)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(checker.verdict, '0xA', '10.0.0.1', 9151, NODE)
+        assert started.wait(timeout=10)
+        others = [executor.submit(checker.verdict, '0xA', '10.0.0.1', 9151, NODE) for _ in range(3)]
+        release.set()
+        verdicts = [future.result() for future in (first, *others)]
+
+    assert verdicts == [ReachabilityChecker.REACHABLE] * 4
+    assert len(checked) == 1
+    assert checker.checks == 1
+    assert checker.shared + checker.hits == 3
+
+
+def test_checks_are_rate_limited_per_host():
+    clock = FakeClock()
+    checker = ReachabilityChecker(check=lambda host, port: NODE, check_rate=0.5, check_burst=2, clock=clock)
+
+    # Made-up checksum addresses don't buy more checks of the same host.
+    checker.verdict('0xA', '10.0.0.1', 9151, NODE)
+    checker.verdict('0xB', '10.0.0.1', 9151, NODE)
+    with pytest.raises(ReachabilityChecker.RateLimited) as limited:
+        checker.verdict('0xC', '10.0.0.1', 9151, NODE)
+    assert limited.value.retry_after == 2
+    assert checker.rate_limited == 1
+
+    # Cached verdicts are still given, and other hosts are still checked.
+    assert checker.verdict('0xA', '10.0.0.1', 9151, NODE) == ReachabilityChecker.REACHABLE
+    assert checker.verdict('0xC', '10.0.0.2', 9151, NODE) == ReachabilityChecker.REACHABLE
+
+    clock.now = 2
+    assert checker.verdict('0xC', '10.0.0.1', 9151, NODE) == ReachabilityChecker.REACHABLE
@@ -0,0 +1,117 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+from threading import Event, Thread
+
+import pytest
+from umbral import pre
+from umbral.keys import UmbralPrivateKey
+from umbral.signing import Signer
+
+from nucypher.crypto.reencryption import ReencryptionPool
+
+
+@pytest.fixture(scope='module')
+def reencryption_pool():
+    pool = ReencryptionPool(workers=2, queue_size=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture(scope='module')
+def kfrag_and_capsules():
+    delegating_privkey = UmbralPrivateKey.gen_key()
+    receiving_privkey = UmbralPrivateKey.gen_key()
+    signing_privkey = UmbralPrivateKey.gen_key()
+    kfrags = pre.generate_kfrags(delegating_privkey=delegating_privkey,
+                                 receiving_pubkey=receiving_privkey.pubkey,
+                                 threshold=1,
+                                 N=1,
+                                 signer=Signer(signing_privkey))
+
+    capsules = list()
+    for _ in range(4):
+        _ciphertext, capsule = pre.encrypt(delegating_privkey.pubkey, os.urandom(32))
+        capsule.set_correctness_keys(delegating=delegating_privkey.pubkey,
+                                     receiving=receiving_privkey.pubkey,
+                                     verifying=signing_privkey.pubkey)
+        capsules.append(capsule)
+    return kfrags[0], capsules
+
+
+def test_reencryption_pool(reencryption_pool, kfrag_and_capsules):
+    kfrag, capsules = kfrag_and_capsules
+    metadata = [os.urandom(16) for _ in capsules]
+
+    cfrags = reencryption_pool.reencrypt(kfrag, capsules, metadata)
+
+    assert len(cfrags) == len(capsules)
+    for cfrag, capsule, capsule_metadata in zip(cfrags, capsules, metadata):
+        assert cfrag.proof.metadata == capsule_metadata
+        assert cfrag.verify_correctness(capsule)
+
+
+def test_reencryption_pool_turns_work_away_when_full(reencryption_pool, kfrag_and_capsules):
+    kfrag, capsules = kfrag_and_capsules
+    holding, release = Event(), Event()
+
+    def slow_capsules():
+        # Holds the only slot in the queue until released.
+        holding.set()
+        release.wait()
+        yield capsules[0]
+
+    occupant = Thread(target=reencryption_pool.reencrypt, args=(kfrag, slow_capsules(), [None]))
+    occupant.start()
+    try:
+        holding.wait()
+        with pytest.raises(ReencryptionPool.Busy):
+            reencryption_pool.reencrypt(kfrag, capsules, [None] * len(capsules))
+    finally:
+        release.set()
+        occupant.join()
+
+    # There's room again.
+    assert len(reencryption_pool.reencrypt(kfrag, capsules[:1], [None])) == 1
+
+
+def test_reencryption_pool_shutdown(kfrag_and_capsules):
+    kfrag, capsules = kfrag_and_capsules
+    pool = ReencryptionPool(workers=1)
+    assert len(pool.reencrypt(kfrag, capsules[:1], [None])) == 1
+
+    pool.shutdown()
+    with pytest.raises(ReencryptionPool.Busy):
+        pool.reencrypt(kfrag, capsules[:1], [None])
+    pool.shutdown()  # Again is harmless
+
+
+def test_reencryption_pool_gives_up_slot_on_timeout(kfrag_and_capsules):
+    kfrag, capsules = kfrag_and_capsules
+    pool = ReencryptionPool(workers=1, queue_size=1, timeout=0)
+    try:
+        # The freshly spawned worker can't be done already, so this work order times out...
+        cfrags = pool.reencrypt_iter(kfrag, capsules, [None] * len(capsules))
+        with pytest.raises(ReencryptionPool.Busy):
+            list(cfrags)
+
+        # ...and doesn't keep the only slot while the worker is still at it.
+        pool.timeout = ReencryptionPool.DEFAULT_TIMEOUT
+        assert len(pool.reencrypt(kfrag, capsules[:1], [None])) == 1
+    finally:
+        pool.shutdown()
@@ -0,0 +1,78 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+
+from nucypher.network.statistics import (
+    ROUTE_ENVIRON_KEY,
+    RESTStatistics,
+    RESTStatisticsMiddleware,
+    UNMATCHED_ROUTE
+)
+
+
+def app_answering(route, status, chunks):
+    def app(environ, start_response):
+        if route:
+            environ[ROUTE_ENVIRON_KEY] = route
+        start_response(status, [('Content-Type', 'application/octet-stream')])
+        return iter(chunks)
+    return app
+
+
+def test_requests_are_recorded_by_route_method_and_status():
+    statistics = RESTStatistics()
+    observations = list()
+    statistics.observer = observations.append
+    app = RESTStatisticsMiddleware(app_answering('/kFrag/<id_as_hex>/reencrypt', '200 OK', [b'cfrag', b'signature']),
+                                   statistics=lambda: statistics)
+
+    for arrangement_id in ('aa', 'bb'):
+        environ = EnvironBuilder(path=f'/kFrag/{arrangement_id}/reencrypt', method='POST', data=b'x' * 1000).get_environ()
+        body, status, _headers = run_wsgi_app(app, environ, buffered=True)
+        assert b''.join(body) == b'cfragsignature'
+
+    assert statistics.requests == {('/kFrag/<id_as_hex>/reencrypt', 'POST', '200'): 2}
+    assert len(observations) == 2
+    observation = observations[0]
+    assert observation.request_bytes == 1000
+    assert observation.response_bytes == len(b'cfragsignature')
+    assert observation.seconds >= 0
+
+    # Requests that matched no route are counted together
+    unmatched = RESTStatisticsMiddleware(app_answering(None, '404 NOT FOUND', [b'']), statistics=lambda: statistics)
+    run_wsgi_app(unmatched, EnvironBuilder(path='/nothing/here').get_environ(), buffered=True)
+    assert statistics.requests[(UNMATCHED_ROUTE, 'GET', '404')] == 1
+
+
+def test_streamed_responses_are_recorded_once_when_sent_or_closed():
+    statistics = RESTStatistics()
+    app = RESTStatisticsMiddleware(app_answering('/stream', '200 OK', [b'a', b'bb', b'ccc']),
+                                   statistics=lambda: statistics)
+
+    # Sent to the last byte, then closed
+    body, _status, _headers = run_wsgi_app(app, EnvironBuilder(path='/stream').get_environ())
+    assert not statistics.requests
+    assert b''.join(body) == b'abbccc'
+    body.close()
+    assert statistics.requests[('/stream', 'GET', '200')] == 1
+
+    # Closed before it was sent in full, as when the client goes away
+    body, _status, _headers = run_wsgi_app(app, EnvironBuilder(path='/stream').get_environ())
+    next(iter(body))
+    body.close()
+    assert statistics.requests[('/stream', 'GET', '200')] == 2
@@ -0,0 +1,102 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.blockchain.eth.agents import StakingEscrowAgent
+from nucypher.policy.reservoirs import StakerDistributionCache
+
+STAKERS = {f'0xStaker{i}': 10 * (i + 1) for i in range(10)}
+
+
+class FakeStakingAgent:
+
+    def __init__(self, stakers=STAKERS):
+        self.stakers = stakers
+        self.period = 100
+        self.fetched = list()
+
+    def get_current_period(self):
+        return self.period
+
+    def get_all_active_stakers(self, periods):
+        self.fetched.append((periods, self.period))
+        return sum(self.stakers.values()), dict(self.stakers)
+
+
+def test_stakers_are_fetched_once_per_duration_and_period():
+    agent = FakeStakingAgent()
+    cache = StakerDistributionCache(staking_agent=agent)
+
+    excluded = {'0xStaker0', '0xStaker1', '0xNotAStaker'}
+    reservoirs = [cache.reservoir(duration=5, without=excluded) for _ in range(3)]
+    assert agent.fetched == [(5, 100)]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Each policy's exclusions are its own.
+    assert len(reservoirs[0]) == len(STAKERS) - 2
+    assert set(reservoirs[0].draw(len(STAKERS) - 2)) == set(STAKERS) - excluded
+    with pytest.raises(StakingEscrowAgent.NotEnoughStakers):
+        reservoirs[0].draw(len(STAKERS) - 1)
+    assert len(cache.reservoir(duration=5)) == len(STAKERS)
+
+    # Another duration, or another period, is fetched anew.
+    cache.reservoir(duration=6)
+    agent.period += 1
+    cache.reservoir(duration=5)
+    assert agent.fetched == [(5, 100), (6, 100), (5, 101)]
+
+
+def test_durations_are_rounded_up_to_their_bucket():
+    agent = FakeStakingAgent()
+    cache = StakerDistributionCache(staking_agent=agent, duration_bucket=4)
+
+    for duration in (1, 2, 3, 4):
+        cache.reservoir(duration=duration)
+    cache.reservoir(duration=5)
+    assert agent.fetched == [(4, 100), (8, 100)]
+
+    with pytest.raises(ValueError):
+        cache.reservoir(duration=0)
+
+
+def test_distributions_are_refreshed_when_a_period_begins():
+    agent = FakeStakingAgent()
+    cache = StakerDistributionCache(staking_agent=agent)
+    cache.reservoir(duration=5)
+    cache.reservoir(duration=7)
+
+    assert cache.refresh() == 0  # Nothing is stale yet.
+    assert len(agent.fetched) == 2
+
+    agent.period += 1
+    assert cache.refresh() == 2
+    assert sorted(agent.fetched[2:]) == [(5, 101), (7, 101)]
+    assert len(cache) == 2  # The last period's are forgotten.
+
+    # So the period's first policies needn't wait for them.
+    misses = cache.misses
+    cache.reservoir(duration=5)
+    cache.reservoir(duration=7)
+    assert cache.misses == misses
+    assert len(agent.fetched) == 4
+
+
+def test_no_locked_tokens_means_not_enough_stakers():
+    cache = StakerDistributionCache(staking_agent=FakeStakingAgent(stakers=dict()))
+    with pytest.raises(StakingEscrowAgent.NotEnoughStakers):
+        cache.reservoir(duration=5)
@@ -0,0 +1,61 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from nucypher.network.status import StatusPage, etag_of
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_status_page_is_rendered_once_per_fleet_state():
+    renders = iter(('first', 'second'))
+    status_page = StatusPage(max_age=30, clock=FakeClock())
+
+    snapshot = status_page.current(fleet_checksum='abc', render=lambda: next(renders))
+    assert snapshot.content == 'first'
+    assert snapshot.etag == etag_of('first')
+    assert status_page.current(fleet_checksum='abc', render=lambda: next(renders)) is snapshot
+    assert status_page.renders == 1
+
+    snapshot = status_page.current(fleet_checksum='def', render=lambda: next(renders))
+    assert snapshot.content == 'second'
+    assert snapshot.etag != etag_of('first')
+    assert status_page.renders == 2
+
+
+def test_status_page_is_rendered_again_when_old():
+    clock = FakeClock()
+    status_page = StatusPage(max_age=30, clock=clock)
+
+    status_page.current(fleet_checksum='abc', render=lambda: 'page')
+    clock.now = 29
+    status_page.current(fleet_checksum='abc', render=lambda: 'page')
+    assert status_page.renders == 1
+
+    clock.now = 30
+    status_page.current(fleet_checksum='abc', render=lambda: 'page')
+    assert status_page.renders == 2
+
+    status_page.clear()
+    status_page.current(fleet_checksum='abc', render=lambda: 'page')
+    assert status_page.renders == 3
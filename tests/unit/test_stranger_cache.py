@@ -0,0 +1,75 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from prometheus_client import CollectorRegistry
+from umbral.keys import UmbralPrivateKey
+
+from nucypher.characters.base import StrangerCache
+from nucypher.characters.lawful import Alice, Bob
+from nucypher.utilities.prometheus.collector import StrangerCacheMetricsCollector
+
+
+def test_stranger_cache():
+    cache = StrangerCache(size=2)
+    verifying_key = UmbralPrivateKey.gen_key().pubkey
+
+    bob = cache.get_or_create(Bob, verifying_key=verifying_key)
+    assert bob.stamp.as_umbral_pubkey() == verifying_key
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # The same keys, as an object or as bytes, give the same stand-in...
+    assert cache.get_or_create(Bob, verifying_key=verifying_key) is bob
+    assert cache.get_or_create(Bob, verifying_key=bytes(verifying_key)) is bob
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # ...but not for a different kind of Character.
+    alice = cache.get_or_create(Alice, verifying_key=verifying_key)
+    assert isinstance(alice, Alice)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # The least recently used stranger makes way for new ones.
+    cache.get_or_create(Bob, verifying_key=UmbralPrivateKey.gen_key().pubkey)
+    assert len(cache) == 2
+    assert cache.get_or_create(Bob, verifying_key=verifying_key) is not bob
+
+
+def test_stranger_from_public_keys_uses_the_shared_cache():
+    verifying_key = UmbralPrivateKey.gen_key().pubkey
+    bob = Bob.stranger_from_public_keys(verifying_key=verifying_key)
+    assert Bob.stranger_from_public_keys(verifying_key=verifying_key) is bob
+    assert Bob.from_public_keys(verifying_key=verifying_key) is not bob
+
+
+def test_stranger_cache_metrics_collector():
+    cache = StrangerCache()
+    collector = StrangerCacheMetricsCollector(stranger_cache=cache)
+    registry = CollectorRegistry()
+    collector.initialize(metrics_prefix='test', registry=registry)
+
+    verifying_key = UmbralPrivateKey.gen_key().pubkey
+    for _ in range(3):
+        cache.get_or_create(Bob, verifying_key=verifying_key)
+    collector.collect()
+
+    assert registry.get_sample_value('test_stranger_cache_hits_total') == 2
+    assert registry.get_sample_value('test_stranger_cache_misses_total') == 1
+    assert registry.get_sample_value('test_stranger_cache_size') == 1
+
+    cache.get_or_create(Bob, verifying_key=verifying_key)
+    collector.collect()
+    assert registry.get_sample_value('test_stranger_cache_hits_total') == 3
+    assert registry.get_sample_value('test_stranger_cache_misses_total') == 1
@@ -14,13 +14,16 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import os
+import random
+
 import pytest
 from cryptography.hazmat.backends.openssl import backend
 from cryptography.hazmat.primitives import hashes
 from umbral.keys import UmbralPrivateKey
 
 from nucypher.crypto.api import ecdsa_sign, verify_ecdsa
-from nucypher.crypto.signing import Signature, Signer
+from nucypher.crypto.signing import PARALLEL_VERIFICATION_THRESHOLD, Signature, Signer, verify_signatures
 from nucypher.crypto.utils import get_signature_recovery_value, recover_pubkey_from_signature
 
 
@@ -92,3 +95,31 @@ def test_ecdsa_signature_recovery(execution_number):
                                                                  signature,
                                                                  pubkey,
                                                                  is_prehashed=True)
+
+
+@pytest.mark.parametrize('execution_number', range(20))
+@pytest.mark.parametrize('batch_size', (1, PARALLEL_VERIFICATION_THRESHOLD - 1, PARALLEL_VERIFICATION_THRESHOLD, 50))
+def test_batch_signature_verification_matches_one_by_one(batch_size, execution_number):
+    privkey = UmbralPrivateKey.gen_key()
+    pubkey = privkey.get_pubkey()
+    signer = Signer(private_key=privkey)
+    impostor = Signer(private_key=UmbralPrivateKey.gen_key())
+
+    signatures_and_messages = list()
+    for _ in range(batch_size):
+        message = os.urandom(64)
+        corruption = random.choice(('none', 'none', 'none', 'wrong message', 'wrong signer'))
+        if corruption == 'wrong signer':
+            signature = impostor(message)
+        else:
+            signature = signer(message)
+        if corruption == 'wrong message':
+            message = os.urandom(64)
+        signatures_and_messages.append((signature, message))
+
+    one_by_one = all(signature.verify(message, pubkey) for signature, message in signatures_and_messages)
+    assert verify_signatures(signatures_and_messages, pubkey) is one_by_one
+
+    # And an untouched batch is always accepted.
+    good = [(signer(message), message) for message in (os.urandom(64) for _ in range(batch_size))]
+    assert verify_signatures(good, pubkey)
@@ -0,0 +1,240 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+import statistics
+import time
+from typing import List
+
+from nucypher.config.characters import AliceConfiguration
+from nucypher.config.constants import TEMPORARY_DOMAIN
+from nucypher.utilities.logging import GlobalLoggerSettings
+from tests.mock.performance_mocks import (
+    NotAPublicKey,
+    _determine_good_serials,
+    mock_cert_generation,
+    mock_cert_loading,
+    mock_cert_storage,
+    mock_keep_learning,
+    mock_message_verification,
+    mock_metadata_validation,
+    mock_pubkey_from_bytes,
+    mock_record_fleet_state,
+    mock_remember_node,
+    mock_rest_app_creation,
+    mock_secret_source,
+    mock_signature_bytes,
+    mock_stamp_call,
+    mock_verify_node
+)
+from tests.mock.serials import good_serials
+from tests.utils.middleware import SimulatedFleetMiddleware
+from tests.utils.ursula import MOCK_KNOWN_URSULAS_CACHE, make_federated_ursulas
+
+
+def _unlimited_good_serials():
+    # The precomputed serials cover about 10k mock Ursulas; find more as needed for larger fleets.
+    yield from good_serials
+    start = good_serials[-1] + 1
+    while True:
+        yield from _determine_good_serials(start, start + 10000)
+        start += 10000
+
+
+class FleetSimulationReport:
+    """
+    The outcome of one simulated learning run.  Everything but the CPU measurements
+    is determined by the seed, so those fields can be compared exactly between runs.
+    """
+
+    DETERMINISTIC_FIELDS = ('converged', 'rounds', 'known_nodes', 'requests', 'failed_requests',
+                            'bytes_sent', 'bytes_received', 'simulated_network_seconds')
+
+    def __init__(self, fleet_size: int, parameters: dict):
+        self.fleet_size = fleet_size
+        self.parameters = parameters
+        self.converged = False
+        self.rounds = 0
+        self.known_nodes = 0
+        self.requests = 0
+        self.failed_requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.simulated_network_seconds = 0.0
+        self.cpu_seconds_per_round = list()
+        self.nodes_learned_per_round = list()
+
+    @property
+    def cpu_seconds(self) -> float:
+        return sum(self.cpu_seconds_per_round)
+
+    @property
+    def convergence_seconds(self) -> float:
+        """Estimated wall time to converge: simulated network time plus time spent computing."""
+        return self.simulated_network_seconds + self.cpu_seconds
+
+    def to_dict(self) -> dict:
+        cpu = self.cpu_seconds_per_round or [0]
+        return dict(fleet_size=self.fleet_size,
+                    parameters=self.parameters,
+                    converged=self.converged,
+                    rounds=self.rounds,
+                    known_nodes=self.known_nodes,
+                    requests=self.requests,
+                    failed_requests=self.failed_requests,
+                    bytes_sent=self.bytes_sent,
+                    bytes_received=self.bytes_received,
+                    simulated_network_seconds=round(self.simulated_network_seconds, 6),
+                    convergence_seconds=round(self.convergence_seconds, 6),
+                    cpu_seconds=round(self.cpu_seconds, 6),
+                    cpu_seconds_per_round_mean=round(statistics.mean(cpu), 6),
+                    cpu_seconds_per_round_max=round(max(cpu), 6))
+
+    def regressions(self, baseline: dict, cpu_tolerance: float = 0.5) -> List[str]:
+        """
+        Compares this report to a baseline report dict.  Deterministic fields must not get worse;
+        CPU time per round may grow by at most `cpu_tolerance` (as a fraction) before it counts.
+        """
+        current = self.to_dict()
+        problems = list()
+        if baseline['parameters'] != current['parameters'] or baseline['fleet_size'] != current['fleet_size']:
+            problems.append("Baseline was produced with different simulation parameters.")
+            return problems
+        if baseline['converged'] and not current['converged']:
+            problems.append(f"No longer converges within {current['rounds']} rounds.")
+        for field in ('rounds', 'requests', 'bytes_sent', 'bytes_received'):
+            if current[field] > baseline[field]:
+                problems.append(f"{field} went from {baseline[field]} to {current[field]}.")
+        allowed_cpu = baseline['cpu_seconds_per_round_mean'] * (1 + cpu_tolerance)
+        if current['cpu_seconds_per_round_mean'] > allowed_cpu:
+            problems.append(f"Mean CPU per round went from {baseline['cpu_seconds_per_round_mean']}s "
+                            f"to {current['cpu_seconds_per_round_mean']}s.")
+        return problems
+
+
+class FleetSimulation:
+    """
+    An in-process fleet of mock Ursulas, each of which knows a random subset (its "view")
+    of the fleet, and a fresh Learner which learns about them through a SimulatedFleetMiddleware.
+
+    Uses the same mocks as the large-fleet discovery tests, so key generation, certificates,
+    signatures and node verification are all stubbed out; what remains is the cost of the
+    learning loop itself.
+    """
+
+    def __init__(self,
+                 ursula_config,
+                 quantity: int,
+                 view_size: int = 100,
+                 latency: float = 0.05,
+                 latency_jitter: float = 0.02,
+                 loss: float = 0.0,
+                 churn: float = 0.0,
+                 seed: int = 0):
+        self.ursula_config = ursula_config
+        self.quantity = quantity
+        self.view_size = min(view_size, quantity)
+        self.network_conditions = dict(latency=latency, latency_jitter=latency_jitter, loss=loss, churn=churn)
+        self.seed = seed
+        self.fleet = dict()
+
+    @property
+    def parameters(self) -> dict:
+        return dict(view_size=self.view_size, seed=self.seed, **self.network_conditions)
+
+    def __enter__(self):
+        self.build()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.teardown()
+
+    def build(self) -> None:
+        with GlobalLoggerSettings.pause_all_logging_while():
+            with mock_secret_source():
+                NotAPublicKey.tick = _unlimited_good_serials()
+                with mock_cert_storage, mock_cert_loading, mock_rest_app_creation, mock_cert_generation, \
+                        mock_remember_node, mock_message_verification:
+                    ursulas = make_federated_ursulas(ursula_config=self.ursula_config,
+                                                     quantity=self.quantity,
+                                                     know_each_other=False)
+
+        # Sets aren't ordered, so sort for reproducibility.
+        ursulas = sorted(ursulas, key=lambda u: u.rest_interface.port)
+        self.fleet = {u.checksum_address: u for u in ursulas}
+
+        rng = random.Random(self.seed)
+        for ursula in ursulas:
+            view = rng.sample(ursulas, self.view_size)
+            ursula.known_nodes._nodes = {u.checksum_address: u for u in view if u is not ursula}
+            ursula.known_nodes.checksum = bytes(rng.getrandbits(8) for _ in range(32)).hex()
+
+    def teardown(self) -> None:
+        for ursula in self.fleet.values():
+            MOCK_KNOWN_URSULAS_CACHE.pop(ursula.rest_interface.port, None)
+        self.fleet = dict()
+
+    def _make_learner(self, middleware):
+        first_teacher = next(iter(self.fleet.values()))
+        config = AliceConfiguration(dev_mode=True,
+                                    domains={TEMPORARY_DOMAIN},
+                                    network_middleware=middleware,
+                                    federated_only=True,
+                                    abort_on_learning_error=True,
+                                    save_metadata=False,
+                                    reload_metadata=False)
+        with mock_cert_storage, mock_verify_node, mock_record_fleet_state, mock_message_verification, mock_keep_learning:
+            learner = config.produce(known_nodes=[first_teacher])
+        learner.done_seeding = True
+        return learner
+
+    def run(self, target_coverage: float = 0.95, max_rounds: int = 10000) -> FleetSimulationReport:
+        """
+        Learns from teachers until the learner knows `target_coverage` of the fleet, or gives up after `max_rounds`.
+        """
+        middleware = SimulatedFleetMiddleware(fleet=self.fleet, seed=self.seed, **self.network_conditions)
+        learner = self._make_learner(middleware)
+        report = FleetSimulationReport(fleet_size=len(self.fleet), parameters=self.parameters)
+        target = int(target_coverage * len(self.fleet))
+
+        # Teacher selection shuffles with the global generator, which recording a fleet state reseeds
+        # (by way of the fleet nickname), so reseed it every round to keep runs reproducible.
+        rng = random.Random(self.seed)
+        with GlobalLoggerSettings.pause_all_logging_while():
+            with mock_cert_storage, mock_cert_loading, mock_verify_node, mock_message_verification, \
+                    mock_metadata_validation, mock_stamp_call, mock_signature_bytes:
+                with mock_pubkey_from_bytes():
+                    for _round in range(max_rounds):
+                        random.seed(rng.random())
+                        middleware.next_round()
+                        known_before = len(learner.known_nodes)
+                        started = time.process_time()
+                        learner.learn_from_teacher_node()
+                        report.cpu_seconds_per_round.append(time.process_time() - started)
+                        report.nodes_learned_per_round.append(len(learner.known_nodes) - known_before)
+                        if len(learner.known_nodes) >= target:
+                            report.converged = True
+                            break
+
+        report.rounds = len(report.cpu_seconds_per_round)
+        report.known_nodes = len(learner.known_nodes)
+        report.requests = middleware.requests
+        report.failed_requests = middleware.failed_requests
+        report.bytes_sent = middleware.bytes_sent
+        report.bytes_received = middleware.bytes_received
+        report.simulated_network_seconds = middleware.simulated_network_time
+        return report
@@ -19,6 +19,7 @@ import random
 
 import requests
 import socket
+from threading import Event, Lock
 from bytestring_splitter import VariableLengthBytestring
 from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 from flask import Response
@@ -81,6 +82,7 @@ class _TestMiddlewareClient(NucypherMiddlewareClient):
     def invoke_method(self, method, url, *args, **kwargs):
         _cert_location = kwargs.pop("verify")  # TODO: Is this something that can be meaningfully tested?
         kwargs.pop("timeout", None)  # Just get rid of timeout; not needed for the test client.
+        kwargs.pop("stream", None)  # The test client's responses are always complete.
         response = super().invoke_method(method, url, *args, **kwargs)
         return response
 
@@ -140,6 +142,80 @@ class SluggishLargeFleetMiddleware(MockRestMiddlewareForLargeFleetTests):
         return result
 
 
+class SimulatedFleetMiddleware(MockRestMiddlewareForLargeFleetTests):
+    """
+    Serves node metadata from an in-process fleet over a simulated network with latency, loss and churn.
+
+    Network time is accounted for rather than slept, so that large fleets can be simulated quickly and
+    reproducibly: all randomness comes from a seeded generator.  Lost requests and requests to nodes which
+    are down cost a full timeout, as they would for a real learner.
+    """
+
+    def __init__(self,
+                 fleet: dict,
+                 latency: float = 0.05,
+                 latency_jitter: float = 0.02,
+                 loss: float = 0.0,
+                 churn: float = 0.0,
+                 timeout: float = NucypherMiddlewareClient.timeout,
+                 seed: int = 0,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fleet = fleet  # By checksum address
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.loss = loss
+        self.churn = churn
+        self.timeout = timeout
+        self.random = random.Random(seed)
+
+        self.nodes_that_are_down = set()
+        self.simulated_network_time = 0.0
+        self.requests = 0
+        self.failed_requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self._payloads = dict()
+
+    def next_round(self):
+        """Nodes which were down come back up, and a `churn` fraction of the fleet goes down."""
+        quantity = int(round(self.churn * len(self.fleet)))
+        self.nodes_that_are_down = set(self.random.sample(list(self.fleet), quantity))
+
+    def _payload(self, teacher):
+        # Fleet nodes don't learn during a simulation, so what they teach never changes.
+        try:
+            payload = self._payloads[teacher.checksum_address]
+        except KeyError:
+            known_nodes_bytestring = teacher.bytestring_of_known_nodes()
+            signature = teacher.stamp(known_nodes_bytestring)
+            payload = self._payloads[teacher.checksum_address] = bytes(signature) + known_nodes_bytestring
+        return payload
+
+    def get_nodes_via_rest(self,
+                           node,
+                           announce_nodes=None,
+                           nodes_i_need=None,
+                           fleet_checksum=None):
+        self.requests += 1
+        if announce_nodes:
+            self.bytes_sent += sum(len(bytes(VariableLengthBytestring(n))) for n in announce_nodes)
+
+        node.mature()  # As the real client does before contacting a node.
+        address = node.checksum_address
+        if address in self.nodes_that_are_down or self.random.random() < self.loss:
+            self.failed_requests += 1
+            self.simulated_network_time += self.timeout
+            raise requests.exceptions.ConnectTimeout(f"Simulated timeout contacting {address}")
+
+        self.simulated_network_time += max(self.random.gauss(self.latency, self.latency_jitter), 0)
+        payload = self._payload(self.fleet[address])
+        self.bytes_received += len(payload)
+        r = Response(payload)
+        r.content = r.data
+        return r
+
+
 class _MiddlewareClientWithConnectionProblems(_TestMiddlewareClient):
 
     def __init__(self, *args, **kwargs):
@@ -187,6 +263,42 @@ class NodeIsDownMiddleware(MockRestMiddleware):
         self.client.ports_that_are_down = set(MOCK_KNOWN_URSULAS_CACHE)
 
 
+class SluggishNodesMiddleware(NodeIsDownMiddleware):
+    """
+    Like NodeIsDownMiddleware, but nodes may also hang when they are proposed an arrangement or sent a kfrag,
+    until they time out or are released; requests to the others take a moment, so that concurrent ones overlap.
+    """
+
+    def __init__(self, hang_for: float = 1, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hang_for = hang_for
+        self.hanging_nodes = set()  # By checksum address
+        self.released = Event()
+        self.in_flight = 0
+        self.most_in_flight = 0
+        self._lock = Lock()
+
+    def _sluggishly(self, ursula, request, *args, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            if ursula.checksum_address in self.hanging_nodes:
+                self.released.wait(timeout=self.hang_for)
+                raise requests.exceptions.ReadTimeout(f"{ursula} didn't answer")
+            time.sleep(0.05)
+            return request(*args, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def propose_arrangement(self, arrangement):
+        return self._sluggishly(arrangement.ursula, super().propose_arrangement, arrangement)
+
+    def enact_policy(self, ursula, kfrag_id, payload):
+        return self._sluggishly(ursula, super().enact_policy, ursula, kfrag_id, payload)
+
+
 class EvilMiddleWare(MockRestMiddleware):
     """
     Middleware for assholes.